@@ -37,6 +37,12 @@ if templates_dir.exists():
     for template_file in templates_dir.glob('*.xml'):
         template_files.append((str(template_file), 'src/templates'))
 
+# Шаблони C# коду
+csharp_templates_dir = project_root / 'src' / 'core' / 'templates' / 'csharp'
+if csharp_templates_dir.exists():
+    for template_file in csharp_templates_dir.glob('*.tmpl'):
+        template_files.append((str(template_file), 'src/core/templates/csharp'))
+
 print(f"📋 Знайдено шаблонів XML: {len(template_files)}")
 
 # Збір ресурсів CustomTkinter
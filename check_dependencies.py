@@ -1,117 +1,273 @@
 #!/usr/bin/env python3
 """
 Скрипт для перевірки залежностей RimWorld Mod Builder
+
+Модулі, що перевіряються, ніколи не імпортуються: наявність визначається через
+importlib.util.find_spec, а версія - через importlib.metadata.
 """
 
 import sys
-import importlib.util
+import functools
+
+# Рядки статусу
+_OK = "✅ "
+_INSTALLED = "встановлено"
+_MISSING = "❌ НЕ ВСТАНОВЛЕНО"
+_ERROR = "❌ ПОМИЛКА: "
+_OPTIONAL_SUFFIX = " (опціональна)"
+
+# Секції залежностей: (заголовок, ((назва, модуль, опціональна), ...), стандартна бібліотека)
+_SECTIONS = (
+    ("\n📦 ОБОВ'ЯЗКОВІ ЗАЛЕЖНОСТІ:", (
+        ("customtkinter", "customtkinter", False),
+        ("Pillow", "PIL", False),
+        ("packaging", "packaging", False),
+    ), False),
+    ("\n🎯 РЕКОМЕНДОВАНІ ЗАЛЕЖНОСТІ:", (
+        ("lxml", "lxml", True),
+        ("colorama", "colorama", True),
+        ("pytest", "pytest", True),
+    ), False),
+    ("\n🔧 ОПЦІОНАЛЬНІ ЗАЛЕЖНОСТІ:", (
+        ("psd-tools", "psd_tools", True),
+        ("cairosvg", "cairosvg", True),
+        ("imageio", "imageio", True),
+        ("psutil", "psutil", True),
+        ("requests", "requests", True),
+    ), False),
+    # Системні модулі (стандартна бібліотека)
+    ("\n🐍 СТАНДАРТНА БІБЛІОТЕКА PYTHON:", (
+        ("tkinter", "tkinter", False),
+        ("xml.etree.ElementTree", "xml.etree.ElementTree", False),
+        ("json", "json", False),
+        ("os", "os", False),
+        ("sys", "sys", False),
+        ("pathlib", "pathlib", False),
+        ("threading", "threading", False),
+        ("subprocess", "subprocess", False),
+    ), True),
+)
+
+# Модулі стандартної бібліотеки, яких може не бути у збірці Python (дистрибутиви без python3-tk,
+# вбудовані збірки): їх наявність завжди перевіряється на диску, разом із C-розширенням
+_STDLIB_MAYBE_MISSING = {
+    "tkinter": ("tkinter", "_tkinter"),
+    "_tkinter": ("_tkinter",),
+}
+
+@functools.lru_cache(maxsize=None)
+def _spec(import_name):
+    """Кешований пошук специфікації модуля (обхід sys.path лише один раз)"""
+    import importlib.util
+    return importlib.util.find_spec(import_name)
 
-def check_dependency(name, import_name=None, optional=False):
-    """Перевірка однієї залежності"""
+def _installed_versions():
+    """Одноразовий перелік встановлених дистрибутивів: {нормалізована назва: версія}"""
+    import importlib.metadata
+    
+    versions = {}
+    for dist in importlib.metadata.distributions():
+        dist_name = dist.metadata["Name"]
+        if dist_name:
+            versions.setdefault(dist_name.lower().replace('-', '_'), dist.version)
+    return versions
+
+def _probe(name, import_name, stdlib=False, versions=None):
+    """Повертає версію встановленої залежності або None, якщо її немає"""
+    import importlib.metadata
+
+    top_level = import_name.partition('.')[0]
+    required_modules = _STDLIB_MAYBE_MISSING.get(top_level)
+    if stdlib and required_modules:
+        return _INSTALLED if all(_spec(module) is not None for module in required_modules) else None
+    
+    # Python 3.10+: наявність решти модулів стандартної бібліотеки перевіряємо без звернення до диска
+    stdlib_names = getattr(sys, 'stdlib_module_names', None)
+    if stdlib and stdlib_names is not None and top_level in stdlib_names:
+        return _INSTALLED
+    
+    if _spec(import_name) is None:
+        return None
+    
+    if stdlib:
+        return _INSTALLED
+    
+    # Версію беремо з метаданих дистрибутиву, щоб не виконувати код модуля
+    version = versions.get(name.lower().replace('-', '_')) if versions else None
+    if version is None:
+        try:
+            version = importlib.metadata.version(name)
+        except importlib.metadata.PackageNotFoundError:
+            version = _INSTALLED
+    return version
+
+def check_dependency(name, import_name=None, optional=False, stdlib=False, versions=None):
+    """Перевірка однієї залежності без імпорту самого модуля"""
     if import_name is None:
         import_name = name.replace('-', '_')
     
     try:
-        spec = importlib.util.find_spec(import_name)
-        if spec is None:
-            status = "❌ НЕ ВСТАНОВЛЕНО"
-            if optional:
-                status += " (опціональна)"
-            return False, status
-        
-        module = importlib.import_module(import_name)
-        version = getattr(module, '__version__', 'невідома версія')
-        status = f"✅ {version}"
-        return True, status
+        version = _probe(name, import_name, stdlib, versions)
+        if version is None:
+            return False, _MISSING + (_OPTIONAL_SUFFIX if optional else "")
+        return True, _OK + version
         
     except Exception as e:
-        status = f"❌ ПОМИЛКА: {e}"
-        if optional:
-            status += " (опціональна)"
-        return False, status
+        return False, _ERROR + str(e) + (_OPTIONAL_SUFFIX if optional else "")
 
-def main():
-    """Головна функція перевірки"""
-    print("🔍 Перевірка залежностей RimWorld Mod Builder")
-    print("=" * 50)
+def _safe_probe(name, import_name, stdlib, versions):
+    """_probe без винятків: помилка перевірки трактується як відсутність"""
+    try:
+        return _probe(name, import_name, stdlib, versions)
+    except Exception:
+        return None
+
+def report_json(versions):
+    """Машиночитний звіт: відсутні обов'язкові залежності та знайдені версії (рядок JSON)"""
+    import json
+    from concurrent.futures import ThreadPoolExecutor
+    
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [
+            (name, optional, is_stdlib,
+             executor.submit(_safe_probe, name, import_name, is_stdlib, versions))
+            for _, deps, is_stdlib in _SECTIONS
+            for name, import_name, optional in deps
+        ]
+    
+    result = {"required_missing": [], "versions": {}}
+    for name, optional, is_stdlib, future in futures:
+        version = future.result()
+        result["versions"][name] = version
+        if version is None and not optional and not is_stdlib:
+            result["required_missing"].append(name)
+    
+    return json.dumps(result, ensure_ascii=False) + "\n"
+
+def report_text(versions):
+    """Звіт для людини (рядок)"""
+    # Весь вивід накопичуємо і пишемо одним викликом наприкінці
+    out = []
+    out.append("🔍 Перевірка залежностей RimWorld Mod Builder")
+    out.append("=" * 50)
     
     # Python версія
-    print(f"🐍 Python: {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}")
+    out.append(f"🐍 Python: {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}")
     
-    # Обов'язкові залежності
-    print("\n📦 ОБОВ'ЯЗКОВІ ЗАЛЕЖНОСТІ:")
-    required_deps = [
-        ("customtkinter", "customtkinter"),
-        ("Pillow", "PIL"),
-        ("packaging", "packaging"),
-    ]
+    # Перевірки незалежні й обмежені файловою системою, тож запускаємо їх паралельно
+    from concurrent.futures import ThreadPoolExecutor
     
-    all_required_ok = True
-    for name, import_name in required_deps:
-        ok, status = check_dependency(name, import_name)
-        print(f"  {name}: {status}")
-        if not ok:
-            all_required_ok = False
-    
-    # Рекомендовані залежності
-    print("\n🎯 РЕКОМЕНДОВАНІ ЗАЛЕЖНОСТІ:")
-    recommended_deps = [
-        ("lxml", "lxml"),
-        ("colorama", "colorama"),
-        ("pytest", "pytest"),
-    ]
-    
-    for name, import_name in recommended_deps:
-        ok, status = check_dependency(name, import_name, optional=True)
-        print(f"  {name}: {status}")
-    
-    # Опціональні залежності
-    print("\n🔧 ОПЦІОНАЛЬНІ ЗАЛЕЖНОСТІ:")
-    optional_deps = [
-        ("psd-tools", "psd_tools"),
-        ("cairosvg", "cairosvg"),
-        ("imageio", "imageio"),
-        ("psutil", "psutil"),
-        ("requests", "requests"),
-    ]
-    
-    for name, import_name in optional_deps:
-        ok, status = check_dependency(name, import_name, optional=True)
-        print(f"  {name}: {status}")
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [
+            (header, is_stdlib, [
+                (name, optional,
+                 executor.submit(check_dependency, name, import_name, optional, is_stdlib, versions))
+                for name, import_name, optional in deps
+            ])
+            for header, deps, is_stdlib in _SECTIONS
+        ]
     
-    # Системні модулі (стандартна бібліотека)
-    print("\n🐍 СТАНДАРТНА БІБЛІОТЕКА PYTHON:")
-    stdlib_modules = [
-        "tkinter",
-        "xml.etree.ElementTree",
-        "json",
-        "os",
-        "sys",
-        "pathlib",
-        "threading",
-        "subprocess",
-    ]
-    
-    for module_name in stdlib_modules:
-        ok, status = check_dependency(module_name, module_name)
-        print(f"  {module_name}: {status}")
+    # Виводимо результати в початковому порядку
+    all_required_ok = True
+    for header, is_stdlib, entries in futures:
+        out.append(header)
+        for name, optional, future in entries:
+            ok, status = future.result()
+            out.append(f"  {name}: {status}")
+            if not ok and not optional and not is_stdlib:
+                all_required_ok = False
     
     # Підсумок
-    print("\n" + "=" * 50)
+    out.append("\n" + "=" * 50)
     if all_required_ok:
-        print("🎉 ВСІ ОБОВ'ЯЗКОВІ ЗАЛЕЖНОСТІ ВСТАНОВЛЕНІ!")
-        print("✅ RimWorld Mod Builder готовий до запуску")
+        out.append("🎉 ВСІ ОБОВ'ЯЗКОВІ ЗАЛЕЖНОСТІ ВСТАНОВЛЕНІ!")
+        out.append("✅ RimWorld Mod Builder готовий до запуску")
     else:
-        print("⚠️ ДЕЯКІ ОБОВ'ЯЗКОВІ ЗАЛЕЖНОСТІ ВІДСУТНІ!")
-        print("❌ Встановіть відсутні залежності перед запуском")
-        print("\n💡 Команда для встановлення:")
-        print("pip install -r requirements.txt")
-    
-    print("\n📚 Додаткова інформація:")
-    print("  - Опціональні залежності покращують функціональність")
-    print("  - psd-tools потрібен для підтримки PSD файлів")
-    print("  - lxml покращує XML валідацію")
-    print("  - Всі інші залежності додають додаткові можливості")
+        out.append("⚠️ ДЕЯКІ ОБОВ'ЯЗКОВІ ЗАЛЕЖНОСТІ ВІДСУТНІ!")
+        out.append("❌ Встановіть відсутні залежності перед запуском")
+        out.append("\n💡 Команда для встановлення:")
+        out.append("pip install -r requirements.txt")
+    
+    out.append("\n📚 Додаткова інформація:")
+    out.append("  - Опціональні залежності покращують функціональність")
+    out.append("  - psd-tools потрібен для підтримки PSD файлів")
+    out.append("  - lxml покращує XML валідацію")
+    out.append("  - Всі інші залежності додають додаткові можливості")
+    
+    return "\n".join(out) + "\n"
+
+def _cache_file(mode):
+    """Шлях до файлу кешу результатів перевірки (окремий для кожного формату)"""
+    from pathlib import Path
+    return Path.home() / ".cache" / "rwmodbuilder" / f"deps-{mode}.json"
+
+def _cache_key(mode):
+    """Ключ кешу: інтерпретатор + час останньої зміни каталогів site-packages"""
+    import hashlib
+    import os
+    import site
+    
+    site_dirs = list(getattr(site, 'getsitepackages', lambda: [])())
+    user_site = getattr(site, 'getusersitepackages', lambda: None)()
+    if user_site:
+        site_dirs.append(user_site)
+    
+    mtimes = [0]
+    for path in site_dirs:
+        try:
+            mtimes.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            pass
+    
+    # Список залежностей теж входить у ключ, щоб кеш не пережив його зміну
+    raw = f"{mode}:{sys.executable}:{max(mtimes)}:{_SECTIONS!r}"
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+def _read_cache(mode, key):
+    """Повертає збережений звіт, якщо ключ кешу збігається"""
+    try:
+        with open(_cache_file(mode), 'r', encoding='utf-8') as f:
+            if f.readline().rstrip("\n") == key:
+                return f.read()
+    except OSError:
+        pass
+    return None
+
+def _write_cache(mode, key, report):
+    """Атомарний запис звіту в кеш"""
+    import os
+    
+    cache_file = _cache_file(mode)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(cache_file.name + ".tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write(key + "\n" + report)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+def main():
+    """Головна функція перевірки"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Перевірка залежностей RimWorld Mod Builder")
+    parser.add_argument('--json', action='store_true',
+                        help="вивести результат у форматі JSON без форматування для людини")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="ігнорувати збережений результат попередньої перевірки")
+    args = parser.parse_args()
+    
+    mode = "json" if args.json else "text"
+    key = _cache_key(mode)
+    
+    report = None if args.no_cache else _read_cache(mode, key)
+    if report is None:
+        versions = _installed_versions()
+        report = report_json(versions) if args.json else report_text(versions)
+        _write_cache(mode, key, report)
+    
+    sys.stdout.write(report)
 
 if __name__ == "__main__":
     main()
@@ -18,7 +18,166 @@ ctk.set_default_color_theme("blue")  # Синя колірна схема
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 import re
+import functools
 import tkinter as tk
+from bisect import bisect_right
+
+
+# Патерни підсвічування XML (патерн, тег); порядок визначає пріоритет у спільному регулярному виразі
+_XML_PATTERNS = (
+    # XML декларація
+    (r'<\?xml[^?]*(?:\?(?!>)[^?]*)*\?>', "xml_declaration"),
+    # XML коментарі
+    (r'<!--(?:[^-]|-(?!->))*-->', "xml_comment"),
+    # XML теги (включаючи закриваючі)
+    (r'</?[a-zA-Z_][a-zA-Z0-9_.-]*', "xml_tag"),
+    # Спеціальні символи тегів
+    (r'[<>]', "xml_special"),
+    # XML атрибути
+    (r'\b[a-zA-Z_][a-zA-Z0-9_.-]*(?=\s*=)', "xml_attribute"),
+    # Значення атрибутів
+    (r'"[^"]*"|\'[^\']*\'', "xml_value"),
+    # Числа
+    (r'\b\d+\.?\d*\b', "xml_number"),
+)
+
+_XML_TAGS = tuple(tag for _, tag in _XML_PATTERNS)
+
+# Усі патерни в одній альтернації (як у re.Scanner) - текст сканується за один прохід.
+# Патерни не містять власних груп, тож номер групи збігу (lastindex) однозначно визначає тег.
+# Декларація та коментарі записані без лінивих квантифікаторів, тож re.DOTALL не потрібен
+_XML_COMBINED = re.compile('|'.join(f'({pattern})' for pattern, _ in _XML_PATTERNS))
+_XML_GROUP_TAGS = (None,) + _XML_TAGS
+
+
+# Ліниві імпорти: модуль завантажується при першому використанні, повторні виклики беруть його з кешу
+@functools.lru_cache(maxsize=None)
+def _element_tree():
+    import xml.etree.ElementTree as ET
+    return ET
+
+
+@functools.lru_cache(maxsize=None)
+def _zipfile():
+    import zipfile
+    return zipfile
+
+
+@functools.lru_cache(maxsize=None)
+def _csharp_manager_cls():
+    from src.core.csharp_manager import CSharpManager
+    return CSharpManager
+
+
+@functools.lru_cache(maxsize=None)
+def _xml_validator_cls():
+    from src.utils.xml_validator_simple import SimpleXMLValidator
+    return SimpleXMLValidator
+
+
+@functools.lru_cache(maxsize=None)
+def _dll_compiler_widget_cls():
+    from src.ui.dll_compiler_widget import DLLCompilerWidget
+    return DLLCompilerWidget
+
+
+# Спільні шрифти: (розмір, товщина, сімейство) -> CTkFont
+_FONT_CACHE = {}
+
+
+def _font(size, weight="normal", family=None):
+    """Спільний екземпляр CTkFont; викликається лише після створення кореневого вікна"""
+    key = (size, weight, family)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = _FONT_CACHE[key] = ctk.CTkFont(size=size, weight=weight, family=family)
+    return font
+
+
+def _center_dialog(dialog, parent, width, height):
+    """Розмір і позиція діалогу одним викликом geometry() відносно батьківського вікна"""
+    dialog.geometry(f"{width}x{height}+{parent.winfo_x() + 50}+{parent.winfo_y() + 50}")
+    dialog.transient(parent)
+
+
+def _present_dialog(dialog):
+    """Показ побудованого прихованого діалогу за один прохід компоновки і захоплення вводу"""
+    dialog.update_idletasks()
+    dialog.deiconify()
+    dialog.grab_set()
+
+
+# Папка XML шаблонів поруч із main.py (не залежить від поточної робочої папки)
+_TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src", "templates")
+
+# Кеш менеджера шаблонів: (папка, підпис файлів шаблонів) -> (TemplateManager, список шаблонів)
+_TEMPLATE_CACHE = {}
+
+
+def _templates_signature(templates_dir):
+    """Назви, розміри й mtime XML шаблонів: редагування файлу на місці не змінює mtime папки"""
+    with os.scandir(templates_dir) as entries:
+        return tuple(sorted(
+            (entry.name, entry.stat().st_size, entry.stat().st_mtime_ns)
+            for entry in entries
+            if entry.name.endswith(".xml") and entry.is_file()
+        ))
+
+
+def _cached_template_manager(templates_dir=_TEMPLATES_DIR):
+    """Менеджер шаблонів і їх список; шаблони перечитуються лише після зміни, додавання чи видалення файлу"""
+    try:
+        key = (templates_dir, _templates_signature(templates_dir))
+    except OSError:
+        key = None
+
+    cached = _TEMPLATE_CACHE.get(key)
+    if cached is None:
+        from src.core.template_manager import TemplateManager
+        manager = TemplateManager(templates_dir)
+        cached = (manager, manager.get_template_list())
+
+        # TemplateManager створює папку, якщо її не було, тож ключ обчислюємо після нього
+        _TEMPLATE_CACHE.clear()
+        _TEMPLATE_CACHE[(templates_dir, _templates_signature(templates_dir))] = cached
+    return cached
+
+
+# Теги About.xml, що показуються в інформації про проєкт
+_ABOUT_INFO_TAGS = frozenset(("name", "author"))
+# Теги About.xml, що потрапляють у README.txt при експорті
+_README_INFO_TAGS = frozenset(("name", "author", "description"))
+
+# Запасний варіант для About.xml, який не парситься як XML (наприклад, неекранований &)
+_ABOUT_NAME_RE = re.compile(r'<name>(.*?)</name>', re.DOTALL)
+_ABOUT_AUTHOR_RE = re.compile(r'<author>(.*?)</author>', re.DOTALL)
+
+
+def _xml_fromstring(content):
+    """Парсинг XML рядка: lxml (C-розширення), якщо встановлено, інакше ElementTree"""
+    try:
+        from lxml import etree
+    except ImportError:
+        return _element_tree().fromstring(content)
+    return etree.fromstring(content.encode('utf-8'))
+
+
+def _validate_xml_content(content):
+    """Валідація XML у фоновому потоці: ("report", текст звіту) або ("syntax", помилка чи None)"""
+    try:
+        SimpleXMLValidator = _xml_validator_cls()
+    except ImportError:
+        # Fallback до простої валідації
+        try:
+            _xml_fromstring(content)
+            return "syntax", None
+        except SyntaxError as e:  # ET.ParseError та lxml XMLSyntaxError
+            return "syntax", str(e)
+
+    validator = SimpleXMLValidator()
+    validator.validate_content(content)
+    report = validator.get_validation_report()
+    return "report", validator.format_report(report)
 
 
 class XMLSyntaxHighlighter:
@@ -26,6 +185,9 @@ class XMLSyntaxHighlighter:
 
     def __init__(self, text_widget):
         self.text_widget = text_widget
+        # Рядки (перший, останній) з актуальним підсвічуванням та кількість рядків на той момент
+        self._covered = None
+        self._covered_line_count = 0
         self.setup_tags()
 
     def setup_tags(self):
@@ -51,64 +213,178 @@ class XMLSyntaxHighlighter:
         # Спеціальні символи
         self.text_widget.tag_configure("xml_special", foreground="#d4d4d4")
 
-    def highlight_all(self):
-        """Підсвічування всього тексту"""
-        # Очищення попередніх тегів
-        for tag in ["xml_tag", "xml_attribute", "xml_value", "xml_comment", "xml_number", "xml_declaration", "xml_special"]:
-            self.text_widget.tag_remove(tag, "1.0", tk.END)
-
-        # content = self.text_widget.get("1.0", tk.END)  # Не використовується
-
-        # XML декларація
-        self._highlight_pattern(r'<\?xml.*?\?>', "xml_declaration")
-
-        # XML коментарі
-        self._highlight_pattern(r'<!--.*?-->', "xml_comment")
+    def reset(self):
+        """Скидання інформації про підсвічені рядки (після заміни всього тексту)"""
+        self._covered = None
 
-        # XML теги (включаючи закриваючі)
-        self._highlight_pattern(r'</?[a-zA-Z_][a-zA-Z0-9_.-]*', "xml_tag")
+    def _line_count(self):
+        """Кількість рядків у віджеті"""
+        return int(self.text_widget.index("end-1c").split('.')[0])
 
-        # Спеціальні символи тегів
-        self._highlight_pattern(r'[<>]', "xml_special")
-
-        # XML атрибути
-        self._highlight_pattern(r'\b[a-zA-Z_][a-zA-Z0-9_.-]*(?=\s*=)', "xml_attribute")
-
-        # Значення атрибутів
-        self._highlight_pattern(r'"[^"]*"', "xml_value")
-        self._highlight_pattern(r"'[^']*'", "xml_value")
-
-        # Числа
-        self._highlight_pattern(r'\b\d+\.?\d*\b', "xml_number")
-
-    def _highlight_pattern(self, pattern, tag):
-        """Підсвічування за патерном"""
-        content = self.text_widget.get("1.0", tk.END)
-
-        for match in re.finditer(pattern, content, re.DOTALL):
-            start_pos = self._get_position_from_index(match.start())
-            end_pos = self._get_position_from_index(match.end())
-            self.text_widget.tag_add(tag, start_pos, end_pos)
+    def highlight_all(self):
+        """Підсвічування всього тексту"""
+        line_count = self._line_count()
+        self.highlight_range(1, line_count)
+        self._covered = (1, line_count)
+        self._covered_line_count = line_count
+
+    def highlight_visible(self, margin=20):
+        """Підсвічування лише видимої частини тексту (з невеликим запасом)"""
+        widget = self.text_widget
+        line_count = self._line_count()
+        first_line = max(1, int(widget.index("@0,0").split('.')[0]) - margin)
+        last_line = min(line_count, int(widget.index(f"@0,{widget.winfo_height()}").split('.')[0]) + margin)
+
+        # Рядки вже підсвічені, якщо відтоді кількість рядків не змінилась (теги рухаються разом з текстом,
+        # а змінені рядки підсвічуються окремо) - тоді обробляємо лише нововідкриту частину
+        # highlight_range може розширити діапазон до меж коментаря - до покритих зараховуємо фактичні рядки
+        covered = self._covered if line_count == self._covered_line_count else None
+        if covered is None or last_line < covered[0] - 1 or first_line > covered[1] + 1:
+            self._covered = self.highlight_range(first_line, last_line)
+        else:
+            covered_first, covered_last = covered
+            if first_line < covered_first:
+                covered_first = self.highlight_range(first_line, covered_first - 1)[0]
+            if last_line > covered_last:
+                covered_last = self.highlight_range(covered_last + 1, last_line)[1]
+            self._covered = (covered_first, covered_last)
+        self._covered_line_count = line_count
+
+    def highlight_range(self, first_line, last_line):
+        """Підсвічування рядків з first_line по last_line включно; повертає фактично оброблені рядки"""
+        last_line = min(last_line, self._line_count())
+        if last_line < first_line:
+            return first_line, last_line
+        first_line, last_line = self._extend_to_comments(first_line, last_line)
+
+        start_index = f"{first_line}.0"
+        end_index = f"{last_line}.end"
+
+        # Очищення попередніх тегів лише в цьому діапазоні
+        for tag in _XML_TAGS:
+            self.text_widget.tag_remove(tag, start_index, end_index)
+
+        # Текст діапазону отримуємо один раз на весь прохід
+        content = self.text_widget.get(start_index, end_index)
+        line_starts = self._line_starts(content)
+        line_offset = first_line - 1
+
+        # Діапазони збираємо по тегах і додаємо одним викликом tag_add на тег
+        ranges = {tag: [] for tag in _XML_TAGS}
+        position = self._get_position_from_index
+        group_tags = _XML_GROUP_TAGS
+        for match in _XML_COMBINED.finditer(content):
+            ranges[group_tags[match.lastindex]] += (
+                position(line_starts, match.start(), line_offset),
+                position(line_starts, match.end(), line_offset),
+            )
 
-    def _get_position_from_index(self, index):
+        for tag, indices in ranges.items():
+            if indices:
+                self.text_widget.tag_add(tag, *indices)
+        return first_line, last_line
+
+    def _open_comment_start(self, index):
+        """Початок коментаря, відкритого в позиції index (None, якщо позиція поза коментарем)"""
+        widget = self.text_widget
+        comment_start = widget.search("<!--", index, stopindex="1.0", backwards=True)
+        if comment_start and not widget.search("-->", f"{comment_start}+4c", stopindex=index):
+            return comment_start
+        return None
+
+    def _extend_to_comments(self, first_line, last_line):
+        """Розширення діапазону до меж багаторядкових коментарів.
+
+        Коментар може починатися до first_line або закінчуватися після last_line, тож діапазон
+        розширюється як за поточним текстом (відкритий <!-- і його -->), так і за старим тегом
+        xml_comment - інакше після додавання чи видалення <!-- / --> наступні рядки лишаються
+        підсвіченими по-старому
+        """
+        widget = self.text_widget
+        line_of = self._line_number
+        start_index = f"{first_line}.0"
+        end_index = f"{last_line}.end"
+
+        # Коментар, що почався раніше і ще не закритий на початку діапазону
+        comment_start = self._open_comment_start(start_index)
+        if comment_start:
+            first_line = min(first_line, line_of(comment_start))
+        # Старий тег, що доходить до початку діапазону (через вставку тег може бути розірваний)
+        previous = widget.tag_prevrange("xml_comment", start_index)
+        if previous and widget.compare(previous[1], ">=", start_index):
+            first_line = min(first_line, line_of(previous[0]))
+
+        # Коментар, що лишається відкритим у кінці діапазону, - до його -->
+        if self._open_comment_start(end_index):
+            comment_end = widget.search("-->", end_index, stopindex="end")
+            if comment_end:
+                last_line = max(last_line, line_of(comment_end))
+        previous = widget.tag_prevrange("xml_comment", end_index)
+        if previous and widget.compare(previous[1], ">", end_index):
+            last_line = max(last_line, line_of(previous[1]))
+        following = widget.tag_nextrange("xml_comment", end_index, f"{end_index}+1c")
+        if following:
+            last_line = max(last_line, line_of(following[1]))
+
+        return first_line, last_line
+
+    @staticmethod
+    def _line_number(index):
+        """Номер рядка з індексу tkinter"""
+        return int(str(index).split('.')[0])
+
+    @staticmethod
+    def _line_starts(content):
+        """Зміщення початку кожного рядка в тексті"""
+        line_starts = [0]
+        find = content.find
+        pos = find('\n')
+        while pos != -1:
+            line_starts.append(pos + 1)
+            pos = find('\n', pos + 1)
+        return line_starts
+
+    @staticmethod
+    def _get_position_from_index(line_starts, index, line_offset=0):
         """Конвертація індексу в позицію tkinter"""
-        content = self.text_widget.get("1.0", tk.END)
-        lines = content[:index].split('\n')
-        line = len(lines)
-        column = len(lines[-1]) if lines else 0
-        return f"{line}.{column}"
+        line = bisect_right(line_starts, index)
+        return f"{line + line_offset}.{index - line_starts[line - 1]}"
 
 
 class RimWorldModBuilder:
+    # Файли, більші за цей розмір, вставляються в редактор частинами
+    LARGE_FILE_SIZE = 256 * 1024
+    INSERT_CHUNK_SIZE = 64 * 1024
+
+    # Спільні параметри кнопок у списку файлів
+    FILE_BUTTON_KWARGS = {
+        "anchor": "w",
+        "fg_color": "transparent",
+        "text_color": ("gray10", "gray90"),
+        "hover_color": ("gray80", "gray20"),
+    }
+
     def __init__(self):
         self.root = ctk.CTk()
         self.root.title("RimWorld Mod Builder v2.0")
         self.root.geometry("1200x800")
+
+        # Шрифти беруться зі спільного кешу (CTkFont потребує вже створеного кореневого вікна)
+        self.header_font = _font(16, "bold")
+        self.subheader_font = _font(14, "bold")
+        self.label_font = _font(14)
         
         # Змінні стану
         self.current_project_path = None
         self.current_file_path = None
         self.unsaved_changes = False
+        self.expanded_folders = set()
+        self.file_widgets = {}  # Path -> кнопка у списку файлів
+        self.file_order = []
+        self._validation_executor = None
+        # Діалоги, що приховуються при закритті і показуються повторно без перебудови
+        self.new_project_dialog = None
+        self.template_dialog = None
         
         self.setup_ui()
 
@@ -187,7 +463,7 @@ class RimWorldModBuilder:
         self.file_label = ctk.CTkLabel(
             self.file_frame, 
             text="Файли проєкту",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self.header_font
         )
         self.file_label.pack(pady=10)
         
@@ -208,7 +484,7 @@ class RimWorldModBuilder:
         self.file_name_label = ctk.CTkLabel(
             self.editor_header,
             text="Виберіть файл для редагування",
-            font=ctk.CTkFont(size=14)
+            font=self.label_font
         )
         self.file_name_label.pack(side="left", padx=10, pady=10)
         
@@ -235,7 +511,8 @@ class RimWorldModBuilder:
 
         # CustomTkinter повзунки (такі ж як у "Файли проєкту")
         v_scrollbar = ctk.CTkScrollbar(text_container, command=self.text_editor.yview)
-        self.text_editor.configure(yscrollcommand=v_scrollbar.set)
+        self.editor_v_scrollbar = v_scrollbar
+        self.text_editor.configure(yscrollcommand=self.on_editor_yscroll)
 
         h_scrollbar = ctk.CTkScrollbar(text_container, command=self.text_editor.xview, orientation="horizontal")
         self.text_editor.configure(xscrollcommand=h_scrollbar.set)
@@ -253,6 +530,9 @@ class RimWorldModBuilder:
 
         # Ініціалізація підсвічування синтаксису
         self.syntax_highlighter = None
+        self._highlight_after_id = None
+        self._highlight_viewport = False
+        self._dirty_lines = None
         self.setup_syntax_highlighting()
 
     def setup_syntax_highlighting(self):
@@ -261,13 +541,59 @@ class RimWorldModBuilder:
 
         # Додаємо обробники для підсвічування
         self.text_editor.bind("<KeyRelease>", self.on_text_change_highlight, add="+")
+        self.text_editor.bind("<Configure>", self.on_editor_viewport_change, add="+")
+
+    def is_highlighting_active(self):
+        """Чи потрібно підсвічувати поточний файл"""
+        return bool(self.syntax_highlighter and self.current_file_path and self.current_file_path.suffix == '.xml')
 
     def on_text_change_highlight(self, event=None):
         """Підсвічування при зміні тексту"""
         _ = event  # Позначаємо що параметр використовується
-        if self.syntax_highlighter and self.current_file_path and self.current_file_path.suffix == '.xml':
-            # Підсвічування з затримкою для продуктивності
-            self.root.after(100, self.syntax_highlighter.highlight_all)
+        if self.is_highlighting_active():
+            self._mark_dirty_line()
+            self.schedule_highlight()
+
+    def on_editor_yscroll(self, first, last):
+        """Прокрутка редактора: оновлюємо повзунок і підсвічуємо нову видиму область"""
+        self.editor_v_scrollbar.set(first, last)
+        self.on_editor_viewport_change()
+
+    def on_editor_viewport_change(self, event=None):
+        """Зміна видимої області редактора (прокрутка, зміна розміру)"""
+        _ = event  # Позначаємо що параметр використовується
+        if self.is_highlighting_active():
+            self.schedule_highlight(viewport=True)
+
+    def _mark_dirty_line(self):
+        """Розширення діапазону змінених рядків рядком курсора"""
+        line = int(self.text_editor.index("insert").split('.')[0])
+        if self._dirty_lines is None:
+            self._dirty_lines = (line, line)
+        else:
+            first, last = self._dirty_lines
+            self._dirty_lines = (min(first, line), max(last, line))
+
+    def schedule_highlight(self, viewport=False):
+        """Відкладене підсвічування; серія подій дає один прохід"""
+        if viewport:
+            self._highlight_viewport = True
+        if self._highlight_after_id:
+            self.root.after_cancel(self._highlight_after_id)
+        self._highlight_after_id = self.root.after(150, self._run_highlight)
+
+    def _run_highlight(self):
+        """Виконання відкладеного підсвічування: лише змінені рядки та видима область"""
+        self._highlight_after_id = None
+        dirty_lines, self._dirty_lines = self._dirty_lines, None
+        viewport, self._highlight_viewport = self._highlight_viewport, False
+
+        if not self.syntax_highlighter:
+            return
+        if viewport:
+            self.syntax_highlighter.highlight_visible()
+        if dirty_lines:
+            self.syntax_highlighter.highlight_range(*dirty_lines)
 
     def setup_tools_panel(self):
         """Налаштування панелі інструментів"""
@@ -279,7 +605,7 @@ class RimWorldModBuilder:
         self.tools_label = ctk.CTkLabel(
             self.tools_frame,
             text="Інструменти",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self.header_font
         )
         self.tools_label.pack(pady=10)
         
@@ -351,7 +677,7 @@ class RimWorldModBuilder:
         self.info_label = ctk.CTkLabel(
             self.info_frame,
             text="Інформація про проєкт",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self.subheader_font
         )
         self.info_label.pack(pady=5)
         
@@ -383,11 +709,11 @@ class RimWorldModBuilder:
             
     def new_project(self):
         """Створення нового проєкту"""
-        dialog = NewProjectDialog(self.root)
-        self.root.wait_window(dialog.dialog)
-        
-        if dialog.result:
-            self.create_project_structure(dialog.result)
+        # Діалог сам викличе create_project_structure після підтвердження
+        if self.new_project_dialog is None or not self.new_project_dialog.dialog.winfo_exists():
+            self.new_project_dialog = NewProjectDialog(self.root, on_ok=self.create_project_structure)
+        else:
+            self.new_project_dialog.show(on_ok=self.create_project_structure)
             
     def create_project_structure(self, project_data):
         """Створення структури проєкту"""
@@ -396,31 +722,30 @@ class RimWorldModBuilder:
             project_path.mkdir(parents=True, exist_ok=True)
             
             # Створення папок
-            (project_path / "About").mkdir(exist_ok=True)
-            (project_path / "Defs").mkdir(exist_ok=True)
-            (project_path / "Textures").mkdir(exist_ok=True)
-            (project_path / "Assemblies").mkdir(exist_ok=True)
-            (project_path / "Source").mkdir(exist_ok=True)
+            for folder in ("About", "Defs", "Textures", "Assemblies", "Source"):
+                (project_path / folder).mkdir(exist_ok=True)
             
-            # Створення About.xml
+            # Створення About.xml (поля екрануються, щоб <, & тощо в назві та описі не ламали XML)
+            from xml.sax.saxutils import escape
+            name = escape(project_data['name'])
+            author = escape(project_data['author'])
             about_content = f"""<?xml version="1.0" encoding="utf-8"?>
 <ModMetaData>
-    <name>{project_data['name']}</name>
-    <author>{project_data['author']}</author>
-    <packageId>{project_data['author'].lower()}.{project_data['name'].lower()}</packageId>
-    <description>{project_data['description']}</description>
+    <name>{name}</name>
+    <author>{author}</author>
+    <packageId>{author.lower()}.{name.lower()}</packageId>
+    <description>{escape(project_data['description'])}</description>
     <supportedVersions>
         <li>1.5</li>
     </supportedVersions>
 </ModMetaData>"""
             
             about_file = project_path / "About" / "About.xml"
-            about_file.write_text(about_content, encoding='utf-8')
+            about_file.write_bytes(about_content.encode('utf-8'))
 
             # Створення C# структури
             try:
-                from src.core.csharp_manager import CSharpManager
-                csharp_manager = CSharpManager(project_path)
+                csharp_manager = _csharp_manager_cls()(project_path)
                 csharp_manager.create_csharp_structure(project_data['name'], project_data['author'])
             except Exception as e:
                 print(f"Попередження: Не вдалося створити C# структуру: {e}")
@@ -446,43 +771,69 @@ class RimWorldModBuilder:
         """Завантаження файлів проєкту"""
         if not self.current_project_path:
             return
-            
-        # Очищення списку файлів
-        for widget in self.file_list_frame.winfo_children():
-            widget.destroy()
-            
-        # Додавання файлів
-        self.add_files_to_list(self.current_project_path, 0)
-        
-    def add_files_to_list(self, path, level):
-        """Рекурсивне додавання файлів до списку"""
+
+        rows = []
+        self.add_files_to_list(self.current_project_path, 0, rows)
+
+        # Видаляємо лише кнопки зниклих файлів
+        wanted = {path for path, _, _ in rows}
+        for path in [p for p in self.file_widgets if p not in wanted]:
+            self.file_widgets.pop(path).destroy()
+
+        # Створюємо кнопки лише для нових файлів, решту перевикористовуємо
+        for path, text, is_dir in rows:
+            if is_dir:
+                command = lambda p=path: self.toggle_folder(p)
+            else:
+                command = lambda p=path: self.open_file(p)
+
+            button = self.file_widgets.get(path)
+            if button is None:
+                self.file_widgets[path] = ctk.CTkButton(
+                    self.file_list_frame,
+                    text=text,
+                    command=command,
+                    **self.FILE_BUTTON_KWARGS
+                )
+            elif button.cget("text") != text:
+                button.configure(text=text, command=command)
+
+        # Перепаковуємо лише якщо змінився порядок рядків
+        order = [path for path, _, _ in rows]
+        if order != self.file_order:
+            for path in order:
+                self.file_widgets[path].pack_forget()
+            for path in order:
+                self.file_widgets[path].pack(fill="x", pady=1)
+            self.file_order = order
+
+    def add_files_to_list(self, path, level, rows):
+        """Додавання вмісту папки до списку рядків (вкладені папки - лише розгорнуті)"""
         try:
-            for item in sorted(path.iterdir()):
-                indent = "  " * level
-                if item.is_dir():
-                    folder_btn = ctk.CTkButton(
-                        self.file_list_frame,
-                        text=f"{indent}📁 {item.name}",
-                        anchor="w",
-                        fg_color="transparent",
-                        text_color=("gray10", "gray90"),
-                        hover_color=("gray80", "gray20")
-                    )
-                    folder_btn.pack(fill="x", pady=1)
-                    self.add_files_to_list(item, level + 1)
-                else:
-                    file_btn = ctk.CTkButton(
-                        self.file_list_frame,
-                        text=f"{indent}📄 {item.name}",
-                        anchor="w",
-                        fg_color="transparent",
-                        text_color=("gray10", "gray90"),
-                        hover_color=("gray80", "gray20"),
-                        command=lambda p=item: self.open_file(p)
-                    )
-                    file_btn.pack(fill="x", pady=1)
+            with os.scandir(path) as entries:
+                items = sorted(entries, key=lambda e: (not e.is_dir(), e.name.lower()))
         except PermissionError:
-            pass
+            return
+
+        indent = "  " * level
+        for entry in items:
+            item = Path(entry.path)
+            if entry.is_dir():
+                expanded = item in self.expanded_folders
+                rows.append((item, f"{indent}{'📂' if expanded else '📁'} {entry.name}", True))
+                # Вміст папки додається лише після розгортання
+                if expanded:
+                    self.add_files_to_list(item, level + 1, rows)
+            else:
+                rows.append((item, f"{indent}📄 {entry.name}", False))
+
+    def toggle_folder(self, folder_path):
+        """Розгортання/згортання папки у списку файлів"""
+        if folder_path in self.expanded_folders:
+            self.expanded_folders.discard(folder_path)
+        else:
+            self.expanded_folders.add(folder_path)
+        self.load_project_files()
             
     def open_file(self, file_path):
         """Відкриття файлу в редакторі"""
@@ -491,7 +842,10 @@ class RimWorldModBuilder:
                 content = f.read()
                 
             self.text_editor.delete("1.0", "end")
-            self.text_editor.insert("1.0", content)
+            if len(content) > self.LARGE_FILE_SIZE:
+                self.insert_text_chunked(content)
+            else:
+                self.text_editor.insert("1.0", content)
             self.current_file_path = file_path
             self.file_name_label.configure(text=f"📄 {file_path.name}")
             self.unsaved_changes = False
@@ -499,11 +853,26 @@ class RimWorldModBuilder:
 
             # Підсвічування синтаксису для XML файлів
             if self.syntax_highlighter and file_path.suffix == '.xml':
-                self.syntax_highlighter.highlight_all()
+                self.syntax_highlighter.reset()
+                self.syntax_highlighter.highlight_visible()
             
         except Exception as e:
             messagebox.showerror("Помилка", f"Не вдалося відкрити файл: {e}")
             
+    def insert_text_chunked(self, content):
+        """Вставка великого тексту частинами, щоб інтерфейс не зависав"""
+        # Уся вставка - одна дія для відміни (Ctrl+Z)
+        self.text_editor.configure(autoseparators=False)
+        try:
+            chunk_size = self.INSERT_CHUNK_SIZE
+            for chunk_index, start in enumerate(range(0, len(content), chunk_size)):
+                self.text_editor.insert("end-1c", content[start:start + chunk_size])
+                if chunk_index % 4 == 3:
+                    self.root.update_idletasks()
+        finally:
+            self.text_editor.edit_separator()
+            self.text_editor.configure(autoseparators=True)
+
     def save_file(self):
         """Збереження поточного файлу"""
         if not self.current_file_path:
@@ -525,6 +894,10 @@ class RimWorldModBuilder:
         """Обробка змін в тексті"""
         _ = event  # Позначаємо що параметр використовується
         self.unsaved_changes = True
+
+        # Запам'ятовуємо рядок до зміни (Enter, вставка та видалення зсувають курсор)
+        if self.is_highlighting_active():
+            self._mark_dirty_line()
         
     def update_project_info(self, project_data):
         """Оновлення інформації про проєкт"""
@@ -539,14 +912,27 @@ class RimWorldModBuilder:
         about_file = self.current_project_path / "About" / "About.xml"
         if about_file.exists():
             try:
-                content = about_file.read_text(encoding='utf-8')
-                # Простий парсинг XML для отримання назви та автора
-                import re
-                name_match = re.search(r'<name>(.*?)</name>', content)
-                author_match = re.search(r'<author>(.*?)</author>', content)
+                # Потоковий парсинг: зупиняємось, щойно знайдено назву та автора
+                ET = _element_tree()
+                info = {}
+                try:
+                    for _, elem in ET.iterparse(str(about_file), events=("end",)):
+                        if elem.tag in _ABOUT_INFO_TAGS and elem.tag not in info:
+                            info[elem.tag] = elem.text
+                            if len(info) == len(_ABOUT_INFO_TAGS):
+                                break
+                        elem.clear()
+                except ET.ParseError:
+                    content = about_file.read_text(encoding='utf-8')
+                    name_match = _ABOUT_NAME_RE.search(content)
+                    author_match = _ABOUT_AUTHOR_RE.search(content)
+                    info = {
+                        'name': name_match.group(1) if name_match else None,
+                        'author': author_match.group(1) if author_match else None,
+                    }
                 
-                name = name_match.group(1) if name_match else "Невідомо"
-                author = author_match.group(1) if author_match else "Невідомо"
+                name = info.get('name') or "Невідомо"
+                author = info.get('author') or "Невідомо"
                 
                 info_text = f"Назва: {name}\nАвтор: {author}"
                 self.project_info.configure(text=info_text)
@@ -556,58 +942,64 @@ class RimWorldModBuilder:
             self.project_info.configure(text="About.xml не знайдено")
             
     def validate_xml(self):
-        """Валідація XML"""
+        """Валідація XML (виконується у фоновому потоці)"""
         if not self.current_file_path or not self.current_file_path.suffix == '.xml':
             messagebox.showwarning("Попередження", "Виберіть XML файл для валідації")
             return
 
-        try:
-            from src.utils.xml_validator_simple import SimpleXMLValidator
+        if self._validation_executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._validation_executor = ThreadPoolExecutor(max_workers=1)
 
-            content = self.text_editor.get("1.0", "end-1c")
-            validator = SimpleXMLValidator()
+        content = self.text_editor.get("1.0", "end-1c")
+        future = self._validation_executor.submit(_validate_xml_content, content)
 
-            if validator.validate_content(content):
-                report = validator.get_validation_report()
-                formatted_report = validator.format_report(report)
+        self.validate_btn.configure(state="disabled")
+        self.status_label.configure(text="Валідація XML...")
+        self.root.after(50, self._check_validation, future)
 
-                # Показуємо детальний звіт
-                ValidationReportDialog(self.root, formatted_report)
-            else:
-                report = validator.get_validation_report()
-                formatted_report = validator.format_report(report)
-                ValidationReportDialog(self.root, formatted_report)
+    def _check_validation(self, future):
+        """Очікування результату валідації без блокування інтерфейсу"""
+        if not future.done():
+            self.root.after(50, self._check_validation, future)
+            return
 
-        except ImportError:
-            # Fallback до простої валідації
-            try:
-                import xml.etree.ElementTree as ET
-                content = self.text_editor.get("1.0", "end-1c")
-                ET.fromstring(content)
-                messagebox.showinfo("Валідація", "XML файл синтаксично правильний!")
-            except ET.ParseError as e:
-                messagebox.showerror("Помилка валідації", f"XML помилка: {e}")
+        self.validate_btn.configure(state="normal")
+        self.status_label.configure(text="Валідацію завершено")
+
+        try:
+            kind, result = future.result()
         except Exception as e:
             messagebox.showerror("Помилка", f"Не вдалося валідувати: {e}")
+            return
+
+        if kind == "report":
+            # Показуємо детальний звіт
+            ValidationReportDialog(self.root, result)
+        elif result is None:
+            messagebox.showinfo("Валідація", "XML файл синтаксично правильний!")
+        else:
+            messagebox.showerror("Помилка валідації", f"XML помилка: {result}")
             
     def show_templates(self):
         """Показ шаблонів"""
-        dialog = TemplateDialog(self.root)
-        self.root.wait_window(dialog.dialog)
+        if self.template_dialog is None or not self.template_dialog.dialog.winfo_exists():
+            self.template_dialog = TemplateDialog(self.root, on_ok=self.load_template_content)
+        else:
+            self.template_dialog.show(on_ok=self.load_template_content)
 
-        if dialog.result:
-            # Вставляємо шаблон в редактор
-            template_content = dialog.result
-            self.text_editor.delete("1.0", "end")
-            self.text_editor.insert("1.0", template_content)
-            self.file_name_label.configure(text="📄 Новий файл з шаблону")
-            self.current_file_path = None
-            self.unsaved_changes = True
-            self.status_label.configure(text="Шаблон завантажено")
+    def load_template_content(self, template_content):
+        """Вставка вибраного шаблону в редактор"""
+        self.text_editor.delete("1.0", "end")
+        self.text_editor.insert("1.0", template_content)
+        self.file_name_label.configure(text="📄 Новий файл з шаблону")
+        self.current_file_path = None
+        self.unsaved_changes = True
+        self.status_label.configure(text="Шаблон завантажено")
 
-            # Підсвічування синтаксису для XML шаблонів
-            if self.syntax_highlighter and template_content.strip().startswith('<?xml'):
-                self.syntax_highlighter.highlight_all()
+        # Підсвічування синтаксису для XML шаблонів
+        if self.syntax_highlighter and template_content.strip().startswith('<?xml'):
+            self.syntax_highlighter.highlight_all()
 
     def show_texture_manager(self):
         """Показ менеджера текстур CustomTkinter"""
@@ -716,7 +1108,7 @@ class RimWorldModBuilder:
 
             # Імпорт DLL компілятора
             try:
-                from src.ui.dll_compiler_widget import DLLCompilerWidget
+                DLLCompilerWidget = _dll_compiler_widget_cls()
 
                 # Створення віджета компілятора
                 dll_compiler = DLLCompilerWidget(dll_window)
@@ -747,7 +1139,7 @@ class RimWorldModBuilder:
                 error_label = ctk.CTkLabel(
                     dll_window,
                     text="❌ Не вдалося завантажити DLL компілятор\n\nПеревірте встановлення залежностей",
-                    font=ctk.CTkFont(size=16)
+                    font=_font(16)
                 )
                 error_label.pack(expand=True)
 
@@ -762,11 +1154,12 @@ class RimWorldModBuilder:
             return
 
         # Діалог вибору типу експорту
-        export_dialog = ExportDialog(self.root, self.current_project_path)
-        self.root.wait_window(export_dialog.dialog)
+        ExportDialog(self.root, self.current_project_path, on_ok=self.on_mod_exported)
 
-        if export_dialog.result:
-            self.status_label.configure(text="Мод експортовано успішно!")
+    def on_mod_exported(self, result):
+        """Обробка успішного експорту"""
+        _ = result  # Позначаємо що параметр використовується
+        self.status_label.configure(text="Мод експортовано успішно!")
 
     def save_project(self):
         """Збереження поточного проєкту"""
@@ -785,20 +1178,42 @@ class RimWorldModBuilder:
 
 
 class NewProjectDialog:
-    def __init__(self, parent):
+    def __init__(self, parent, on_ok=None):
+        self.parent = parent
         self.result = None
+        self.on_ok = on_ok
         
-        # Створення діалогу
+        # Створення діалогу (прихованого, доки не побудовано всі віджети)
         self.dialog = ctk.CTkToplevel(parent)
+        self.dialog.withdraw()
         self.dialog.title("Новий проєкт")
-        self.dialog.geometry("500x400")
-        self.dialog.transient(parent)
-        self.dialog.grab_set()
-        
-        # Центрування діалогу
-        self.dialog.geometry(f"+{parent.winfo_x() + 50}+{parent.winfo_y() + 50}")
+        _center_dialog(self.dialog, parent, 500, 400)
         
         self.setup_dialog()
+        _present_dialog(self.dialog)
+        self.dialog.protocol("WM_DELETE_WINDOW", self.close)
+        self.dialog.bind("<Escape>", lambda e: self.close())
+
+    def show(self, on_ok=None):
+        """Повторний показ прихованого діалогу з очищеною формою"""
+        self.result = None
+        self.on_ok = on_ok
+
+        self.name_entry.delete(0, "end")
+        self.author_entry.delete(0, "end")
+        self.description_text.delete("1.0", "end")
+        self.path_entry.delete(0, "end")
+        self.path_entry.insert(0, str(Path.home() / "RimWorldMods"))
+        self.error_label.configure(text="")
+
+        _center_dialog(self.dialog, self.parent, 500, 400)
+        _present_dialog(self.dialog)
+        self.name_entry.focus()
+
+    def close(self):
+        """Приховування діалогу замість знищення"""
+        self.dialog.grab_release()
+        self.dialog.withdraw()
         
     def setup_dialog(self):
         """Налаштування діалогу"""
@@ -806,31 +1221,32 @@ class NewProjectDialog:
         title_label = ctk.CTkLabel(
             self.dialog,
             text="Створення нового проєкту",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=_font(20, "bold")
         )
         title_label.pack(pady=20)
         
-        # Основна форма
+        # Основна форма: один стовпець сітки, по рядку на кожен елемент
         form_frame = ctk.CTkFrame(self.dialog)
         form_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+        form_frame.grid_columnconfigure(0, weight=1)
         
         # Поля вводу
-        ctk.CTkLabel(form_frame, text="Назва мода:", font=ctk.CTkFont(size=14)).pack(anchor="w", padx=20, pady=(20, 5))
+        ctk.CTkLabel(form_frame, text="Назва мода:", font=_font(14)).grid(row=0, column=0, sticky="w", padx=20, pady=(20, 5))
         self.name_entry = ctk.CTkEntry(form_frame, placeholder_text="Введіть назву мода")
-        self.name_entry.pack(fill="x", padx=20, pady=(0, 10))
+        self.name_entry.grid(row=1, column=0, sticky="ew", padx=20, pady=(0, 10))
         
-        ctk.CTkLabel(form_frame, text="Автор:", font=ctk.CTkFont(size=14)).pack(anchor="w", padx=20, pady=(0, 5))
+        ctk.CTkLabel(form_frame, text="Автор:", font=_font(14)).grid(row=2, column=0, sticky="w", padx=20, pady=(0, 5))
         self.author_entry = ctk.CTkEntry(form_frame, placeholder_text="Ваше ім'я")
-        self.author_entry.pack(fill="x", padx=20, pady=(0, 10))
+        self.author_entry.grid(row=3, column=0, sticky="ew", padx=20, pady=(0, 10))
         
-        ctk.CTkLabel(form_frame, text="Опис:", font=ctk.CTkFont(size=14)).pack(anchor="w", padx=20, pady=(0, 5))
+        ctk.CTkLabel(form_frame, text="Опис:", font=_font(14)).grid(row=4, column=0, sticky="w", padx=20, pady=(0, 5))
         self.description_text = ctk.CTkTextbox(form_frame, height=80)
-        self.description_text.pack(fill="x", padx=20, pady=(0, 10))
+        self.description_text.grid(row=5, column=0, sticky="ew", padx=20, pady=(0, 10))
         
-        ctk.CTkLabel(form_frame, text="Шлях:", font=ctk.CTkFont(size=14)).pack(anchor="w", padx=20, pady=(0, 5))
+        ctk.CTkLabel(form_frame, text="Шлях:", font=_font(14)).grid(row=6, column=0, sticky="w", padx=20, pady=(0, 5))
         
         path_frame = ctk.CTkFrame(form_frame, fg_color="transparent")
-        path_frame.pack(fill="x", padx=20, pady=(0, 20))
+        path_frame.grid(row=7, column=0, sticky="ew", padx=20, pady=(0, 20))
         
         self.path_entry = ctk.CTkEntry(path_frame, placeholder_text="Виберіть папку")
         self.path_entry.pack(side="left", fill="x", expand=True, padx=(0, 10))
@@ -839,11 +1255,15 @@ class NewProjectDialog:
         browse_btn = ctk.CTkButton(path_frame, text="Огляд", command=self.browse_path, width=80)
         browse_btn.pack(side="right")
         
+        # Помилки перевірки форми показуються тут, без модального messagebox
+        self.error_label = ctk.CTkLabel(form_frame, text="", text_color="red")
+        self.error_label.grid(row=8, column=0, sticky="w", padx=20)
+        
         # Кнопки
         button_frame = ctk.CTkFrame(form_frame, fg_color="transparent")
-        button_frame.pack(fill="x", padx=20, pady=(0, 20))
+        button_frame.grid(row=9, column=0, sticky="ew", padx=20, pady=(0, 20))
         
-        cancel_btn = ctk.CTkButton(button_frame, text="Скасувати", command=self.dialog.destroy)
+        cancel_btn = ctk.CTkButton(button_frame, text="Скасувати", command=self.close)
         cancel_btn.pack(side="right", padx=(10, 0))
         
         create_btn = ctk.CTkButton(button_frame, text="Створити", command=self.create_project)
@@ -861,48 +1281,64 @@ class NewProjectDialog:
             
     def create_project(self):
         """Створення проєкту"""
-        name = self.name_entry.get().strip()
-        author = self.author_entry.get().strip()
-        description = self.description_text.get("1.0", "end-1c").strip()
-        path = self.path_entry.get().strip()
+        values = {key: getattr(self, f"{key}_entry").get().strip() for key in ('name', 'author', 'path')}
         
-        if not name or not author:
-            messagebox.showerror("Помилка", "Назва та автор є обов'язковими полями")
+        if not values['name'] or not values['author']:
+            self.error_label.configure(text="Назва та автор є обов'язковими полями")
             return
             
-        self.result = {
-            'name': name,
-            'author': author,
-            'description': description,
-            'path': path
-        }
+        values['description'] = self.description_text.get("1.0", "end-1c").strip()
+        self.result = values
         
-        self.dialog.destroy()
+        self.close()
+        if self.on_ok:
+            self.on_ok(self.result)
 
 
 class TemplateDialog:
-    def __init__(self, parent):
+    def __init__(self, parent, on_ok=None):
+        self.parent = parent
         self.result = None
+        self.on_ok = on_ok
+        # Менеджер шаблонів завантажується вже після появи діалогу
+        self.template_manager = None
+        self.template_list = []
 
-        # Імпорт менеджера шаблонів
-        try:
-            from src.core.template_manager import TemplateManager
-            self.template_manager = TemplateManager("src/templates")
-        except ImportError:
-            messagebox.showerror("Помилка", "Не вдалося завантажити менеджер шаблонів")
-            return
-
-        # Створення діалогу
+        # Створення діалогу (прихованого, доки не побудовано всі віджети)
         self.dialog = ctk.CTkToplevel(parent)
+        self.dialog.withdraw()
         self.dialog.title("Шаблони дефініцій")
-        self.dialog.geometry("700x500")
-        self.dialog.transient(parent)
-        self.dialog.grab_set()
-
-        # Центрування діалогу
-        self.dialog.geometry(f"+{parent.winfo_x() + 50}+{parent.winfo_y() + 50}")
+        _center_dialog(self.dialog, parent, 700, 500)
 
         self.setup_dialog()
+        _present_dialog(self.dialog)
+        self.dialog.protocol("WM_DELETE_WINDOW", self.close)
+
+        # Шаблони завантажуються після першого відмальовування діалогу
+        self.dialog.after_idle(self._lazy_init_templates)
+
+    def show(self, on_ok=None):
+        """Повторний показ прихованого діалогу; список перебудовується лише при зміні шаблонів"""
+        self.result = None
+        self.on_ok = on_ok
+
+        _center_dialog(self.dialog, self.parent, 700, 500)
+        _present_dialog(self.dialog)
+        self.dialog.after_idle(self._reload_if_changed)
+
+    def close(self):
+        """Приховування діалогу замість знищення"""
+        self.dialog.grab_release()
+        self.dialog.withdraw()
+
+    # Висоти рядків віртуалізованого списку шаблонів (пікселі)
+    CATEGORY_ROW_HEIGHT = 40
+    TEMPLATE_ROW_HEIGHT = 72
+    ROW_GAP = 4
+    # Запас рядків над і під видимою областю
+    OVERSCAN = 200
+    # Координата, куди переносяться невикористані рядки (поза областю прокрутки)
+    HIDDEN_Y = -10000
 
     def setup_dialog(self):
         """Налаштування діалогу"""
@@ -910,7 +1346,7 @@ class TemplateDialog:
         title_label = ctk.CTkLabel(
             self.dialog,
             text="Виберіть шаблон",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=_font(20, "bold")
         )
         title_label.pack(pady=20)
 
@@ -918,31 +1354,108 @@ class TemplateDialog:
         main_frame = ctk.CTkFrame(self.dialog)
         main_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
 
-        # Список шаблонів
-        self.template_frame = ctk.CTkScrollableFrame(main_frame, label_text="Доступні шаблони")
-        self.template_frame.pack(fill="both", expand=True, padx=20, pady=20)
+        # Список шаблонів: віджети створюються лише для видимих рядків і перевикористовуються при прокрутці
+        ctk.CTkLabel(main_frame, text="Доступні шаблони").pack(anchor="w", padx=20, pady=(20, 0))
 
-        # Завантаження шаблонів
-        self.load_templates()
+        list_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
+        list_frame.pack(fill="both", expand=True, padx=20, pady=(5, 20))
+
+        self.canvas = tk.Canvas(
+            list_frame,
+            highlightthickness=0,
+            borderwidth=0,
+            yscrollincrement=20,
+            bg=self._theme_color("CTkFrame", "fg_color")
+        )
+        self.scrollbar = ctk.CTkScrollbar(list_frame, command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_canvas_scroll)
+
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="both", expand=True)
+
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
+        # Прокрутка колесом миші над будь-яким віджетом діалогу
+        self.dialog.bind("<MouseWheel>", self._on_mousewheel)
+        self.dialog.bind("<Button-4>", lambda e: self.canvas.yview_scroll(-1, "units"))
+        self.dialog.bind("<Button-5>", lambda e: self.canvas.yview_scroll(1, "units"))
+
+        self.rows = []  # (y, висота, тип, дані)
+        self.row_offsets = []
+        self._row_pool = {"category": [], "template": []}
+        self._visible_rows = {}  # індекс рядка -> (тип, віджети рядка)
+        self.no_templates_label = None
+
+        # Напис на час завантаження шаблонів
+        self.loading_label = ctk.CTkLabel(self.canvas, text="Завантаження...", font=_font(14))
+        self.canvas.create_window(0, 20, window=self.loading_label, anchor="nw")
 
         # Кнопки
         button_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
         button_frame.pack(fill="x", padx=20, pady=(0, 20))
 
-        cancel_btn = ctk.CTkButton(button_frame, text="Скасувати", command=self.dialog.destroy)
+        cancel_btn = ctk.CTkButton(button_frame, text="Скасувати", command=self.close)
         cancel_btn.pack(side="right", padx=(10, 0))
 
+    def _lazy_init_templates(self):
+        """Імпорт і створення менеджера шаблонів та побудова списку"""
+        try:
+            self.template_manager, self.template_list = _cached_template_manager()
+        except ImportError:
+            self.dialog.destroy()
+            messagebox.showerror("Помилка", "Не вдалося завантажити менеджер шаблонів")
+            return
+        finally:
+            if self.loading_label.winfo_exists():
+                self.loading_label.destroy()
+
+        self.load_templates()
+
+    def _reload_if_changed(self):
+        """Перебудова списку, якщо папка шаблонів змінилася з часу останнього показу"""
+        if self.template_manager is None:
+            return
+
+        try:
+            manager, template_list = _cached_template_manager()
+        except ImportError:
+            return
+        if manager is self.template_manager:
+            return
+
+        self.template_manager, self.template_list = manager, template_list
+
+        # Усі рядки повертаються в пул і заповнюються заново
+        for kind, row in self._visible_rows.values():
+            self.canvas.coords(row["window"], 0, self.HIDDEN_Y)
+            self._row_pool[kind].append(row)
+        self._visible_rows.clear()
+        self.rows.clear()
+        if self.no_templates_label is not None:
+            self.no_templates_label.destroy()
+            self.no_templates_label = None
+
+        self.canvas.yview_moveto(0)
+        self.load_templates()
+
+    @staticmethod
+    def _theme_color(widget_name, key):
+        """Колір теми CustomTkinter для поточного режиму оформлення"""
+        color = ctk.ThemeManager.theme[widget_name][key]
+        if isinstance(color, (list, tuple)):
+            return color[1] if ctk.get_appearance_mode() == "Dark" else color[0]
+        return color
+
     def load_templates(self):
         """Завантаження списку шаблонів"""
-        templates = self.template_manager.get_template_list()
+        templates = self.template_list
 
         if not templates:
-            no_templates_label = ctk.CTkLabel(
-                self.template_frame,
+            self.no_templates_label = ctk.CTkLabel(
+                self.canvas,
                 text="Шаблони не знайдено",
-                font=ctk.CTkFont(size=14)
+                font=_font(14)
             )
-            no_templates_label.pack(pady=20)
+            self.canvas.create_window(0, 20, window=self.no_templates_label, anchor="nw")
             return
 
         # Групування за категоріями
@@ -953,78 +1466,132 @@ class TemplateDialog:
                 categories[category] = []
             categories[category].append(template)
 
-        # Відображення шаблонів по категоріях
+        # Плоский список рядків з наперед обчисленими позиціями
+        y = 0
         for category, category_templates in categories.items():
-            # Заголовок категорії
-            category_label = ctk.CTkLabel(
-                self.template_frame,
-                text=f"📁 {category}",
-                font=ctk.CTkFont(size=16, weight="bold")
-            )
-            category_label.pack(anchor="w", pady=(10, 5))
+            self.rows.append((y, self.CATEGORY_ROW_HEIGHT, "category", f"📁 {category}"))
+            y += self.CATEGORY_ROW_HEIGHT + self.ROW_GAP
 
-            # Шаблони в категорії
             for template in category_templates:
-                template_frame = ctk.CTkFrame(self.template_frame)
-                template_frame.pack(fill="x", pady=2)
-
-                # Назва шаблону
-                name_label = ctk.CTkLabel(
-                    template_frame,
-                    text=template['name'].replace('_template', '').replace('_', ' ').title(),
-                    font=ctk.CTkFont(size=14, weight="bold")
-                )
-                name_label.pack(anchor="w", padx=10, pady=(5, 0))
-
-                # Опис шаблону
-                desc_label = ctk.CTkLabel(
-                    template_frame,
-                    text=template['description'],
-                    font=ctk.CTkFont(size=12),
-                    text_color="gray"
-                )
-                desc_label.pack(anchor="w", padx=10, pady=(0, 5))
-
-                # Кнопка використання
-                use_btn = ctk.CTkButton(
-                    template_frame,
-                    text="Використати",
-                    command=lambda t=template['name']: self.use_template(t),
-                    width=100
-                )
-                use_btn.pack(side="right", padx=10, pady=5)
+                self.rows.append((y, self.TEMPLATE_ROW_HEIGHT, "template", template))
+                y += self.TEMPLATE_ROW_HEIGHT + self.ROW_GAP
+
+        self.row_offsets = [row[0] for row in self.rows]
+        self.canvas.configure(scrollregion=(0, 0, 0, y))
+        self._refresh_visible()
+
+    def _create_row(self, kind):
+        """Створення віджетів рядка для пулу"""
+        if kind == "category":
+            widget = ctk.CTkLabel(
+                self.canvas,
+                text="",
+                anchor="w",
+                font=_font(16, "bold")
+            )
+            row = {"widget": widget, "label": widget}
+        else:
+            widget = ctk.CTkFrame(self.canvas)
+            widget.grid_columnconfigure(0, weight=1)
+
+            # Назва шаблону
+            name_label = ctk.CTkLabel(widget, text="", font=_font(14, "bold"))
+            name_label.grid(row=0, column=0, sticky="w", padx=10, pady=(5, 0))
+
+            # Опис шаблону
+            desc_label = ctk.CTkLabel(widget, text="", font=_font(12), text_color="gray")
+            desc_label.grid(row=1, column=0, sticky="w", padx=10, pady=(0, 5))
+
+            # Кнопка використання
+            use_btn = ctk.CTkButton(widget, text="Використати", width=100)
+            use_btn.grid(row=0, column=1, rowspan=2, padx=10, pady=5)
+
+            row = {"widget": widget, "name": name_label, "description": desc_label, "button": use_btn}
+
+        row["window"] = self.canvas.create_window(0, self.HIDDEN_Y, window=widget, anchor="nw")
+        return row
+
+    def _fill_row(self, kind, row, data):
+        """Заповнення віджетів рядка даними"""
+        if kind == "category":
+            row["label"].configure(text=data)
+        else:
+            row["name"].configure(text=data['name'].replace('_template', '').replace('_', ' ').title())
+            row["description"].configure(text=data['description'])
+            row["button"].configure(command=functools.partial(self.use_template, data['name']))
+
+    def _refresh_visible(self):
+        """Показ лише тих рядків, що потрапляють у видиму область"""
+        if not self.rows:
+            return
+
+        width = self.canvas.winfo_width()
+        top = self.canvas.canvasy(0) - self.OVERSCAN
+        bottom = self.canvas.canvasy(0) + self.canvas.winfo_height() + self.OVERSCAN
+
+        wanted = set()
+        index = max(0, bisect_right(self.row_offsets, top) - 1)
+        while index < len(self.rows) and self.rows[index][0] < bottom:
+            wanted.add(index)
+            index += 1
+
+        # Рядки, що вийшли з видимої області, повертаються в пул
+        for index in [i for i in self._visible_rows if i not in wanted]:
+            kind, row = self._visible_rows.pop(index)
+            self.canvas.coords(row["window"], 0, self.HIDDEN_Y)
+            self._row_pool[kind].append(row)
+
+        for index in sorted(wanted.difference(self._visible_rows)):
+            y, height, kind, data = self.rows[index]
+            pool = self._row_pool[kind]
+            row = pool.pop() if pool else self._create_row(kind)
+            self._fill_row(kind, row, data)
+            self.canvas.coords(row["window"], 0, y)
+            self.canvas.itemconfigure(row["window"], width=width, height=height)
+            self._visible_rows[index] = (kind, row)
+
+    def _on_canvas_scroll(self, first, last):
+        """Прокрутка списку: оновлюємо повзунок і видимі рядки"""
+        self.scrollbar.set(first, last)
+        self._refresh_visible()
+
+    def _on_canvas_configure(self, event):
+        """Зміна розміру списку: розтягуємо рядки на всю ширину"""
+        for _, row in self._visible_rows.values():
+            self.canvas.itemconfigure(row["window"], width=event.width)
+        self._refresh_visible()
+
+    def _on_mousewheel(self, event):
+        """Прокрутка колесом миші (Windows/macOS)"""
+        step = -1 if event.delta > 0 else 1
+        self.canvas.yview_scroll(step * max(1, abs(event.delta) // 120), "units")
 
     def use_template(self, template_name):
         """Використання шаблону"""
         try:
-            # Простий рендеринг без змінних
-            template_content = self.template_manager.templates[template_name]['content']
-
-            # Видаляємо коментарі з описом
-            lines = template_content.split('\n')
-            filtered_lines = [line for line in lines if not line.strip().startswith('<!-- Description:')]
-            template_content = '\n'.join(filtered_lines)
-
-            self.result = template_content
-            self.dialog.destroy()
+            # Коментарі з описом прибрані ще під час завантаження шаблонів
+            self.result = self.template_manager.templates[template_name]['content_stripped']
+            self.close()
+            if self.on_ok:
+                self.on_ok(self.result)
 
         except Exception as e:
             messagebox.showerror("Помилка", f"Не вдалося завантажити шаблон: {e}")
 
 
 class ValidationReportDialog:
+    # Обсяг звіту, що вставляється одразу; решта дописується частинами після показу діалогу
+    REPORT_CHUNK_SIZE = 64 * 1024
+
     def __init__(self, parent, report_text):
-        # Створення діалогу
+        # Створення діалогу (прихованого, доки не побудовано всі віджети)
         self.dialog = ctk.CTkToplevel(parent)
+        self.dialog.withdraw()
         self.dialog.title("Звіт валідації XML")
-        self.dialog.geometry("600x400")
-        self.dialog.transient(parent)
-        self.dialog.grab_set()
-
-        # Центрування діалогу
-        self.dialog.geometry(f"+{parent.winfo_x() + 50}+{parent.winfo_y() + 50}")
+        _center_dialog(self.dialog, parent, 600, 400)
 
         self.setup_dialog(report_text)
+        _present_dialog(self.dialog)
 
     def setup_dialog(self, report_text):
         """Налаштування діалогу"""
@@ -1032,20 +1599,23 @@ class ValidationReportDialog:
         title_label = ctk.CTkLabel(
             self.dialog,
             text="Результат валідації",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=_font(18, "bold")
         )
         title_label.pack(pady=20)
 
         # Текстова область для звіту
         self.report_text = ctk.CTkTextbox(
             self.dialog,
-            font=ctk.CTkFont(family="Consolas", size=12)
+            font=_font(12, family="Consolas")
         )
         self.report_text.pack(fill="both", expand=True, padx=20, pady=(0, 20))
 
-        # Вставляємо звіт
-        self.report_text.insert("1.0", report_text)
+        # Вставляємо початок звіту, решту - у фоні через after
+        self.report_text.insert("1.0", report_text[:self.REPORT_CHUNK_SIZE])
         self.report_text.configure(state="disabled")  # Тільки для читання
+        if len(report_text) > self.REPORT_CHUNK_SIZE:
+            # after, а не after_idle: update_idletasks перед показом не має виконати дописування
+            self.dialog.after(1, self._append_report, report_text, self.REPORT_CHUNK_SIZE)
 
         # Кнопка закриття
         close_btn = ctk.CTkButton(
@@ -1056,26 +1626,120 @@ class ValidationReportDialog:
         )
         close_btn.pack(pady=(0, 20))
 
+    def _append_report(self, report_text, start):
+        """Дописування наступної частини звіту без блокування інтерфейсу"""
+        if not self.dialog.winfo_exists():
+            return
+
+        end = start + self.REPORT_CHUNK_SIZE
+        self.report_text.configure(state="normal")
+        self.report_text.insert("end-1c", report_text[start:end])
+        self.report_text.configure(state="disabled")
+
+        if end < len(report_text):
+            self.dialog.after(1, self._append_report, report_text, end)
+
+
+# ioctl FICLONE (Linux): копія файлу як reflink без копіювання даних
+_FICLONE = 0x40049409
+
+
+def _reflink(src, dst):
+    """Клонування файлу через reflink; False, якщо ФС або платформа це не підтримує"""
+    if not sys.platform.startswith("linux"):
+        return False
+
+    import fcntl
+    import shutil
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+    except OSError:
+        return False
+
+    shutil.copystat(src, dst)
+    return True
+
+
+# Вже стиснені формати: у ZIP зберігаються без повторного deflate
+_ZIP_STORED_SUFFIXES = frozenset((
+    ".png", ".jpg", ".jpeg", ".webp", ".ogg", ".mp3", ".zip", ".7z", ".gz", ".rar"
+))
+
+
+def _walk_files(root, skip_source):
+    """Рекурсивний обхід файлів через os.scandir; Source верхнього рівня пропускається повністю"""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if skip_source and entry.name == "Source":
+                    continue
+                yield from _walk_files(entry.path, False)
+            elif entry.is_file():
+                yield entry
+
+
+# Тимчасові папки локального експорту: нова копія до підміни і попередня версія до видалення
+_EXPORT_TEMP_PREFIXES = (".rwmb-new-", ".rwmb-old-")
+
+
+def _remove_stale_export_dirs(export_path):
+    """Видалення тимчасових папок, що лишилися після перерваного попереднього експорту"""
+    import shutil
+    try:
+        with os.scandir(export_path) as entries:
+            stale = [entry.path for entry in entries
+                     if entry.name.startswith(_EXPORT_TEMP_PREFIXES) and entry.is_dir(follow_symlinks=False)]
+    except OSError:
+        return
+    for path in stale:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def _find_xml_errors(project_path):
+    """Перевірка синтаксису XML файлів проєкту у фоновому потоці: [(відносний шлях, помилка)]"""
+    ET = _element_tree()
+    errors = []
+    for entry in _walk_files(project_path, True):
+        if entry.name.lower().endswith(".xml"):
+            try:
+                ET.parse(entry.path)
+            except ET.ParseError as e:
+                errors.append((os.path.relpath(entry.path, project_path), str(e)))
+    return errors
+
+
+class _ExportCancelled(Exception):
+    """Експорт перервано користувачем"""
+
 
 class ExportDialog:
     """Діалог експорту мода"""
 
-    def __init__(self, parent, project_path):
+    def __init__(self, parent, project_path, on_ok=None):
         self.parent = parent
         self.project_path = project_path
         self.result = None
+        self.on_ok = on_ok
 
-        # Створення діалогу
+        # Експорт виконується у фоновому потоці, події передаються через чергу
+        self._executor = None
+        self.queue = None
+        self._cancel_event = None
+        self._exporting = False
+        # Результат валідації, запущеної одразу після відкриття діалогу
+        self._val_future = None
+
+        # Створення діалогу (прихованого, доки не побудовано всі віджети)
         self.dialog = ctk.CTkToplevel(parent)
+        self.dialog.withdraw()
         self.dialog.title("Експорт мода")
-        self.dialog.geometry("600x500")
-        self.dialog.transient(parent)
-        self.dialog.grab_set()
-
-        # Центрування діалогу
-        self.dialog.geometry(f"+{parent.winfo_x() + 50}+{parent.winfo_y() + 50}")
+        _center_dialog(self.dialog, parent, 600, 500)
 
         self.setup_dialog()
+        _present_dialog(self.dialog)
+        self.dialog.protocol("WM_DELETE_WINDOW", self.cancel_export)
+        self._maybe_start_validation()
 
     def setup_dialog(self):
         """Налаштування діалогу"""
@@ -1083,22 +1747,23 @@ class ExportDialog:
         title_label = ctk.CTkLabel(
             self.dialog,
             text="Експорт мода",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=_font(20, "bold")
         )
         title_label.pack(pady=20)
 
-        # Основна область
+        # Основна область: секції розміщуються рядками сітки
         main_frame = ctk.CTkFrame(self.dialog)
         main_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+        main_frame.grid_columnconfigure(0, weight=1)
 
         # Опції експорту
         options_frame = ctk.CTkFrame(main_frame)
-        options_frame.pack(fill="x", padx=10, pady=10)
+        options_frame.grid(row=0, column=0, sticky="ew", padx=10, pady=10)
 
         ctk.CTkLabel(
             options_frame,
             text="Виберіть тип експорту:",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=_font(16, "bold")
         ).pack(pady=10)
 
         # Радіо кнопки для типу експорту
@@ -1130,12 +1795,12 @@ class ExportDialog:
 
         # Шлях експорту
         path_frame = ctk.CTkFrame(main_frame)
-        path_frame.pack(fill="x", padx=10, pady=10)
+        path_frame.grid(row=1, column=0, sticky="ew", padx=10, pady=10)
 
         ctk.CTkLabel(
             path_frame,
             text="Папка для експорту:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         ).pack(anchor="w", padx=10, pady=(10, 5))
 
         path_input_frame = ctk.CTkFrame(path_frame, fg_color="transparent")
@@ -1161,12 +1826,12 @@ class ExportDialog:
 
         # Додаткові опції
         extra_frame = ctk.CTkFrame(main_frame)
-        extra_frame.pack(fill="x", padx=10, pady=10)
+        extra_frame.grid(row=2, column=0, sticky="ew", padx=10, pady=10)
 
         ctk.CTkLabel(
             extra_frame,
             text="Додаткові опції:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         ).pack(anchor="w", padx=10, pady=(10, 5))
 
         self.include_source = ctk.BooleanVar(value=True)
@@ -1184,6 +1849,7 @@ class ExportDialog:
             variable=self.validate_before
         )
         validate_check.pack(anchor="w", padx=20, pady=2)
+        self.validate_before.trace_add("write", self._maybe_start_validation)
 
         self.create_readme = ctk.BooleanVar(value=False)
         readme_check = ctk.CTkCheckBox(
@@ -1193,24 +1859,36 @@ class ExportDialog:
         )
         readme_check.pack(anchor="w", padx=20, pady=(2, 10))
 
+        # Прогрес експорту
+        self.progress_label = ctk.CTkLabel(
+            main_frame,
+            text="",
+            font=_font(12)
+        )
+        self.progress_label.grid(row=3, column=0, sticky="ew", padx=10)
+
+        self.progress_bar = ctk.CTkProgressBar(main_frame)
+        self.progress_bar.grid(row=4, column=0, sticky="ew", padx=20, pady=(0, 5))
+        self.progress_bar.set(0)
+
         # Кнопки
         button_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
-        button_frame.pack(fill="x", padx=10, pady=10)
+        button_frame.grid(row=5, column=0, sticky="ew", padx=10, pady=10)
 
         cancel_btn = ctk.CTkButton(
             button_frame,
             text="Скасувати",
-            command=self.dialog.destroy
+            command=self.cancel_export
         )
         cancel_btn.pack(side="right", padx=(10, 0))
 
-        export_btn = ctk.CTkButton(
+        self.export_btn = ctk.CTkButton(
             button_frame,
             text="🚀 Експортувати",
             command=self.start_export,
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         )
-        export_btn.pack(side="right")
+        self.export_btn.pack(side="right")
 
     def browse_export_path(self):
         """Вибір папки для експорту"""
@@ -1223,99 +1901,304 @@ class ExportDialog:
             self.export_path_entry.delete(0, "end")
             self.export_path_entry.insert(0, folder)
 
+    def _get_executor(self):
+        """Фоновий потік діалогу для валідації та експорту"""
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        return self._executor
+
+    def _maybe_start_validation(self, *args):
+        """Запуск валідації XML у фоні, поки користувач заповнює форму"""
+        if self.validate_before.get() and self._val_future is None:
+            self._val_future = self._get_executor().submit(_find_xml_errors, self.project_path)
+
     def start_export(self):
-        """Початок експорту"""
-        export_type = self.export_type.get()
-        export_path = self.export_path_entry.get().strip()
+        """Початок експорту (виконується у фоновому потоці)"""
+        # Знімок форми: далі працюємо лише зі звичайними значеннями Python,
+        # до Tk-змінних з фонового потоку звертатися не можна
+        state = {
+            'export_type': self.export_type.get(),
+            'export_path': self.export_path_entry.get().strip(),
+            'include_source': bool(self.include_source.get()),
+            'create_readme': bool(self.create_readme.get()),
+            'validate': bool(self.validate_before.get()),
+        }
 
-        if not export_path:
+        if not state['export_path']:
             messagebox.showerror("Помилка", "Виберіть папку для експорту")
             return
 
+        self.export_btn.configure(state="disabled")
+        if state['validate']:
+            # Валідація зазвичай уже завершилась, поки заповнювалась форма
+            self._maybe_start_validation()
+            self.progress_label.configure(text="Валідація XML...")
+            self._wait_for_validation(state)
+        else:
+            self._submit_export(state)
+
+    def _wait_for_validation(self, state):
+        """Очікування результату фонової валідації без блокування інтерфейсу"""
+        if not self.dialog.winfo_exists():
+            return
+        if not self._val_future.done():
+            self.dialog.after(50, self._wait_for_validation, state)
+            return
+
+        try:
+            errors = self._val_future.result()
+        except Exception as e:
+            errors = [("", str(e))]
+
+        if errors:
+            details = "\n".join(f"{path}: {error}" for path, error in errors[:10])
+            if len(errors) > 10:
+                details += f"\n... та ще {len(errors) - 10}"
+
+            if not messagebox.askyesno(
+                "Помилки валідації",
+                f"Знайдено помилки в XML файлах:\n{details}\n\nПродовжити експорт?"
+            ):
+                # Після виправлень валідація запуститься знову
+                self._val_future = None
+                self.export_btn.configure(state="normal")
+                self.progress_label.configure(text="")
+                return
+
+        self._submit_export(state)
+
+    def _submit_export(self, state):
+        """Передача експорту у фоновий потік"""
+        import queue
+        import threading
+
+        self.queue = queue.Queue()
+        self._cancel_event = threading.Event()
+        self._exporting = True
+
+        self.progress_label.configure(text="Експорт...")
+        self.progress_bar.set(0)
+
+        self._get_executor().submit(self._do_export, state)
+        self.dialog.after(50, self._drain)
+
+    def _do_export(self, state):
+        """Експорт у фоновому потоці; результат передається через чергу"""
+        export_type = state['export_type']
+        export_path = state['export_path']
         try:
             if export_type == "local":
-                self.export_local(export_path)
+                message = self.export_local(export_path, state['include_source'], state['create_readme'])
             elif export_type == "workshop":
-                self.export_workshop(export_path)
-            elif export_type == "zip":
-                self.export_zip(export_path)
+                message = self.export_workshop(export_path)
+            else:
+                message = self.export_zip(export_path, state['include_source'])
+        except _ExportCancelled:
+            self.queue.put(("cancelled", None))
+        except Exception as e:
+            self.queue.put(("error", str(e)))
+        else:
+            self.queue.put(("done", message))
+
+    def _drain(self):
+        """Обробка подій експорту в головному потоці"""
+        import queue
+
+        progress = None
+        try:
+            while True:
+                kind, value = self.queue.get_nowait()
+                if kind == "progress":
+                    progress = value
+                    continue
+                self._finish_export(kind, value)
+                return
+        except queue.Empty:
+            pass
+
+        if progress is not None:
+            self.progress_bar.set(progress)
+        self.dialog.after(50, self._drain)
 
-            self.result = True
+    def _finish_export(self, kind, value):
+        """Завершення експорту: повідомлення користувачу і закриття діалогу"""
+        self._exporting = False
+
+        if kind == "error":
+            self.export_btn.configure(state="normal")
+            self.progress_label.configure(text="")
+            self.progress_bar.set(0)
+            messagebox.showerror("Помилка", f"Не вдалося експортувати мод:\n{value}")
+            return
+
+        self._executor.shutdown(wait=False)
+        if kind == "cancelled":
             self.dialog.destroy()
+            return
 
-        except Exception as e:
-            messagebox.showerror("Помилка", f"Не вдалося експортувати мод:\n{str(e)}")
+        self.progress_bar.set(1)
+        messagebox.showinfo("Успіх", value)
+
+        self.result = True
+        self.dialog.destroy()
+        if self.on_ok:
+            self.on_ok(self.result)
+
+    def cancel_export(self):
+        """Скасування експорту, що виконується, або закриття діалогу"""
+        if not self._exporting:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+            self.dialog.destroy()
+            return
 
-    def export_local(self, export_path):
+        # Діалог закриється, коли воркер підтвердить скасування
+        self._cancel_event.set()
+        self.progress_label.configure(text="Скасування...")
+
+    def _check_cancelled(self):
+        """Переривання воркера, якщо користувач скасував експорт"""
+        if self._cancel_event.is_set():
+            raise _ExportCancelled()
+
+    def export_local(self, export_path, include_source, create_readme):
         """Локальний експорт для тестування"""
         import shutil
 
-        export_path = Path(export_path)
-        export_path.mkdir(parents=True, exist_ok=True)
+        os.makedirs(export_path, exist_ok=True)
 
         # Назва папки мода
-        mod_name = Path(self.project_path).name
-        dest_path = export_path / mod_name
-
-        # Видалення існуючої версії
-        if dest_path.exists():
-            shutil.rmtree(dest_path)
-
-        # Копіювання мода
-        shutil.copytree(self.project_path, dest_path)
+        project_root = os.fspath(self.project_path).rstrip(os.sep)
+        mod_name = os.path.basename(project_root)
+        dest_path = os.path.join(export_path, mod_name)
 
-        # Видалення Source папки якщо не потрібно
-        if not self.include_source.get():
-            source_path = dest_path / "Source"
-            if source_path.exists():
-                shutil.rmtree(source_path)
+        import tempfile
+        import threading
 
-        # Створення README
-        if self.create_readme.get():
-            self.create_readme_file(dest_path)
+        _remove_stale_export_dirs(export_path)
 
-        messagebox.showinfo("Успіх", f"Мод експортовано до:\n{dest_path}")
+        # Мод копіюється в тимчасову папку поруч і підміняє існуючу версію лише після успішного копіювання
+        staging_dir = tempfile.mkdtemp(prefix=".rwmb-new-", dir=export_path)
+        staged_path = os.path.join(staging_dir, mod_name)
+        try:
+            # Копіювання мода з прогресом по кількості файлів
+            total = sum(len(files) for _, _, files in os.walk(project_root)) or 1
+            copied = 0
+            use_reflink = True
+
+            def copy_file(src, dst):
+                nonlocal copied, use_reflink
+                self._check_cancelled()
+                # Після першої невдачі reflink більше не пробуємо: ФС його не підтримує
+                if not (use_reflink and _reflink(src, dst)):
+                    use_reflink = False
+                    shutil.copy2(src, dst)
+                copied += 1
+                self.queue.put(("progress", copied / total))
+
+            shutil.copytree(project_root, staged_path, copy_function=copy_file)
+
+            # Видалення Source папки якщо не потрібно
+            if not include_source:
+                source_path = os.path.join(staged_path, "Source")
+                if os.path.exists(source_path):
+                    shutil.rmtree(source_path)
+
+            # Створення README
+            if create_readme:
+                self.create_readme_file(staged_path)
+
+            # Підміна: існуюча версія переноситься вбік, нова стає на її місце
+            old_dir = None
+            if os.path.exists(dest_path):
+                old_dir = tempfile.mkdtemp(prefix=".rwmb-old-", dir=export_path)
+                os.rename(dest_path, os.path.join(old_dir, mod_name))
+            try:
+                os.rename(staged_path, dest_path)
+            except BaseException:
+                # Повернення попередньої версії на місце
+                if old_dir is not None:
+                    os.rename(os.path.join(old_dir, mod_name), dest_path)
+                    os.rmdir(old_dir)
+                raise
+        except BaseException:
+            # Скасування або помилка: часткова копія видаляється, попередня версія лишається
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            raise
+
+        os.rmdir(staging_dir)
+
+        # Попередня версія видаляється у фоні; потік не фоновий (daemon), тож видалення завершиться до виходу
+        if old_dir is not None:
+            threading.Thread(
+                target=shutil.rmtree, args=(old_dir,), kwargs={"ignore_errors": True}
+            ).start()
+
+        return f"Мод експортовано до:\n{dest_path}"
 
     def export_workshop(self, export_path):
         """Експорт для Steam Workshop"""
         try:
             from src.core.steam_workshop import SteamWorkshopManager
+        except ImportError:
+            raise RuntimeError("Steam Workshop модуль недоступний")
 
-            workshop_manager = SteamWorkshopManager(self.project_path)
-            result = workshop_manager.prepare_for_workshop(export_path)
+        workshop_manager = SteamWorkshopManager(self.project_path)
+        result = workshop_manager.prepare_for_workshop(export_path)
 
-            if result['success']:
-                messagebox.showinfo("Успіх", f"Мод підготовлено для Steam Workshop:\n{result['output_path']}")
-            else:
-                messagebox.showerror("Помилка", f"Помилка підготовки:\n{result['error']}")
+        if not result['success']:
+            raise RuntimeError(f"Помилка підготовки:\n{result['error']}")
 
-        except ImportError:
-            messagebox.showerror("Помилка", "Steam Workshop модуль недоступний")
+        return f"Мод підготовлено для Steam Workshop:\n{result['output_path']}"
 
-    def export_zip(self, export_path):
+    def export_zip(self, export_path, include_source):
         """Експорт у ZIP архів"""
-        import zipfile
+        zipfile = _zipfile()
 
-        export_path = Path(export_path)
-        export_path.mkdir(parents=True, exist_ok=True)
+        os.makedirs(export_path, exist_ok=True)
 
         # Назва архіву
-        mod_name = Path(self.project_path).name
-        zip_path = export_path / f"{mod_name}.zip"
+        project_root = os.fspath(self.project_path).rstrip(os.sep)
+        mod_name = os.path.basename(project_root)
+        zip_path = os.path.join(export_path, f"{mod_name}.zip")
+
+        # Шляхи з обходу починаються з project_root + роздільник, тож відносний шлях - це зріз
+        prefix_len = len(project_root) + 1
+
+        # Список файлів і загальний розмір для прогресу (Source пропускаємо якщо не потрібно)
+        files = []
+        total_size = 0
+        for entry in _walk_files(project_root, not include_source):
+            size = entry.stat().st_size
+            files.append((entry.path, size))
+            total_size += size
 
         # Створення ZIP архіву
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for file_path in Path(self.project_path).rglob('*'):
-                if file_path.is_file():
-                    # Пропускаємо Source якщо не потрібно
-                    if not self.include_source.get() and 'Source' in file_path.parts:
-                        continue
+        written = 0
+        try:
+            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+                for file_path, size in files:
+                    self._check_cancelled()
 
                     # Відносний шлях в архіві
-                    arcname = file_path.relative_to(self.project_path)
-                    zipf.write(file_path, arcname)
+                    arcname = file_path[prefix_len:]
+                    if os.path.splitext(file_path)[1].lower() in _ZIP_STORED_SUFFIXES:
+                        zipf.write(file_path, arcname, compress_type=zipfile.ZIP_STORED)
+                    else:
+                        zipf.write(file_path, arcname)
+
+                    written += size
+                    self.queue.put(("progress", written / total_size if total_size else 1))
+        except _ExportCancelled:
+            # Недописаний архів не залишаємо
+            try:
+                os.remove(zip_path)
+            except FileNotFoundError:
+                pass
+            raise
 
-        messagebox.showinfo("Успіх", f"ZIP архів створено:\n{zip_path}")
+        return f"ZIP архів створено:\n{zip_path}"
 
     def create_readme_file(self, dest_path):
         """Створення README файлу"""
@@ -1325,14 +2208,15 @@ class ExportDialog:
             mod_info = {"name": "Unknown Mod", "author": "Unknown", "description": "No description"}
 
             if about_xml.exists():
-                import xml.etree.ElementTree as ET
-                tree = ET.parse(about_xml)
-                root = tree.getroot()
-
-                for elem in ['name', 'author', 'description']:
-                    elem_node = root.find(elem)
-                    if elem_node is not None and elem_node.text:
-                        mod_info[elem] = elem_node.text
+                # Потоковий розбір із виходом, щойно знайдено всі потрібні теги
+                found = {}
+                for _, elem in _element_tree().iterparse(str(about_xml), events=("end",)):
+                    if elem.tag in _README_INFO_TAGS and elem.text and elem.tag not in found:
+                        found[elem.tag] = elem.text
+                        if len(found) == len(_README_INFO_TAGS):
+                            break
+                    elem.clear()
+                mod_info.update(found)
 
             readme_content = f"""# {mod_info['name']}
 
@@ -1353,8 +2237,14 @@ class ExportDialog:
 Створено за допомогою RimWorld Mod Builder
 """
 
-            readme_path = dest_path / "README.txt"
-            readme_path.write_text(readme_content, encoding='utf-8')
+            # Буфер кодується один раз і пишеться напряму у файловий дескриптор
+            data = memoryview(readme_content.encode('utf-8'))
+            fd = os.open(os.path.join(dest_path, "README.txt"), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                while data:
+                    data = data[os.write(fd, data):]
+            finally:
+                os.close(fd)
 
         except Exception as e:
             print(f"Не вдалося створити README: {e}")
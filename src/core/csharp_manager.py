@@ -5,8 +5,129 @@
 """
 
 import os
+import re
+import functools
 from pathlib import Path
-from jinja2 import Template
+from types import MappingProxyType
+
+# Шаблони C# коду та скриптів збірки (*.tmpl): лише підстановки {{ name }}, без рушія шаблонів,
+# тож конструкції Jinja ({% %}, фільтри) не підтримуються
+_TEMPLATES_DIR = Path(__file__).parent / "templates" / "csharp"
+
+# Проста підстановка {{ name }} без виразів і фільтрів
+_SIMPLE_PLACEHOLDER_RE = re.compile(r'\{\{ (\w+) \}\}')
+_ESCAPED_PLACEHOLDER_RE = re.compile(r'\{\{\{\{ (\w+) \}\}\}\}')
+
+# Спільний каркас шаблонів класів (using, namespace); тіло класу підставляється замість {{ class_body }}
+_CSHARP_BASE_TEMPLATE = 'csharp_base.cs.tmpl'
+_CLASS_BODY_SLOT = '{{ class_body }}'
+
+# Шаблони класів, доступні для create_csharp_file (лише тіло всередині namespace)
+_CSHARP_CLASS_TEMPLATES = {
+    'ThingComp': 'thingcomp.cs.tmpl',
+    'JobDriver': 'jobdriver.cs.tmpl',
+    'Hediff': 'hediff.cs.tmpl',
+    'MapComponent': 'mapcomponent.cs.tmpl',
+    'GameComponent': 'gamecomponent.cs.tmpl',
+    'DefOf': 'defof.cs.tmpl',
+}
+_VALID_TEMPLATES = frozenset(_CSHARP_CLASS_TEMPLATES)
+_CLASS_TEMPLATE_FILES = frozenset(_CSHARP_CLASS_TEMPLATES.values())
+
+
+@functools.lru_cache(maxsize=None)
+def _template_source(name):
+    """Текст шаблону без рендерингу"""
+    return (_TEMPLATES_DIR / name).read_text(encoding='utf-8')
+
+
+@functools.lru_cache(maxsize=None)
+def _class_template_source(name):
+    """Повний текст шаблону класу: тіло з файлу шаблону, вставлене в спільний каркас.
+
+    Рядки using на початку файлу (до першого порожнього рядка) додаються перед using каркаса.
+    """
+    body = _template_source(name)
+    if body.endswith('\n'):
+        body = body[:-1]
+
+    extra_usings = ''
+    if body.startswith('using '):
+        extra_usings, _, body = body.partition('\n\n')
+        extra_usings += '\n'
+
+    return extra_usings + _template_source(_CSHARP_BASE_TEMPLATE).replace(_CLASS_BODY_SLOT, body)
+
+
+def _full_template_source(name):
+    """Текст шаблону для рендерингу: шаблони класів збираються з каркасом, решта як є"""
+    if name in _CLASS_TEMPLATE_FILES:
+        return _class_template_source(name)
+    return _template_source(name)
+
+
+@functools.lru_cache(maxsize=None)
+def _csharp_templates():
+    """Тексти всіх шаблонів класів; словник лише для читання, спільний для всіх викликів"""
+    return MappingProxyType({
+        template_name: _class_template_source(file_name)
+        for template_name, file_name in _CSHARP_CLASS_TEMPLATES.items()
+    })
+
+
+@functools.lru_cache(maxsize=None)
+def _format_string(name):
+    """Шаблон, перетворений у формат str.format"""
+    source = _full_template_source(name)
+    if '{%' in source or '{#' in source or '{{' in _SIMPLE_PLACEHOLDER_RE.sub('', source):
+        raise ValueError(f"Шаблон {name} містить непідтримувані конструкції (дозволено лише {{{{ name }}}})")
+
+    # Один кінцевий перенос рядка файлу шаблону відкидається
+    if source.endswith('\n'):
+        source = source[:-1]
+
+    escaped = source.replace('{', '{{').replace('}', '}}')
+    return _ESCAPED_PLACEHOLDER_RE.sub(r'{\1}', escaped)
+
+
+@functools.lru_cache(maxsize=None)
+def _mod_name_parts(name):
+    """Шаблон, що залежить лише від mod_name: закодовані в UTF-8 частини між підстановками"""
+    marker = '\x00'
+    text = _format_string(name).format_map({'mod_name': marker})
+    return tuple(part.encode('utf-8') for part in text.split(marker))
+
+
+def _render_mod_name(name, mod_name):
+    """Рендеринг шаблону з єдиною змінною mod_name одразу в bytes (без форматування і кодування всього тексту)"""
+    return mod_name.encode('utf-8').join(_mod_name_parts(name))
+
+
+def _write_file(path, content):
+    """Запис згенерованого файлу (str кодується в UTF-8 один раз) через os.write без шару текстового вводу-виводу"""
+    data = memoryview(content if isinstance(content, bytes) else content.encode('utf-8'))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+def _render(name, values):
+    """Рендеринг шаблону підстановкою значень через str.format_map"""
+    return _format_string(name).format_map(values)
+
+
+def _mod_context(mod_name, author=""):
+    """Значення підстановок для шаблонів мода; похідні рядки обчислюються один раз"""
+    return {
+        'mod_name': mod_name,
+        'mod_name_lower': mod_name.lower(),
+        'author': author,
+        'author_lower': author.lower(),
+    }
+
 
 class CSharpManager:
     """Клас для управління C# проектами RimWorld модів"""
@@ -19,22 +140,28 @@ class CSharpManager:
     def create_csharp_structure(self, mod_name, author):
         """Створення структури C# проекту"""
         try:
-            # Створення папок
-            self.assemblies_path.mkdir(exist_ok=True)
-            self.source_path.mkdir(exist_ok=True)
+            from concurrent.futures import ThreadPoolExecutor
             
             project_source_path = self.source_path / mod_name
-            project_source_path.mkdir(exist_ok=True)
             
-            # Створення .csproj файлу
-            self.create_csproj_file(mod_name, project_source_path)
+            # Створення всіх папок наперед, щоб потоки запису не конкурували за них
+            for folder in (self.assemblies_path, self.source_path, project_source_path,
+                           project_source_path / "Patches"):
+                folder.mkdir(exist_ok=True)
             
-            # Створення базових C# файлів
-            self.create_mod_class(mod_name, author, project_source_path)
-            self.create_harmony_patches(mod_name, project_source_path)
+            # Спочатку рендеринг усіх файлів (.csproj, базові C# класи, build скрипт), потім запис;
+            # усі шаблони отримують один спільний набір підстановок
+            context = _mod_context(mod_name, author)
+            writes = [
+                self._csproj_output(context, project_source_path),
+                self._mod_class_output(context, project_source_path),
+                self._harmony_patches_output(context, project_source_path),
+                self._build_script_output(context),
+            ]
             
-            # Створення build скрипту
-            self.create_build_script(mod_name)
+            # Незалежні записи виконуються паралельно
+            with ThreadPoolExecutor(max_workers=len(writes)) as executor:
+                list(executor.map(lambda item: _write_file(*item), writes))
             
             return True
             
@@ -44,394 +171,62 @@ class CSharpManager:
             
     def create_csproj_file(self, mod_name, project_path):
         """Створення .csproj файлу для RimWorld мода"""
-        csproj_template = '''<Project Sdk="Microsoft.NET.Sdk">
-
-  <PropertyGroup>
-    <TargetFramework>net472</TargetFramework>
-    <AssemblyName>{{ mod_name }}</AssemblyName>
-    <RootNamespace>{{ mod_name }}</RootNamespace>
-    <OutputPath>..\\..\\Assemblies\\</OutputPath>
-    <AppendTargetFrameworkToOutputPath>false</AppendTargetFrameworkToOutputPath>
-    <DebugType>none</DebugType>
-    <DebugSymbols>false</DebugSymbols>
-    <Optimize>true</Optimize>
-  </PropertyGroup>
-
-  <ItemGroup>
-    <PackageReference Include="Krafs.Rimworld.Ref" Version="1.5.4104" />
-    <PackageReference Include="Lib.Harmony" Version="2.2.2" />
-  </ItemGroup>
-
-  <ItemGroup>
-    <Reference Include="0Harmony">
-      <HintPath>$(RimWorldInstallDir)\\Mods\\Harmony\\Current\\Assemblies\\0Harmony.dll</HintPath>
-      <Private>False</Private>
-    </Reference>
-  </ItemGroup>
-
-</Project>'''
-
-        template = Template(csproj_template)
-        content = template.render(mod_name=mod_name)
+        _write_file(*self._csproj_output(_mod_context(mod_name), project_path))
         
-        csproj_file = project_path / f"{mod_name}.csproj"
-        csproj_file.write_text(content, encoding='utf-8')
+    def _csproj_output(self, context, project_path):
+        """Шлях і вміст .csproj файлу"""
+        content = _render_mod_name('csproj.tmpl', context['mod_name'])
+        return project_path / f"{context['mod_name']}.csproj", content
         
     def create_mod_class(self, mod_name, author, project_path):
         """Створення основного класу мода"""
-        mod_class_template = '''using Verse;
-using HarmonyLib;
-
-namespace {{ mod_name }}
-{
-    /// <summary>
-    /// Основний клас мода {{ mod_name }}
-    /// Автор: {{ author }}
-    /// </summary>
-    public class {{ mod_name }}Mod : Mod
-    {
-        public {{ mod_name }}Mod(ModContentPack content) : base(content)
-        {
-            // Ініціалізація Harmony
-            var harmony = new Harmony("{{ author.lower() }}.{{ mod_name.lower() }}");
-            harmony.PatchAll();
-            
-            Log.Message("[{{ mod_name }}] Мод успішно завантажено!");
-        }
-    }
-}'''
-
-        template = Template(mod_class_template)
-        content = template.render(
-            mod_name=mod_name,
-            author=author
-        )
+        _write_file(*self._mod_class_output(_mod_context(mod_name, author), project_path))
         
-        mod_file = project_path / f"{mod_name}Mod.cs"
-        mod_file.write_text(content, encoding='utf-8')
+    def _mod_class_output(self, context, project_path):
+        """Шлях і вміст основного класу мода"""
+        content = _render('mod_class.cs.tmpl', context)
+        return project_path / f"{context['mod_name']}Mod.cs", content
         
     def create_harmony_patches(self, mod_name, project_path):
         """Створення прикладу Harmony патчів"""
-        patches_template = '''using HarmonyLib;
-using Verse;
-using RimWorld;
-
-namespace {{ mod_name }}.Patches
-{
-    /// <summary>
-    /// Приклад Harmony патчу
-    /// </summary>
-    [HarmonyPatch(typeof(Game), "InitNewGame")]
-    public static class Game_InitNewGame_Patch
-    {
-        /// <summary>
-        /// Постфікс для методу InitNewGame
-        /// Викликається після ініціалізації нової гри
-        /// </summary>
-        [HarmonyPostfix]
-        public static void Postfix()
-        {
-            Log.Message("[{{ mod_name }}] Нова гра ініціалізована з модом!");
-        }
-    }
-    
-    /// <summary>
-    /// Приклад префікс патчу
-    /// </summary>
-    [HarmonyPatch(typeof(Pawn), "GetGizmos")]
-    public static class Pawn_GetGizmos_Patch
-    {
-        /// <summary>
-        /// Префікс для методу GetGizmos
-        /// Дозволяє змінити поведінку до виконання оригінального методу
-        /// </summary>
-        [HarmonyPrefix]
-        public static bool Prefix(Pawn __instance)
-        {
-            // Повертаємо true для продовження виконання оригінального методу
-            // Повертаємо false для пропуску оригінального методу
-            return true;
-        }
-    }
-}'''
-
-        template = Template(patches_template)
-        content = template.render(mod_name=mod_name)
+        patches_file, content = self._harmony_patches_output(_mod_context(mod_name), project_path)
+        patches_file.parent.mkdir(exist_ok=True)
+        _write_file(patches_file, content)
         
-        patches_dir = project_path / "Patches"
-        patches_dir.mkdir(exist_ok=True)
-        
-        patches_file = patches_dir / "ExamplePatches.cs"
-        patches_file.write_text(content, encoding='utf-8')
+    def _harmony_patches_output(self, context, project_path):
+        """Шлях і вміст прикладу Harmony патчів"""
+        content = _render('harmony_patches.cs.tmpl', context)
+        return project_path / "Patches" / "ExamplePatches.cs", content
         
     def create_build_script(self, mod_name):
         """Створення скрипту збірки"""
-        build_script_template = '''@echo off
-echo Building {{ mod_name }}...
-
-cd Source\\{{ mod_name }}
-dotnet build --configuration Release
-
-if %ERRORLEVEL% EQU 0 (
-    echo Build successful!
-    echo Assembly saved to Assemblies\\{{ mod_name }}.dll
-) else (
-    echo Build failed!
-    pause
-)
-
-pause'''
-
-        template = Template(build_script_template)
-        content = template.render(mod_name=mod_name)
+        _write_file(*self._build_script_output(_mod_context(mod_name)))
         
-        build_file = self.project_path / "build.bat"
-        build_file.write_text(content, encoding='utf-8')
+    def _build_script_output(self, context):
+        """Шлях і вміст скрипту збірки"""
+        content = _render_mod_name('build_script.bat.tmpl', context['mod_name'])
+        return self.project_path / "build.bat", content
         
     def get_csharp_templates(self):
         """Отримання шаблонів C# класів"""
-        return {
-            'ThingComp': self.get_thingcomp_template(),
-            'JobDriver': self.get_jobdriver_template(),
-            'Hediff': self.get_hediff_template(),
-            'MapComponent': self.get_mapcomponent_template(),
-            'GameComponent': self.get_gamecomponent_template(),
-            'DefOf': self.get_defof_template()
-        }
-        
-    def get_thingcomp_template(self):
-        """Шаблон для ThingComp класу"""
-        return '''using Verse;
-using RimWorld;
-
-namespace {{ namespace }}
-{
-    /// <summary>
-    /// Компонент для предметів
-    /// </summary>
-    public class {{ class_name }} : ThingComp
-    {
-        public {{ class_name }}Properties Props => ({{ class_name }}Properties)props;
-        
-        public override void PostSpawnSetup(bool respawningAfterLoad)
-        {
-            base.PostSpawnSetup(respawningAfterLoad);
-            // Ініціалізація після створення
-        }
-        
-        public override void CompTick()
-        {
-            base.CompTick();
-            // Логіка кожен тік (60 разів на секунду)
-        }
-        
-        public override void PostExposeData()
-        {
-            base.PostExposeData();
-            // Збереження/завантаження даних
-        }
-    }
-    
-    /// <summary>
-    /// Властивості компонента
-    /// </summary>
-    public class {{ class_name }}Properties : CompProperties
-    {
-        public {{ class_name }}Properties()
-        {
-            compClass = typeof({{ class_name }});
-        }
-    }
-}'''
-
-    def get_jobdriver_template(self):
-        """Шаблон для JobDriver класу"""
-        return '''using System.Collections.Generic;
-using Verse;
-using Verse.AI;
-using RimWorld;
-
-namespace {{ namespace }}
-{
-    /// <summary>
-    /// Драйвер роботи для пешаків
-    /// </summary>
-    public class {{ class_name }} : JobDriver
-    {
-        public override bool TryMakePreToilReservations(bool errorOnFailed)
-        {
-            // Резервування ресурсів перед початком роботи
-            return pawn.Reserve(job.targetA, job, 1, -1, null, errorOnFailed);
-        }
-        
-        protected override IEnumerable<Toil> MakeNewToils()
-        {
-            // Перевірки перед початком роботи
-            this.FailOnDespawnedNullOrForbidden(TargetIndex.A);
-            this.FailOnBurningImmobile(TargetIndex.A);
-            
-            // Йти до цілі
-            yield return Toils_Goto.GotoThing(TargetIndex.A, PathEndMode.Touch);
-            
-            // Виконати дію
-            yield return new Toil
-            {
-                initAction = delegate
-                {
-                    // Логіка виконання роботи
-                    DoWork();
-                },
-                defaultCompleteMode = ToilCompleteMode.Instant
-            };
-        }
-        
-        private void DoWork()
-        {
-            // Реалізація роботи
-        }
-    }
-}'''
-
-    def get_hediff_template(self):
-        """Шаблон для Hediff класу"""
-        return '''using Verse;
-using RimWorld;
-
-namespace {{ namespace }}
-{
-    /// <summary>
-    /// Ефект здоров'я (хвороба, травма, імплант тощо)
-    /// </summary>
-    public class {{ class_name }} : Hediff
-    {
-        public override void PostAdd(DamageInfo? dinfo)
-        {
-            base.PostAdd(dinfo);
-            // Логіка після додавання ефекту
-        }
-        
-        public override void PostRemoved()
-        {
-            base.PostRemoved();
-            // Логіка після видалення ефекту
-        }
-        
-        public override void Tick()
-        {
-            base.Tick();
-            // Логіка кожен тік
-        }
-        
-        public override bool ShouldRemove => false; // Умова видалення
-        
-        public override string LabelInBrackets => "{{ label }}"; // Мітка в дужках
-    }
-}'''
-
-    def get_mapcomponent_template(self):
-        """Шаблон для MapComponent класу"""
-        return '''using Verse;
-using RimWorld;
-
-namespace {{ namespace }}
-{
-    /// <summary>
-    /// Компонент карти для зберігання даних на рівні карти
-    /// </summary>
-    public class {{ class_name }} : MapComponent
-    {
-        public {{ class_name }}(Map map) : base(map)
-        {
-        }
-        
-        public override void MapComponentTick()
-        {
-            base.MapComponentTick();
-            // Логіка кожен тік карти
-        }
-        
-        public override void ExposeData()
-        {
-            base.ExposeData();
-            // Збереження/завантаження даних карти
-        }
-    }
-}'''
-
-    def get_gamecomponent_template(self):
-        """Шаблон для GameComponent класу"""
-        return '''using Verse;
-using RimWorld;
-
-namespace {{ namespace }}
-{
-    /// <summary>
-    /// Компонент гри для зберігання глобальних даних
-    /// </summary>
-    public class {{ class_name }} : GameComponent
-    {
-        public {{ class_name }}(Game game)
-        {
-        }
-        
-        public override void GameComponentTick()
-        {
-            base.GameComponentTick();
-            // Логіка кожен тік гри
-        }
-        
-        public override void ExposeData()
-        {
-            base.ExposeData();
-            // Збереження/завантаження глобальних даних
-        }
-    }
-}'''
-
-    def get_defof_template(self):
-        """Шаблон для DefOf класу"""
-        return '''using Verse;
-using RimWorld;
-
-namespace {{ namespace }}
-{
-    /// <summary>
-    /// Статичні посилання на дефініції
-    /// </summary>
-    [DefOf]
-    public static class {{ class_name }}
-    {
-        // Приклади посилань на дефініції
-        public static ThingDef {{ thing_def_name }};
-        public static JobDef {{ job_def_name }};
-        public static ResearchProjectDef {{ research_def_name }};
-        
-        static {{ class_name }}()
-        {
-            DefOfHelper.EnsureInitializedInCtor(typeof({{ class_name }}));
-        }
-    }
-}'''
+        return _csharp_templates()
 
     def create_csharp_file(self, template_name, class_name, namespace, file_path):
         """Створення C# файлу з шаблону"""
-        templates = self.get_csharp_templates()
-        
-        if template_name not in templates:
+        if template_name not in _VALID_TEMPLATES:
             raise ValueError(f"Невідомий шаблон: {template_name}")
             
-        template = Template(templates[template_name])
-        content = template.render(
-            class_name=class_name,
-            namespace=namespace,
-            label=class_name.lower(),
-            thing_def_name=f"My{class_name}Thing",
-            job_def_name=f"My{class_name}Job",
-            research_def_name=f"My{class_name}Research"
-        )
+        content = _render(_CSHARP_CLASS_TEMPLATES[template_name], {
+            'class_name': class_name,
+            'namespace': namespace,
+            'label': class_name.lower(),
+            'thing_def_name': f"My{class_name}Thing",
+            'job_def_name': f"My{class_name}Job",
+            'research_def_name': f"My{class_name}Research",
+        })
         
         file_path = Path(file_path)
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.write_text(content, encoding='utf-8')
+        _write_file(file_path, content)
         
         return True
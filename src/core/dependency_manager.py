@@ -6,55 +6,69 @@
 Автоматичне встановлення та перевірка сумісності залежностей
 """
 
+import functools
 import subprocess
+import sys
 import threading
-from typing import Dict, List, Optional, Callable
-from dataclasses import dataclass, field
-from packaging import version
+from collections import deque
+from typing import Dict, List, Optional, Callable, Tuple
+from dataclasses import dataclass
+from packaging.specifiers import SpecifierSet
+from packaging.version import Version
 import importlib.util
+from importlib.metadata import version as distribution_version, PackageNotFoundError
 
-# Локальні імпорти
-try:
-    from utils.simple_logger import get_logger_instance
-except ImportError:
-    # Fallback logger
-    class FallbackLogger:
-        def info(self, msg): print(f"INFO: {msg}")
-        def warning(self, msg): print(f"WARNING: {msg}")
-        def error(self, msg): print(f"ERROR: {msg}")
-        def debug(self, msg): print(f"DEBUG: {msg}")
-    
-    def get_logger_instance():
-        class Logger:
-            def get_logger(self): return FallbackLogger()
-        return Logger()
+def _get_logger():
+    """Логер застосунку або стандартний logging, якщо utils недоступні"""
+    try:
+        from utils.simple_logger import get_logger_instance
+        return get_logger_instance().get_logger()
+    except ImportError:
+        import logging
+        return logging.getLogger("rwmodbuilder.deps")
+
+
+# __slots__ для dataclass доступні з Python 3.10; на старіших версіях звичайний клас
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+# Рядки виводу pip, що передаються в progress_callback як поточний етап
+_PIP_PROGRESS_PREFIXES = ("Collecting", "Downloading", "Installing")
 
+# Скільки останніх рядків виводу pip зберігати для журналу помилок
+_PIP_OUTPUT_TAIL = 50
 
-@dataclass
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class DependencyInfo:
     """Інформація про залежність"""
     name: str
     version_required: str
     version_installed: Optional[str]
     description: str
-    install_command: str
+    pip_requirement: str
     import_name: str
     is_optional: bool = False
-    alternatives: Optional[List[str]] = None
-    
-    def __post_init__(self):
-        if self.alternatives is None:
-            self.alternatives = []
+    alternatives: Tuple[str, ...] = ()
+
+
+@functools.lru_cache(maxsize=None)
+def _version_spec(required: str) -> SpecifierSet:
+    """Розібрана вимога версії (один розбір на кожен рядок вимоги)"""
+    # Якщо немає оператора, припускаємо >=
+    return SpecifierSet(required if required[:1] in "<>=!~" else f">={required}")
 
 
 class DependencyManager:
     """Менеджер залежностей для RimWorld Mod Builder"""
     
     def __init__(self):
-        self.logger = get_logger_instance().get_logger()
+        self.logger = _get_logger()
         self.dependencies = self._define_dependencies()
         self.installation_callbacks: List[Callable] = []
         self.progress_callback: Optional[Callable] = None
+        # Результати перевірок за import_name; скидаються після успішного встановлення
+        self._check_cache: Dict[str, Dict] = {}
         
     def _define_dependencies(self) -> Dict[str, DependencyInfo]:
         """Визначення всіх залежностей проєкту"""
@@ -65,7 +79,7 @@ class DependencyManager:
                 version_required=">=5.2.0",
                 version_installed=None,
                 description="Сучасний GUI фреймворк",
-                install_command="pip install customtkinter>=5.2.0",
+                pip_requirement="customtkinter>=5.2.0",
                 import_name="customtkinter",
                 is_optional=False
             ),
@@ -75,7 +89,7 @@ class DependencyManager:
                 version_required=">=10.0.0",
                 version_installed=None,
                 description="Обробка зображень",
-                install_command="pip install Pillow>=10.0.0",
+                pip_requirement="Pillow>=10.0.0",
                 import_name="PIL",
                 is_optional=False
             ),
@@ -85,7 +99,7 @@ class DependencyManager:
                 version_required=">=4.9.0",
                 version_installed=None,
                 description="XML обробка (опціонально, є альтернатива)",
-                install_command="pip install lxml>=4.9.0",
+                pip_requirement="lxml>=4.9.0",
                 import_name="lxml",
                 is_optional=True  # Змінено на опціональну
             ),
@@ -96,7 +110,7 @@ class DependencyManager:
                 version_required=">=1.9.0",
                 version_installed=None,
                 description="Підтримка PSD файлів",
-                install_command="pip install psd-tools>=1.9.0",
+                pip_requirement="psd-tools>=1.9.0",
                 import_name="psd_tools",
                 is_optional=True
             ),
@@ -106,7 +120,7 @@ class DependencyManager:
                 version_required=">=2.5.0",
                 version_installed=None,
                 description="Підтримка SVG файлів",
-                install_command="pip install cairosvg>=2.5.0",
+                pip_requirement="cairosvg>=2.5.0",
                 import_name="cairosvg",
                 is_optional=True
             ),
@@ -116,7 +130,7 @@ class DependencyManager:
                 version_required=">=2.25.0",
                 version_installed=None,
                 description="Розширені формати зображень (HDR, EXR)",
-                install_command="pip install imageio>=2.25.0",
+                pip_requirement="imageio>=2.25.0",
                 import_name="imageio",
                 is_optional=True
             ),
@@ -126,7 +140,7 @@ class DependencyManager:
                 version_required=">=0.10.0",
                 version_installed=None,
                 description="Підтримка HEIF/HEIC форматів",
-                install_command="pip install pillow-heif>=0.10.0",
+                pip_requirement="pillow-heif>=0.10.0",
                 import_name="pillow_heif",
                 is_optional=True
             ),
@@ -136,7 +150,7 @@ class DependencyManager:
                 version_required=">=5.9.0",
                 version_installed=None,
                 description="Моніторинг системних ресурсів",
-                install_command="pip install psutil>=5.9.0",
+                pip_requirement="psutil>=5.9.0",
                 import_name="psutil",
                 is_optional=True
             ),
@@ -146,7 +160,7 @@ class DependencyManager:
                 version_required=">=21.0",
                 version_installed=None,
                 description="Робота з версіями пакетів",
-                install_command="pip install packaging>=21.0",
+                pip_requirement="packaging>=21.0",
                 import_name="packaging",
                 is_optional=False
             )
@@ -164,9 +178,17 @@ class DependencyManager:
             "errors": []
         }
         
-        for dep_key, dep_info in self.dependencies.items():
+        # Перевірки незалежні, тож виконуються паралельно; помилки повертаються як результат
+        from concurrent.futures import ThreadPoolExecutor
+        
+        dep_infos = list(self.dependencies.values())
+        with ThreadPoolExecutor(max_workers=min(8, len(dep_infos))) as executor:
+            statuses = list(executor.map(self._check_or_error, dep_infos))
+        
+        for dep_info, status in zip(dep_infos, statuses):
             try:
-                status = self._check_single_dependency(dep_info)
+                if isinstance(status, Exception):
+                    raise status
                 
                 if status["installed"]:
                     if status["version_ok"]:
@@ -180,20 +202,20 @@ class DependencyManager:
                             "name": dep_info.name,
                             "version": status["version"],
                             "required": dep_info.version_required,
-                            "install_command": dep_info.install_command
+                            "pip_requirement": dep_info.pip_requirement
                         })
                 else:
                     if dep_info.is_optional:
                         results["optional_missing"].append({
                             "name": dep_info.name,
                             "description": dep_info.description,
-                            "install_command": dep_info.install_command
+                            "pip_requirement": dep_info.pip_requirement
                         })
                     else:
                         results["missing"].append({
                             "name": dep_info.name,
                             "description": dep_info.description,
-                            "install_command": dep_info.install_command
+                            "pip_requirement": dep_info.pip_requirement
                         })
                         
             except Exception as e:
@@ -206,30 +228,36 @@ class DependencyManager:
         self._log_dependency_summary(results)
         return results
     
+    def _check_or_error(self, dep_info: DependencyInfo):
+        """Перевірка залежності для пулу потоків: статус або виняток"""
+        try:
+            return self._check_single_dependency(dep_info)
+        except Exception as e:
+            return e
+    
     def _check_single_dependency(self, dep_info: DependencyInfo) -> Dict:
-        """Перевірка однієї залежності"""
+        """Перевірка однієї залежності (результат кешується до наступного встановлення)"""
+        cached = self._check_cache.get(dep_info.import_name)
+        if cached is None:
+            cached = self._check_cache[dep_info.import_name] = self._probe_dependency(dep_info)
+        return cached
+    
+    def _probe_dependency(self, dep_info: DependencyInfo) -> Dict:
+        """Фактична перевірка залежності: пошук модуля та визначення версії (без імпорту модуля)"""
         try:
-            # Спроба імпорту
+            # Наявність модуля
             spec = importlib.util.find_spec(dep_info.import_name)
             if spec is None:
                 return {"installed": False, "version": None, "version_ok": False}
             
-            # Отримання версії
-            module = importlib.import_module(dep_info.import_name)
-            installed_version = getattr(module, '__version__', None)
-            
-            if installed_version is None:
-                # Спроба альтернативних способів отримання версії
-                try:
-                    import pkg_resources
-                    installed_version = pkg_resources.get_distribution(dep_info.name.lower()).version
-                except:
-                    installed_version = "unknown"
+            # Версія з метаданих встановленого пакета
+            try:
+                installed_version = distribution_version(dep_info.name)
+            except PackageNotFoundError:
+                installed_version = "unknown"
             
             # Перевірка версії
-            version_ok = self._check_version_compatibility(
-                installed_version, dep_info.version_required
-            )
+            version_ok = self._check_version_compatibility(installed_version, dep_info)
             
             return {
                 "installed": True,
@@ -243,28 +271,16 @@ class DependencyManager:
             self.logger.warning(f"Помилка перевірки {dep_info.name}: {e}")
             return {"installed": False, "version": None, "version_ok": False}
     
-    def _check_version_compatibility(self, installed: str, required: str) -> bool:
+    def _check_version_compatibility(self, installed: str, dep_info: DependencyInfo) -> bool:
         """Перевірка сумісності версій"""
         if installed == "unknown":
             return True  # Припускаємо сумісність якщо версія невідома
         
         try:
-            # Парсинг вимог версії (>=, ==, >, <, тощо)
-            if required.startswith(">="):
-                return version.parse(installed) >= version.parse(required[2:])
-            elif required.startswith("=="):
-                return version.parse(installed) == version.parse(required[2:])
-            elif required.startswith(">"):
-                return version.parse(installed) > version.parse(required[1:])
-            elif required.startswith("<="):
-                return version.parse(installed) <= version.parse(required[2:])
-            elif required.startswith("<"):
-                return version.parse(installed) < version.parse(required[1:])
-            else:
-                # Якщо немає оператора, припускаємо >=
-                return version.parse(installed) >= version.parse(required)
+            # prereleases=True: попередні версії порівнюються як звичайні
+            return _version_spec(dep_info.version_required).contains(Version(installed), prereleases=True)
         except Exception as e:
-            self.logger.warning(f"Помилка порівняння версій {installed} vs {required}: {e}")
+            self.logger.warning(f"Помилка порівняння версій {installed} vs {dep_info.version_required}: {e}")
             return True  # Припускаємо сумісність при помилці
     
     def _log_dependency_summary(self, results: Dict):
@@ -311,58 +327,97 @@ class DependencyManager:
             "failed": []
         }
         
-        for i, dep in enumerate(to_install):
-            if self.progress_callback:
-                progress = (i / len(to_install)) * 100
-                self.progress_callback(progress, f"Встановлення {dep['name']}...")
-            
-            success = self._install_single_dependency(dep["install_command"])
-            
-            if success:
-                results["installed"].append(dep["name"])
-                self.logger.info(f"✅ {dep['name']} встановлено успішно")
-            else:
-                results["failed"].append(dep["name"])
-                results["success"] = False
-                self.logger.error(f"❌ Не вдалося встановити {dep['name']}")
+        # Один виклик pip для всіх пакетів: спільне розв'язання залежностей і один запуск pip
+        if self.progress_callback:
+            self.progress_callback(0, f"Встановлення {len(to_install)} залежностей...")
+        
+        requirements = [dep["pip_requirement"] for dep in to_install]
+        if self._run_pip_install(requirements, timeout=300 * len(to_install)):
+            results["installed"] = [dep["name"] for dep in to_install]
+            self.logger.info(f"✅ Встановлено: {', '.join(results['installed'])}")
+        else:
+            # Пакетне встановлення не вдалося: встановлюємо по одному, щоб знайти проблемні пакети
+            self.logger.warning("Пакетне встановлення не вдалося, встановлення по одному...")
+            for i, dep in enumerate(to_install):
+                if self.progress_callback:
+                    progress = (i / len(to_install)) * 100
+                    self.progress_callback(progress, f"Встановлення {dep['name']}...")
+                
+                success = self._install_single_dependency(dep["pip_requirement"])
+                
+                if success:
+                    results["installed"].append(dep["name"])
+                    self.logger.info(f"✅ {dep['name']} встановлено успішно")
+                else:
+                    results["failed"].append(dep["name"])
+                    results["success"] = False
+                    self.logger.error(f"❌ Не вдалося встановити {dep['name']}")
         
         if self.progress_callback:
             self.progress_callback(100, "Завершено!")
         
         return results
     
-    def _install_single_dependency(self, install_command: str) -> bool:
+    def _install_single_dependency(self, pip_requirement: str) -> bool:
         """Встановлення однієї залежності"""
+        return self._run_pip_install([pip_requirement], timeout=300)
+    
+    def _run_pip_install(self, requirements: List[str], timeout: int) -> bool:
+        """Запуск pip поточного інтерпретатора для списку вимог"""
         try:
-            self.logger.debug(f"Виконання команди: {install_command}")
+            # pip через sys.executable: той самий Python, без пошуку pip у PATH
+            # Вимоги передаються окремими аргументами, без розбору рядка команди
+            cmd_parts = [sys.executable, "-m", "pip", "install",
+                         "--disable-pip-version-check", "--no-input", *requirements]
+            self.logger.debug(f"Виконання команди: {' '.join(cmd_parts)}")
             
-            # Розділення команди на частини
-            cmd_parts = install_command.split()
+            # Вивід читається построково: у пам'яті лише хвіст, етапи передаються одразу
+            output_tail = deque(maxlen=_PIP_OUTPUT_TAIL)
+            timed_out = threading.Event()
             
-            # Виконання команди
-            result = subprocess.run(
+            with subprocess.Popen(
                 cmd_parts,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
-                timeout=300  # 5 хвилин таймаут
-            )
+                errors="replace",
+                bufsize=1
+            ) as process:
+                def kill_on_timeout():
+                    timed_out.set()
+                    process.kill()
+                
+                timer = threading.Timer(timeout, kill_on_timeout)
+                timer.start()
+                try:
+                    for line in process.stdout:
+                        output_tail.append(line)
+                        if self.progress_callback and line.startswith(_PIP_PROGRESS_PREFIXES):
+                            self.progress_callback(None, line.strip())
+                    returncode = process.wait()
+                finally:
+                    timer.cancel()
             
-            if result.returncode == 0:
+            if timed_out.is_set():
+                self.logger.error(f"Таймаут встановлення ({timeout // 60} хв)")
+                return False
+            
+            if returncode == 0:
+                # Встановлення могло змінити й інші пакети, тож перевіряємо все заново
+                self._check_cache.clear()
                 return True
             else:
-                self.logger.error(f"Помилка встановлення: {result.stderr}")
+                self.logger.error(f"Помилка встановлення: {''.join(output_tail)}")
                 return False
                 
-        except subprocess.TimeoutExpired:
-            self.logger.error("Таймаут встановлення (5 хвилин)")
-            return False
         except Exception as e:
             self.logger.error(f"Помилка виконання команди: {e}")
             return False
     
-    def get_installation_suggestions(self) -> List[Dict]:
-        """Отримання рекомендацій по встановленню"""
-        status = self.check_all_dependencies()
+    def get_installation_suggestions(self, status: Optional[Dict] = None) -> List[Dict]:
+        """Отримання рекомендацій по встановленню (можна передати вже отриманий статус)"""
+        if status is None:
+            status = self.check_all_dependencies()
         suggestions = []
         
         # Критичні залежності
@@ -418,15 +473,21 @@ class DependencyManager:
         return thread
 
 
-# Глобальний екземпляр менеджера залежностей
-_dependency_manager = None
+# Перше звернення до `manager` може статися одночасно з кількох потоків - екземпляр має бути один
+_manager_lock = threading.Lock()
+
 
-def get_dependency_manager() -> DependencyManager:
-    """Отримання глобального екземпляра менеджера залежностей"""
-    global _dependency_manager
-    if _dependency_manager is None:
-        _dependency_manager = DependencyManager()
-    return _dependency_manager
+def __getattr__(name: str):
+    """Глобальний екземпляр менеджера залежностей (`manager`), створюється при першому зверненні"""
+    if name == "manager":
+        with _manager_lock:
+            # Інший потік міг створити екземпляр, поки цей чекав на блокування
+            instance = globals().get("manager")
+            if instance is None:
+                # Після запису в globals() наступні звернення не доходять до __getattr__
+                instance = globals()["manager"] = DependencyManager()
+        return instance
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
@@ -442,6 +503,6 @@ if __name__ == "__main__":
             print(f"{category}: {len(items)} елементів")
     
     print("\n💡 Рекомендації:")
-    suggestions = manager.get_installation_suggestions()
+    suggestions = manager.get_installation_suggestions(status)
     for suggestion in suggestions:
         print(f"- {suggestion['title']}: {suggestion['description']}")
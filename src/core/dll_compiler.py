@@ -4,12 +4,21 @@
 Підтримує компіляцію C# проєктів в DLL файли для RimWorld модів
 """
 
+import functools
+import glob
+import hashlib
+import itertools
+import json
+import os
+import tempfile
+import re
 import subprocess
 import shutil
+import threading
 import time
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict, field
 
 # Локальні імпорти
 try:
@@ -44,9 +53,284 @@ except ImportError as e:
     SystemInfoAlternative = MockSystemInfo
 
 
-@dataclass
+# Властивості PropertyGroup, що читаються з .csproj, і відповідні ключі project_info
+_CSPROJ_PROPERTIES = {
+    "TargetFramework": "target_framework",
+    "OutputType": "output_type",
+    "AssemblyName": "assembly_name",
+    "OutputPath": "output_path",
+}
+
+
+# Тимчасові папки старих bin/obj до фонового видалення (якщо на тому ж томі, що й проєкт)
+_TRASH_DIR = Path.home() / ".cache" / "rwmodbuilder" / "trash"
+_TRASH_PREFIX = ".rwmb-clean-"
+
+# Кеш зібраних DLL між запусками (ключ - входи збірки, налаштування та інструменти)
+_BUILD_CACHE_DIR = Path.home() / ".cache" / "rwmodbuilder" / "builds"
+
+# Одиниці розміру файлу, кожна наступна в 1024 (2**10) рази більша
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# Тайм-аут однієї компіляції, секунд
+_COMPILATION_TIMEOUT = 300
+
+# Одночасних збірок у пакетній компіляції: кожна вже розпаралелена MSBuild (-maxcpucount, /m),
+# тож більше кількох лише перевантажує процесор і вузли MSBuild
+_MAX_PARALLEL_BUILDS = 2
+
+# Постійний сервер MSBuild (.NET 7+): повторні збірки йдуть у вже прогрітий процес.
+# Не викликайте `dotnet build-server shutdown` між збірками — це знищує прогріті вузли.
+_MSBUILD_SERVER_ENV = {"DOTNET_CLI_USE_MSBUILD_SERVER": "1"}
+
+# Рядки виводу збірки, що передаються в callbacks під час компіляції: готова збірка, помилки компілятора
+_BUILD_PROGRESS_RE = re.compile(r' -> |: error [A-Z]+\d+:')
+
+# Папки з результатами збірки (obj містить згенеровані .cs), що не входять у ключ кешу
+_BUILD_OUTPUT_DIRS = frozenset({"bin", "obj"})
+
+# Відбиток входів останньої успішної збірки (у obj проєкту) для перевірки актуальності DLL
+_UP_TO_DATE_STAMP = "rwmb-inputs.json"
+
+# Файли, які MSBuild підхоплює автоматично з папок над проєктом
+_DIRECTORY_BUILD_FILES = ("Directory.Build.props", "Directory.Build.targets", "Directory.Packages.props")
+
+# Елементи .csproj, чий Include вказує на вхідний файл збірки (Reference обробляється через HintPath)
+_CSPROJ_INPUT_ITEMS = frozenset({"Compile", "EmbeddedResource", "Content", "None", "Resource"})
+
+# Посилання на властивість MSBuild: $(Name)
+_MSBUILD_PROPERTY_RE = re.compile(r'\$\((\w+)\)')
+
+
+@functools.lru_cache(maxsize=None)
+def _cleanup_executor():
+    """Спільний пул для фонового видалення старих bin/obj (завершується разом з програмою)"""
+    from concurrent.futures import ThreadPoolExecutor
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="rwmb-clean")
+
+
+def _trash_parent(project_dir: Path) -> Path:
+    """Папка для тимчасового перенесення bin/obj: кеш користувача, якщо він на тому ж томі
+    (os.rename між томами неможливий), інакше - папка над проєктом"""
+    try:
+        _TRASH_DIR.mkdir(parents=True, exist_ok=True)
+        if os.stat(_TRASH_DIR).st_dev == os.stat(project_dir).st_dev:
+            return _TRASH_DIR
+    except OSError:
+        pass
+    return project_dir.parent
+
+
+def _sweep_stale_trash(*folders: Path):
+    """Фонове видалення тимчасових папок, що лишилися після аварійного завершення чи виходу посеред видалення"""
+    for folder in folders:
+        try:
+            with os.scandir(folder) as entries:
+                stale = [entry.path for entry in entries
+                         if entry.name.startswith(_TRASH_PREFIX) and entry.is_dir(follow_symlinks=False)]
+        except OSError:
+            continue
+        for path in stale:
+            _cleanup_executor().submit(shutil.rmtree, path, ignore_errors=True)
+
+
+def _hash_file(path: Path) -> bytes:
+    """Хеш вмісту файлу (blake2b) без читання всього файлу в один об'єкт bytes"""
+    with open(path, "rb") as f:
+        # Python 3.11+: читання і хешування в C без проміжних копій
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "blake2b").digest()
+        
+        digest = hashlib.blake2b()
+        buffer = bytearray(256 * 1024)
+        view = memoryview(buffer)
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            digest.update(view[:size])
+        return digest.digest()
+
+
+@functools.lru_cache(maxsize=None)
+def _etree():
+    """lxml.etree (libxml2), якщо встановлено; інакше стандартний ElementTree з тим самим API iterparse"""
+    try:
+        from lxml import etree
+        return etree
+    except ImportError:
+        import xml.etree.ElementTree as ET
+        return ET
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_csproj_cached(path_str: str, mtime_ns: int, size: int) -> Tuple[Tuple[Tuple[str, str], ...], Tuple[str, ...]]:
+    """Розбір .csproj за один прохід: (властивості, залежності).
+
+    mtime_ns і size входять у ключ кешу, тож змінений файл розбирається заново.
+    """
+    properties = []
+    package_refs = []
+    references = []
+    parents = []
+
+    for event, elem in _etree().iterparse(path_str, events=("start", "end")):
+        if event == "start":
+            # Атрибути доступні вже на початку елемента
+            if parents:
+                if elem.tag == "PackageReference":
+                    include = elem.get("Include")
+                    if include:
+                        version = elem.get("Version")
+                        package_refs.append(f"{include} ({version})" if version else include)
+                elif elem.tag == "Reference":
+                    include = elem.get("Include")
+                    if include:
+                        references.append(include)
+            parents.append(elem.tag)
+        else:
+            parents.pop()
+            # Текст елемента відомий лише в кінці; пізніші значення перекривають попередні
+            key = _CSPROJ_PROPERTIES.get(elem.tag)
+            if key and elem.text and len(parents) > 1 and parents[-1] == "PropertyGroup":
+                properties.append((key, elem.text))
+            # Оброблений елемент більше не потрібен: пам'ять не росте з розміром файлу
+            elem.clear()
+
+    return tuple(properties), tuple(package_refs + references)
+
+
+def _local_tag(elem) -> Optional[str]:
+    """Назва елемента без простору імен MSBuild (None для коментарів та інструкцій обробки)"""
+    tag = elem.tag
+    return tag.rpartition("}")[2] if isinstance(tag, str) else None
+
+
+def _is_floating_version(version: str) -> bool:
+    """Плаваюча версія NuGet (1.*, [1.0,2.0)): розв'язаний пакет може змінитися без змін у .csproj"""
+    return "*" in version or "," in version or version[:1] in "[("
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_csproj_inputs(path_str: str, mtime_ns: int, size: int) -> Optional[Tuple[Tuple[str, ...], Tuple[Tuple[str, str], ...]]]:
+    """Шляхи вхідних файлів із .csproj (HintPath, Include елементів, Import) і властивості для їх розкриття.
+
+    None, якщо набір входів не визначається з самого файлу: ProjectReference або плаваючі версії пакетів.
+    """
+    paths = []
+    properties = []
+    for elem in _etree().parse(path_str).getroot().iter():
+        tag = _local_tag(elem)
+        if tag is None:
+            continue
+        if tag == "ProjectReference":
+            return None
+        if tag == "PackageReference":
+            version = elem.get("Version") or ""
+            if _is_floating_version(version.strip()):
+                return None
+        elif tag == "HintPath" and elem.text:
+            paths.append(elem.text.strip())
+        elif tag in _CSPROJ_INPUT_ITEMS and elem.get("Include"):
+            paths.extend(item.strip() for item in elem.get("Include").split(";") if item.strip())
+        elif tag == "Import" and elem.get("Project"):
+            paths.append(elem.get("Project").strip())
+        elif tag == "PropertyGroup":
+            # Пізніші значення перекривають попередні (умови Condition не обчислюються)
+            properties.extend(
+                (_local_tag(child), child.text.strip()) for child in elem
+                if _local_tag(child) and child.text
+            )
+    return tuple(paths), tuple(properties)
+
+
+def _expand_msbuild_path(raw: str, properties: Dict[str, str]) -> str:
+    """Розкриття $(Name) з властивостей .csproj і змінних середовища; невідомі посилання лишаються як є"""
+    def replace(match):
+        name = match.group(1)
+        return properties.get(name, os.environ.get(name, match.group(0)))
+    
+    # Два проходи: значення властивостей самі можуть посилатися на інші властивості
+    for _ in range(2):
+        raw = _MSBUILD_PROPERTY_RE.sub(replace, raw)
+    return raw.replace("\\", os.sep)
+
+
+def _collect_build_inputs(csproj_file: Path, project_dir: Path) -> Optional[Tuple[List[Path], List[Tuple[str, Optional[int], Optional[int]]]]]:
+    """Входи збірки: (файли проєкту без bin/obj і прихованих папок, зовнішні входи як (шлях, розмір, mtime_ns)).
+
+    Зовнішні входи - Directory.Build.* у батьківських папках, HintPath збірок (RimWorld, Harmony),
+    Import і елементи з Include поза папкою проєкту. None, якщо входи неможливо визначити надійно.
+    """
+    stat = csproj_file.stat()
+    parsed = _parse_csproj_inputs(str(csproj_file), stat.st_mtime_ns, stat.st_size)
+    if parsed is None:
+        return None
+    raw_paths, raw_properties = parsed
+    
+    # Файли проєкту: усе, крім виводу збірки й службових папок (.vs, .git)
+    project_files = []
+    pending = [(project_dir, True)]
+    while pending:
+        folder, top_level = pending.pop()
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if not entry.name.startswith(".") and not (top_level and entry.name in _BUILD_OUTPUT_DIRS):
+                        pending.append((Path(entry.path), False))
+                elif entry.is_file():
+                    project_files.append(Path(entry.path))
+    
+    properties = dict(raw_properties)
+    properties.setdefault("MSBuildProjectDirectory", str(project_dir))
+    properties.setdefault("MSBuildThisFileDirectory", str(project_dir) + os.sep)
+    
+    candidates = set()
+    for folder in project_dir.parents:
+        candidates.update(folder / name for name in _DIRECTORY_BUILD_FILES)
+    
+    unresolved = []
+    for raw in raw_paths:
+        expanded = _expand_msbuild_path(raw, properties)
+        if _MSBUILD_PROPERTY_RE.search(expanded):
+            # Властивість задається поза .csproj (SDK, командний рядок): шлях враховується як текст
+            unresolved.append(raw)
+            continue
+        path = Path(expanded)
+        if not path.is_absolute():
+            path = project_dir / path
+        if glob.has_magic(str(path)):
+            candidates.update(map(Path, glob.iglob(str(path), recursive=True)))
+        else:
+            candidates.add(path)
+    
+    external = [(raw, None, None) for raw in unresolved]
+    for path in candidates:
+        path = Path(os.path.normpath(path))
+        # Файли всередині проєкту вже враховані за вмістом
+        if path == project_dir or project_dir in path.parents:
+            continue
+        try:
+            path_stat = path.stat()
+            external.append((str(path), path_stat.st_size, path_stat.st_mtime_ns))
+        except OSError:
+            # Відсутній файл теж є станом: поява файлу змінить ключ
+            external.append((str(path), None, None))
+    
+    external.sort(key=lambda item: item[0])
+    return project_files, external
+
+
+def _parse_csproj(csproj_file: Path) -> Tuple[Dict[str, str], List[str]]:
+    """Властивості та залежності .csproj з кешу (ключ - шлях, час зміни та розмір файлу)"""
+    stat = csproj_file.stat()
+    properties, dependencies = _parse_csproj_cached(str(csproj_file), stat.st_mtime_ns, stat.st_size)
+    return dict(properties), list(dependencies)
+
+
+@dataclass(frozen=True)
 class CompilationSettings:
-    """Налаштування компіляції DLL"""
+    """Налаштування компіляції DLL (незмінні, тож придатні як ключ кешу)"""
     configuration: str = "Release"  # Release, Debug
     platform: str = "AnyCPU"  # AnyCPU, x86, x64
     target_framework: str = "net472"  # net472, net48
@@ -57,6 +341,38 @@ class CompilationSettings:
     optimize_code: bool = True
     treat_warnings_as_errors: bool = False
     verbosity: str = "minimal"  # quiet, minimal, normal, detailed, diagnostic
+    use_build_cache: bool = False  # Повторне використання DLL, якщо входи збірки не змінилися (лише без clean_before_build)
+    skip_if_up_to_date: bool = False  # Без збірки, якщо входи не змінилися з останньої збірки (лише без clean_before_build)
+
+
+@functools.lru_cache(maxsize=32)
+def _build_static_args(settings: CompilationSettings, dotnet_cli: bool) -> Tuple[str, ...]:
+    """Аргументи команди компіляції після шляху .csproj (залежать лише від налаштувань та інструмента)"""
+    args = [
+        "--configuration", settings.configuration,
+        "--verbosity", settings.verbosity
+    ]
+
+    # Додаткові параметри для dotnet CLI
+    if dotnet_cli:
+        # Паралельна збірка на всіх ядрах; вузли MSBuild лишаються живими між збірками
+        args.extend(["-maxcpucount", "-nodeReuse:true"])
+        if settings.output_path:
+            args.extend(["--output", settings.output_path])
+    else:
+        # Параметри для MSBuild
+        args.extend([
+            f"/p:Configuration={settings.configuration}",
+            f"/p:Platform={settings.platform}",
+            f"/verbosity:{settings.verbosity}",
+            "/m",
+            "/nodeReuse:true"
+        ])
+
+        if settings.output_path:
+            args.append(f"/p:OutputPath={settings.output_path}")
+
+    return tuple(args)
 
 
 @dataclass
@@ -64,19 +380,42 @@ class CompilationResult:
     """Результат компіляції"""
     success: bool
     dll_path: Optional[str] = None
-    output_messages: Optional[List[str]] = None
-    error_messages: Optional[List[str]] = None
-    warnings: Optional[List[str]] = None
+    output_messages: List[str] = field(default_factory=list)
+    error_messages: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
     compilation_time: float = 0.0
     dll_size: int = 0
 
-    def __post_init__(self):
-        if self.output_messages is None:
-            self.output_messages = []
-        if self.error_messages is None:
-            self.error_messages = []
-        if self.warnings is None:
-            self.warnings = []
+
+@dataclass
+class CompilationSummary:
+    """Зведення компіляції, що оновлюється по одному результату (наприклад, щойно завершився проєкт)"""
+    total_projects: int = 0
+    successful: int = 0
+    failed: int = 0
+    total_dll_size: int = 0
+    total_compilation_time: float = 0.0
+
+    def add(self, result: CompilationResult):
+        """Додавання результату одного проєкту"""
+        self.total_projects += 1
+        self.total_compilation_time += result.compilation_time
+        if result.success:
+            self.successful += 1
+            self.total_dll_size += result.dll_size
+        else:
+            self.failed += 1
+
+    def as_dict(self) -> Dict:
+        """Зведення у форматі get_compilation_summary"""
+        return {
+            "total_projects": self.total_projects,
+            "successful": self.successful,
+            "failed": self.failed,
+            "total_dll_size": self.total_dll_size,
+            "total_compilation_time": self.total_compilation_time,
+            "success_rate": (self.successful / self.total_projects) * 100 if self.total_projects else 0
+        }
 
 
 class DLLCompiler:
@@ -87,18 +426,44 @@ class DLLCompiler:
         self.logger = get_logger_instance().get_logger()
         self.system_info = SystemInfoAlternative()
         self.compilation_callbacks: List[Callable] = []
+        # Проєкти можуть компілюватися паралельно, а callbacks часто оновлюють UI
+        self._callbacks_lock = threading.Lock()
+        # Пакетна компіляція: назва проєкту потоку-збирача та загальний прогрес пакета
+        self._batch = threading.local()
+        self._batch_progress = 0.0
         
+    @functools.cached_property
+    def _dotnet_available(self) -> bool:
+        """Доступність .NET середовища (перевіряється один раз на компілятор)"""
+        return self.dotnet_env.is_available()
+    
+    @functools.cached_property
+    def _dotnet_path(self):
+        """Шлях dotnet CLI з середовища (None, якщо недоступний)"""
+        return getattr(self.dotnet_env, 'dotnet_path', None)
+    
+    @functools.cached_property
+    def _msbuild_path(self):
+        """Шлях MSBuild з середовища (None, якщо недоступний)"""
+        return getattr(self.dotnet_env, 'msbuild_path', None)
+    
     def add_compilation_callback(self, callback: Callable):
         """Додавання callback для відстеження прогресу компіляції"""
         self.compilation_callbacks.append(callback)
     
     def _notify_callbacks(self, message: str, progress: float = 0.0):
         """Сповіщення callbacks про прогрес"""
-        for callback in self.compilation_callbacks:
-            try:
-                callback(message, progress)
-            except Exception as e:
-                self.logger.error(f"Помилка callback: {e}")
+        with self._callbacks_lock:
+            # У пакетній збірці повідомлення позначаються проєктом, а прогрес лишається загальним
+            project_name = getattr(self._batch, "project_name", None)
+            if project_name is not None:
+                message, progress = f"[{project_name}] {message}", self._batch_progress
+            
+            for callback in self.compilation_callbacks:
+                try:
+                    callback(message, progress)
+                except Exception as e:
+                    self.logger.error(f"Помилка callback: {e}")
     
     def compile_dll(self, project_path: str, settings: Optional[CompilationSettings] = None) -> CompilationResult:
         """Компіляція C# проєкту в DLL"""
@@ -107,88 +472,14 @@ class DLLCompiler:
 
         start_time = time.time()
         result = CompilationResult(success=False)
-        # Ініціалізація списків
-        result.output_messages = []
-        result.error_messages = []
-        result.warnings = []
         
         try:
-            # Перевірка .NET середовища
-            if not self.dotnet_env.is_available():
-                result.error_messages.append("❌ .NET середовище недоступне")
-                return result
-            
-            # Перевірка проєкту
-            project_path_obj = Path(project_path)
-            if not project_path_obj.exists():
-                result.error_messages.append(f"❌ Проєкт не знайдено: {project_path}")
-                return result
-
-            # Визначення типу проєкту
-            if project_path_obj.is_file() and project_path_obj.suffix == '.csproj':
-                csproj_file = project_path_obj
-                project_dir = project_path_obj.parent
-            elif project_path_obj.is_dir():
-                csproj_files = list(project_path_obj.glob("*.csproj"))
-                if not csproj_files:
-                    result.error_messages.append(f"❌ .csproj файл не знайдено в {project_path}")
-                    return result
-                csproj_file = csproj_files[0]
-                project_dir = project_path_obj
-            else:
-                result.error_messages.append(f"❌ Невірний шлях проєкту: {project_path}")
-                return result
-            
-            self._notify_callbacks("🔍 Аналіз проєкту...", 10)
-            
-            # Аналіз проєкту
-            project_info = self._analyze_project(csproj_file)
-            result.output_messages.append(f"📁 Проєкт: {project_info['name']}")
-            result.output_messages.append(f"🎯 Target Framework: {project_info['target_framework']}")
-            
-            # Очищення якщо потрібно
-            if settings.clean_before_build:
-                self._notify_callbacks("🗑️ Очищення проєкту...", 20)
-                self._clean_project(project_dir)
-            
-            # Підготовка команди компіляції
-            self._notify_callbacks("⚙️ Підготовка компіляції...", 30)
-            cmd = self._build_compilation_command(csproj_file, settings)
-            
-            # Компіляція
-            self._notify_callbacks("🔨 Компіляція DLL...", 40)
-            compilation_success, output, errors = self._execute_compilation(cmd, project_dir)
-            
-            # Обробка результатів
-            result.output_messages.extend(output)
-            result.error_messages.extend(errors)
-            
-            if compilation_success:
-                self._notify_callbacks("✅ Пошук DLL файлу...", 80)
-                
-                # Пошук створеного DLL
-                dll_path = self._find_compiled_dll(project_dir, project_info['name'], settings)
-                
-                if dll_path and dll_path.exists():
-                    result.success = True
-                    result.dll_path = str(dll_path)
-                    result.dll_size = dll_path.stat().st_size
-                    
-                    # Копіювання в папку Assemblies якщо потрібно
-                    if settings.copy_to_assemblies:
-                        self._notify_callbacks("📦 Копіювання в Assemblies...", 90)
-                        assemblies_path = self._copy_to_assemblies(dll_path, project_dir)
-                        if assemblies_path:
-                            result.output_messages.append(f"📦 DLL скопійовано в: {assemblies_path}")
-                    
-                    result.output_messages.append(f"✅ DLL створено: {dll_path}")
-                    result.output_messages.append(f"📊 Розмір: {self._format_file_size(result.dll_size)}")
-                    
-                    self._notify_callbacks("🎉 Компіляція завершена успішно!", 100)
-                else:
-                    result.error_messages.append("❌ DLL файл не знайдено після компіляції")
-            else:
-                result.error_messages.append("❌ Компіляція завершилася з помилками")
+            job = self._prepare_compilation(project_path, settings, result)
+            if job is not None:
+                # Компіляція
+                self._notify_callbacks("🔨 Компіляція DLL...", 40)
+                compilation = self._execute_compilation(job["cmd"], job["project_dir"])
+                self._process_compilation(result, job, settings, *compilation)
             
         except Exception as e:
             result.error_messages.append(f"❌ Виняток під час компіляції: {e}")
@@ -199,6 +490,276 @@ class DLLCompiler:
             
         return result
     
+    def _prepare_compilation(self, project_path: str, settings: CompilationSettings,
+                             result: CompilationResult) -> Optional[Dict]:
+        """Перевірки, аналіз проєкту, кеш збірок і команда компіляції.
+
+        Повертає None, якщо результат уже остаточний (помилка або DLL з кешу).
+        """
+        # Перевірка .NET середовища
+        if not self._dotnet_available:
+            result.error_messages.append("❌ .NET середовище недоступне")
+            return None
+        
+        # Перевірка проєкту
+        project_path_obj = Path(project_path)
+        if not project_path_obj.exists():
+            result.error_messages.append(f"❌ Проєкт не знайдено: {project_path}")
+            return None
+
+        # Визначення типу проєкту
+        if project_path_obj.is_file() and project_path_obj.suffix == '.csproj':
+            csproj_file = project_path_obj
+            project_dir = project_path_obj.parent
+        elif project_path_obj.is_dir():
+            csproj_files = list(project_path_obj.glob("*.csproj"))
+            if not csproj_files:
+                result.error_messages.append(f"❌ .csproj файл не знайдено в {project_path}")
+                return None
+            csproj_file = csproj_files[0]
+            project_dir = project_path_obj
+        else:
+            result.error_messages.append(f"❌ Невірний шлях проєкту: {project_path}")
+            return None
+        
+        self._notify_callbacks("🔍 Аналіз проєкту...", 10)
+        
+        # Аналіз проєкту
+        project_info = self._analyze_project(csproj_file)
+        result.output_messages.extend((
+            f"📁 Проєкт: {project_info['name']}",
+            f"🎯 Target Framework: {project_info['target_framework']}"
+        ))
+        
+        # Входи збірки не змінилися з останньої успішної збірки: вона нічого не змінить
+        # (clean_before_build вимагає повної збірки)
+        inputs_fingerprint = None
+        if settings.skip_if_up_to_date:
+            inputs_fingerprint = self._compute_inputs_fingerprint(csproj_file, project_dir, settings)
+        if inputs_fingerprint and not settings.clean_before_build:
+            current_dll = self._find_up_to_date_dll(inputs_fingerprint, project_dir, project_info, settings)
+            if current_dll:
+                result.output_messages.append("✅ DLL актуальний, компіляція не потрібна")
+                self._complete_compilation(result, current_dll, project_dir, settings)
+                return None
+        
+        # Кеш збірок: якщо входи збірки і налаштування не змінилися, компіляція не потрібна
+        # (clean_before_build означає явний запит на повну збірку)
+        build_key = None
+        if settings.use_build_cache and not settings.clean_before_build:
+            build_key = self._compute_build_key(csproj_file, project_dir, settings)
+        if build_key:
+            cached_dll = self._restore_cached_build(build_key, project_dir, project_info['name'], settings)
+            if cached_dll:
+                result.output_messages.append("♻️ DLL взято з кешу збірок (входи збірки не змінилися)")
+                self._complete_compilation(result, cached_dll, project_dir, settings)
+                return None
+        
+        # Очищення якщо потрібно
+        if settings.clean_before_build:
+            self._notify_callbacks("🗑️ Очищення проєкту...", 20)
+            # Нові bin і obj створюються заново, тож чекати на видалення старих не потрібно
+            self._clean_project_async(project_dir)
+        
+        # Підготовка команди компіляції
+        self._notify_callbacks("⚙️ Підготовка компіляції...", 30)
+        cmd = self._build_compilation_command(csproj_file, settings)
+        
+        return {
+            "project_dir": project_dir,
+            "project_info": project_info,
+            "build_key": build_key,
+            "inputs_fingerprint": inputs_fingerprint,
+            "cmd": cmd
+        }
+    
+    def _process_compilation(self, result: CompilationResult, job: Dict, settings: CompilationSettings,
+                             compilation_success: bool, output: List[str], errors: List[str]):
+        """Обробка результатів компіляції: пошук DLL, кеш збірок, копіювання"""
+        result.output_messages.extend(output)
+        result.error_messages.extend(errors)
+        
+        if compilation_success:
+            self._notify_callbacks("✅ Пошук DLL файлу...", 80)
+            
+            # Пошук створеного DLL
+            dll_path = self._find_compiled_dll(job["project_dir"], job["project_info"]['name'], settings,
+                                               job["project_info"].get("output_path"))
+            
+            if dll_path and dll_path.exists():
+                if job["build_key"]:
+                    self._store_cached_build(job["build_key"], dll_path)
+                if job["inputs_fingerprint"]:
+                    self._write_up_to_date_stamp(job["inputs_fingerprint"], job["project_dir"], dll_path)
+                self._complete_compilation(result, dll_path, job["project_dir"], settings)
+            else:
+                result.error_messages.append("❌ DLL файл не знайдено після компіляції")
+        else:
+            result.error_messages.append("❌ Компіляція завершилася з помилками")
+    
+    def _complete_compilation(self, result: CompilationResult, dll_path: Path, project_dir: Path,
+                              settings: CompilationSettings):
+        """Заповнення результату для готового DLL і копіювання в Assemblies"""
+        result.success = True
+        result.dll_path = str(dll_path)
+        result.dll_size = dll_path.stat().st_size
+        
+        # Копіювання в папку Assemblies якщо потрібно
+        if settings.copy_to_assemblies:
+            self._notify_callbacks("📦 Копіювання в Assemblies...", 90)
+            assemblies_path = self._copy_to_assemblies(dll_path, project_dir)
+            if assemblies_path:
+                result.output_messages.append(f"📦 DLL скопійовано в: {assemblies_path}")
+        
+        result.output_messages.extend((
+            f"✅ DLL створено: {dll_path}",
+            f"📊 Розмір: {self._format_file_size(result.dll_size)}"
+        ))
+        
+        self._notify_callbacks("🎉 Компіляція завершена успішно!", 100)
+    
+    def _build_toolchain(self) -> Dict:
+        """Інструменти збірки, від яких залежить результат"""
+        return {
+            "dotnet": self._dotnet_path,
+            "msbuild": self._msbuild_path,
+            "sdks": getattr(self.dotnet_env, "sdk_versions", None),
+        }
+    
+    def _compute_build_key(self, csproj_file: Path, project_dir: Path, settings: CompilationSettings) -> Optional[str]:
+        """Ключ кешу збірки: вміст файлів проєкту, зовнішні входи MSBuild, налаштування і середовище .NET.
+
+        None, якщо входи збірки неможливо визначити надійно - тоді кеш не використовується.
+        """
+        try:
+            inputs = _collect_build_inputs(csproj_file, project_dir)
+        except Exception as e:
+            self.logger.warning(f"Не вдалося визначити входи збірки: {e}")
+            return None
+        if inputs is None:
+            return None
+        project_files, external = inputs
+        
+        # Файли хешуються паралельно: hashlib відпускає GIL на великих блоках даних
+        from concurrent.futures import ThreadPoolExecutor
+        
+        with ThreadPoolExecutor(max_workers=min(8, len(project_files) or 1)) as executor:
+            file_hashes = list(executor.map(_hash_file, project_files))
+        
+        digest = hashlib.blake2b(digest_size=20)
+        sources = sorted(
+            (project_file.relative_to(project_dir).as_posix(), file_hash)
+            for project_file, file_hash in zip(project_files, file_hashes)
+        )
+        for relative, file_hash in sources:
+            digest.update(relative.encode("utf-8") + b"\0" + file_hash)
+        
+        # Зовнішні збірки (Assembly-CSharp, 0Harmony) враховуються за розміром і часом зміни
+        digest.update(json.dumps([asdict(settings), self._build_toolchain(), external],
+                                 sort_keys=True, default=str).encode("utf-8"))
+        return digest.hexdigest()
+    
+    def _expected_dll_path(self, project_dir: Path, project_name: str, settings: CompilationSettings) -> Path:
+        """Стандартний шлях DLL для налаштувань збірки"""
+        if settings.output_path:
+            return Path(settings.output_path) / f"{project_name}.dll"
+        return project_dir / "bin" / settings.configuration / settings.target_framework / f"{project_name}.dll"
+    
+    def _compute_inputs_fingerprint(self, csproj_file: Path, project_dir: Path,
+                                    settings: CompilationSettings) -> Optional[str]:
+        """Відбиток входів збірки за розміром і часом зміни файлів (без читання вмісту).
+
+        Враховує набір файлів проєкту (видалений файл теж змінює відбиток), зовнішні входи MSBuild,
+        налаштування і середовище .NET. None, якщо входи неможливо визначити надійно.
+        """
+        try:
+            inputs = _collect_build_inputs(csproj_file, project_dir)
+            if inputs is None:
+                return None
+            project_files, external = inputs
+            
+            sources = []
+            for project_file in project_files:
+                file_stat = project_file.stat()
+                sources.append((project_file.relative_to(project_dir).as_posix(), file_stat.st_size, file_stat.st_mtime_ns))
+            sources.sort()
+        except Exception as e:
+            self.logger.warning(f"Не вдалося визначити входи збірки: {e}")
+            return None
+        
+        payload = json.dumps([sources, external, asdict(settings), self._build_toolchain()], sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=20).hexdigest()
+    
+    def _find_up_to_date_dll(self, inputs_fingerprint: str, project_dir: Path, project_info: Dict,
+                             settings: CompilationSettings) -> Optional[Path]:
+        """DLL останньої збірки, якщо її входи збігаються з поточними і сам DLL не змінено; інакше None"""
+        try:
+            with open(project_dir / "obj" / _UP_TO_DATE_STAMP, 'r', encoding='utf-8') as f:
+                stamp = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if not isinstance(stamp, dict) or stamp.get("inputs") != inputs_fingerprint:
+            return None
+        
+        # DLL шукається так само, як після збірки, і має бути тим самим файлом
+        dll_path = self._find_compiled_dll(project_dir, project_info['name'], settings, project_info.get("output_path"))
+        if dll_path is None or os.path.normcase(str(dll_path)) != os.path.normcase(stamp.get("dll_path", "")):
+            return None
+        try:
+            dll_stat = dll_path.stat()
+        except OSError:
+            return None
+        if (dll_stat.st_size, dll_stat.st_mtime_ns) != (stamp.get("dll_size"), stamp.get("dll_mtime_ns")):
+            return None
+        
+        return dll_path
+    
+    def _write_up_to_date_stamp(self, inputs_fingerprint: str, project_dir: Path, dll_path: Path):
+        """Запис відбитка входів успішної збірки для наступної перевірки актуальності"""
+        try:
+            dll_stat = dll_path.stat()
+            stamp = {
+                "inputs": inputs_fingerprint,
+                "dll_path": str(dll_path),
+                "dll_size": dll_stat.st_size,
+                "dll_mtime_ns": dll_stat.st_mtime_ns
+            }
+            stamp_dir = project_dir / "obj"
+            stamp_dir.mkdir(exist_ok=True)
+            with open(stamp_dir / _UP_TO_DATE_STAMP, 'w', encoding='utf-8') as f:
+                json.dump(stamp, f, ensure_ascii=False)
+        except OSError as e:
+            self.logger.warning(f"Не вдалося записати відбиток збірки: {e}")
+    
+    def _restore_cached_build(self, build_key: str, project_dir: Path, project_name: str,
+                              settings: CompilationSettings) -> Optional[Path]:
+        """Копіювання DLL з кешу збірок у папку виводу проєкту; None, якщо в кеші немає"""
+        cached_dll = _BUILD_CACHE_DIR / f"{build_key}.dll"
+        if not cached_dll.is_file():
+            return None
+        
+        target = self._expected_dll_path(project_dir, project_name, settings)
+        
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(cached_dll, target)
+            return target
+        except Exception as e:
+            self.logger.warning(f"Не вдалося відновити DLL з кешу: {e}")
+            return None
+    
+    def _store_cached_build(self, build_key: str, dll_path: Path):
+        """Збереження зібраного DLL у кеш збірок"""
+        try:
+            _BUILD_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # Запис у тимчасовий файл і атомарна заміна: паралельні збірки не бачать неповного файлу
+            temp_path = _BUILD_CACHE_DIR / f"{build_key}.{os.getpid()}.{threading.get_ident()}.tmp"
+            shutil.copy2(dll_path, temp_path)
+            os.replace(temp_path, _BUILD_CACHE_DIR / f"{build_key}.dll")
+        except Exception as e:
+            self.logger.warning(f"Не вдалося зберегти DLL у кеш: {e}")
+    
     def _analyze_project(self, csproj_file: Path) -> Dict:
         """Аналіз .csproj файлу"""
         project_info = {
@@ -209,140 +770,182 @@ class DLLCompiler:
         }
         
         try:
-            import xml.etree.ElementTree as ET
-            tree = ET.parse(csproj_file)
-            root = tree.getroot()
-            
-            # Пошук PropertyGroup
-            for prop_group in root.findall(".//PropertyGroup"):
-                for child in prop_group:
-                    if child.tag == "TargetFramework" and child.text:
-                        project_info["target_framework"] = child.text
-                    elif child.tag == "OutputType" and child.text:
-                        project_info["output_type"] = child.text
-                    elif child.tag == "AssemblyName" and child.text:
-                        project_info["assembly_name"] = child.text
+            properties, _ = _parse_csproj(csproj_file)
+            project_info.update(properties)
                         
         except Exception as e:
             self.logger.warning(f"Не вдалося проаналізувати .csproj: {e}")
         
         return project_info
     
-    def _clean_project(self, project_dir: Path):
-        """Очищення проєкту"""
-        clean_dirs = ["bin", "obj"]
+    def _clean_project_async(self, project_dir: Path):
+        """Очищення проєкту: bin і obj миттєво переносяться убік, а видаляються у фоновому потоці.
+
+        Повертає Future видалення (None, якщо переносити нічого).
+        """
+        moved = []
+        trash_dir = None
+        trash_parent = _trash_parent(project_dir)
+        
+        # Залишки попередніх очищень видаляються до створення нової тимчасової папки
+        _sweep_stale_trash(*{trash_parent, project_dir.parent})
         
-        for clean_dir in clean_dirs:
+        for clean_dir in ("bin", "obj"):
             dir_path = project_dir / clean_dir
-            if dir_path.exists():
+            if not dir_path.exists():
+                continue
+            try:
+                # Поза папкою проєкту: інакше SDK-проєкт підхопив би згенеровані .cs зі старого obj
+                if trash_dir is None:
+                    trash_dir = tempfile.mkdtemp(prefix=_TRASH_PREFIX, dir=trash_parent)
+                os.rename(dir_path, os.path.join(trash_dir, clean_dir))
+                moved.append(dir_path)
+            except OSError:
+                # Перенесення неможливе (наприклад, файл заблоковано) - синхронне видалення
                 try:
                     shutil.rmtree(dir_path)
                     self.logger.info(f"🗑️ Очищено: {dir_path}")
                 except Exception as e:
                     self.logger.warning(f"Не вдалося очистити {dir_path}: {e}")
+        
+        if trash_dir is None:
+            return None
+        
+        for dir_path in moved:
+            self.logger.info(f"🗑️ Очищено: {dir_path}")
+        return _cleanup_executor().submit(shutil.rmtree, trash_dir, ignore_errors=True)
     
     def _build_compilation_command(self, csproj_file: Path, settings: CompilationSettings) -> List[str]:
         """Побудова команди компіляції"""
-        cmd: List[str] = []
-
-        # Використання dotnet CLI або MSBuild
-        if hasattr(self.dotnet_env, 'dotnet_path') and self.dotnet_env.dotnet_path:
-            cmd = [str(self.dotnet_env.dotnet_path), "build"]
-        elif hasattr(self.dotnet_env, 'msbuild_path') and self.dotnet_env.msbuild_path:
-            cmd = [str(self.dotnet_env.msbuild_path)]
+        prefix = self._command_prefix()
+        # Аргументи після .csproj однакові для всіх проєктів з тими самими налаштуваннями
+        dotnet_cli = "dotnet" in prefix[0]
+        return [*prefix, str(csproj_file), *_build_static_args(settings, dotnet_cli)]
+    
+    def _command_prefix(self) -> List[str]:
+        """Інструмент збірки: dotnet CLI або MSBuild"""
+        if self._dotnet_path:
+            return [str(self._dotnet_path), "build"]
+        elif self._msbuild_path:
+            return [str(self._msbuild_path)]
         else:
             raise Exception("Ні dotnet CLI, ні MSBuild недоступні")
-
-        # Додавання параметрів
-        cmd.append(str(csproj_file))
-        cmd.extend([
-            "--configuration", settings.configuration,
-            "--verbosity", settings.verbosity
-        ])
-
-        # Додаткові параметри для dotnet CLI
-        if len(cmd) > 0 and "dotnet" in str(cmd[0]):
-            if settings.output_path:
-                cmd.extend(["--output", settings.output_path])
-        else:
-            # Параметри для MSBuild
-            cmd.extend([
-                f"/p:Configuration={settings.configuration}",
-                f"/p:Platform={settings.platform}",
-                f"/verbosity:{settings.verbosity}"
-            ])
-
-            if settings.output_path:
-                cmd.append(f"/p:OutputPath={settings.output_path}")
-
-        return cmd
+    
+    @staticmethod
+    def _build_environment(cmd: List[str]) -> Dict[str, str]:
+        """Змінні середовища збірки: для dotnet CLI вмикається сервер MSBuild (явне значення користувача має пріоритет)"""
+        env = dict(os.environ)
+        if "dotnet" in Path(cmd[0]).name.lower():
+            for key, value in _MSBUILD_SERVER_ENV.items():
+                env.setdefault(key, value)
+        return env
     
     def _execute_compilation(self, cmd: List[str], working_dir: Path) -> Tuple[bool, List[str], List[str]]:
-        """Виконання команди компіляції"""
+        """Виконання команди компіляції (вивід читається построково під час збірки)"""
+        output_lines: List[str] = []
+        error_lines: List[str] = []
+        
+        def collect(stream, lines: List[str]):
+            # Один прохід: лише непорожні рядки без пробілів по краях
+            for line in stream:
+                line = line.strip()
+                if line:
+                    lines.append(line)
+        
         try:
-            result = subprocess.run(
+            with subprocess.Popen(
                 cmd,
                 cwd=working_dir,
-                capture_output=True,
+                env=self._build_environment(cmd),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True,
-                timeout=300  # 5 хвилин timeout
-            )
-            
-            output_lines = result.stdout.split('\n') if result.stdout else []
-            error_lines = result.stderr.split('\n') if result.stderr else []
+                errors="replace",
+                bufsize=1
+            ) as process:
+                timed_out = threading.Event()
+                
+                def kill_on_timeout():
+                    timed_out.set()
+                    process.kill()
+                
+                timer = threading.Timer(_COMPILATION_TIMEOUT, kill_on_timeout)
+                timer.start()
+                # stderr читається в окремому потоці, щоб переповнений канал не зупинив процес
+                stderr_reader = threading.Thread(target=collect, args=(process.stderr, error_lines), daemon=True)
+                stderr_reader.start()
+                try:
+                    for line in process.stdout:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        output_lines.append(line)
+                        if _BUILD_PROGRESS_RE.search(line):
+                            self._notify_callbacks(f"🔨 {line}", 60)
+                    returncode = process.wait()
+                    stderr_reader.join()
+                finally:
+                    timer.cancel()
             
-            # Фільтрація порожніх рядків
-            output_lines = [line.strip() for line in output_lines if line.strip()]
-            error_lines = [line.strip() for line in error_lines if line.strip()]
+            if timed_out.is_set():
+                return False, output_lines, error_lines + [f"❌ Timeout компіляції ({_COMPILATION_TIMEOUT // 60} хвилин)"]
             
-            success = result.returncode == 0
+            success = returncode == 0
             
             return success, output_lines, error_lines
             
-        except subprocess.TimeoutExpired:
-            return False, [], ["❌ Timeout компіляції (5 хвилин)"]
         except Exception as e:
             return False, [], [f"❌ Помилка виконання: {e}"]
     
-    def _find_compiled_dll(self, project_dir: Path, project_name: str, settings: CompilationSettings) -> Optional[Path]:
-        """Пошук скомпільованого DLL файлу"""
+    def _find_compiled_dll(self, project_dir: Path, project_name: str, settings: CompilationSettings,
+                           project_output: Optional[str] = None) -> Optional[Path]:
+        """Пошук скомпільованого DLL файлу (project_output - OutputPath з .csproj, якщо задано)"""
+        dll_name = f"{project_name}.dll"
+        bin_dir = os.path.join(project_dir, "bin")
         possible_paths = [
-            project_dir / "bin" / settings.configuration / settings.target_framework / f"{project_name}.dll",
-            project_dir / "bin" / settings.configuration / f"{project_name}.dll",
-            project_dir / "bin" / f"{project_name}.dll",
+            os.path.join(bin_dir, settings.configuration, settings.target_framework, dll_name),
+            os.path.join(bin_dir, settings.configuration, dll_name),
+            os.path.join(bin_dir, dll_name),
         ]
         
+        # OutputPath з .csproj (наприклад ..\..\Assemblies у згенерованих модах); шляхи з $(...) не розкриваються
+        if project_output and "$(" not in project_output:
+            output_dir = os.path.normpath(os.path.join(project_dir, project_output.replace("\\", os.sep)))
+            possible_paths[:0] = [
+                os.path.join(output_dir, dll_name),
+                os.path.join(output_dir, settings.target_framework, dll_name),
+            ]
+        
         if settings.output_path:
-            possible_paths.insert(0, Path(settings.output_path) / f"{project_name}.dll")
+            possible_paths.insert(0, os.path.join(settings.output_path, dll_name))
         
+        # Рядкові шляхи й os.path.isfile: один stat на кандидата без проміжних Path
         for dll_path in possible_paths:
-            if dll_path.exists():
-                return dll_path
+            if os.path.isfile(dll_path):
+                return Path(dll_path)
         
-        # Пошук будь-якого .dll файлу в bin папці
-        bin_dir = project_dir / "bin"
-        if bin_dir.exists():
-            for dll_file in bin_dir.rglob("*.dll"):
-                if project_name.lower() in dll_file.name.lower():
-                    return dll_file
+        if os.path.isdir(bin_dir):
+            # Спершу DLL з точною назвою в будь-якій підпапці bin (пошук зупиняється на першому збігу)
+            escaped_bin = glob.escape(bin_dir)
+            for dll_path in glob.iglob(os.path.join(escaped_bin, "**", glob.escape(dll_name)), recursive=True):
+                return Path(dll_path)
+            
+            # Потім будь-який .dll з назвою проєкту в імені
+            name_lower = project_name.lower()
+            for dll_path in glob.iglob(os.path.join(escaped_bin, "**", "*.dll"), recursive=True):
+                if name_lower in os.path.basename(dll_path).lower():
+                    return Path(dll_path)
         
         return None
     
     def _copy_to_assemblies(self, dll_path: Path, project_dir: Path) -> Optional[Path]:
         """Копіювання DLL в папку Assemblies мода"""
-        # Пошук папки Assemblies
-        assemblies_dir = None
-
-        # Спочатку шукаємо в батьківських папках
-        current_dir = project_dir
-        for _ in range(5):  # Максимум 5 рівнів вгору
-            assemblies_candidate = current_dir / "Assemblies"
-            if assemblies_candidate.exists():
-                assemblies_dir = assemblies_candidate
-                break
-            current_dir = current_dir.parent
-            if current_dir == current_dir.parent:  # Досягли кореня
-                break
+        # Спочатку шукаємо в папці проєкту та батьківських папках (максимум 5 рівнів вгору)
+        candidates = itertools.chain((project_dir,), itertools.islice(project_dir.parents, 5))
+        assemblies_dir = next(
+            (folder / "Assemblies" for folder in candidates if (folder / "Assemblies").is_dir()),
+            None
+        )
 
         # Якщо не знайшли, створюємо поруч з Source
         if not assemblies_dir:
@@ -354,7 +957,16 @@ class DLLCompiler:
         if assemblies_dir:
             target_path = assemblies_dir / dll_path.name
             try:
-                shutil.copy2(dll_path, target_path)
+                # copy2 зберігає час зміни, тож той самий розмір і час означають вже скопійований DLL
+                source_stat = dll_path.stat()
+                try:
+                    target_stat = target_path.stat()
+                    up_to_date = (target_stat.st_size == source_stat.st_size
+                                  and target_stat.st_mtime_ns == source_stat.st_mtime_ns)
+                except FileNotFoundError:
+                    up_to_date = False
+                if not up_to_date:
+                    shutil.copy2(dll_path, target_path)
                 return target_path
             except Exception as e:
                 self.logger.error(f"Помилка копіювання DLL: {e}")
@@ -366,75 +978,71 @@ class DLLCompiler:
         dependencies = []
 
         try:
-            import xml.etree.ElementTree as ET
-            tree = ET.parse(csproj_file)
-            root = tree.getroot()
-
-            # PackageReference
-            for package_ref in root.findall(".//PackageReference"):
-                include = package_ref.get("Include")
-                version = package_ref.get("Version")
-                if include:
-                    dep_info = f"{include}"
-                    if version:
-                        dep_info += f" ({version})"
-                    dependencies.append(dep_info)
-
-            # Reference
-            for ref in root.findall(".//Reference"):
-                include = ref.get("Include")
-                if include:
-                    dependencies.append(include)
+            # PackageReference, потім Reference
+            _, dependencies = _parse_csproj(csproj_file)
 
         except Exception as e:
             self.logger.warning(f"Не вдалося отримати залежності: {e}")
 
         return dependencies
     
-    def _format_file_size(self, size_bytes: int) -> str:
+    @staticmethod
+    def _format_file_size(size_bytes: int) -> str:
         """Форматування розміру файлу"""
-        size = float(size_bytes)
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size < 1024.0:
-                return f"{size:.1f} {unit}"
-            size /= 1024.0
-        return f"{size:.1f} TB"
+        if size_bytes < 1024:
+            return f"{size_bytes:.1f} B"
+        # Номер одиниці - кількість повних груп по 10 біт у розмірі
+        unit_index = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        return f"{size_bytes / (1 << (unit_index * 10)):.1f} {_SIZE_UNITS[unit_index]}"
 
     def compile_multiple_projects(self, project_paths: List[str], settings: Optional[CompilationSettings] = None) -> List[CompilationResult]:
         """Компіляція кількох проєктів"""
         if settings is None:
             settings = CompilationSettings()
 
-        results = []
+        if not project_paths:
+            return []
 
-        for i, project_path in enumerate(project_paths):
-            self._notify_callbacks(f"🔨 Компіляція проєкту {i+1}/{len(project_paths)}: {Path(project_path).name}",
-                                 (i / len(project_paths)) * 100)
+        from concurrent.futures import ThreadPoolExecutor, as_completed
 
-            result = self.compile_dll(project_path, settings)
-            results.append(result)
+        # Проєкти незалежні: кожен компілюється в окремому процесі dotnet/MSBuild
+        total = len(project_paths)
+        max_workers = min(total, _MAX_PARALLEL_BUILDS)
+        self._batch_progress = 0.0
+        
+        def compile_in_batch(project_path: str) -> CompilationResult:
+            self._batch.project_name = Path(project_path).name
+            try:
+                return self.compile_dll(project_path, settings)
+            finally:
+                self._batch.project_name = None
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(compile_in_batch, project_path): project_path
+                       for project_path in project_paths}
             
-            if not result.success:
-                self.logger.error(f"Помилка компіляції {project_path}: {result.error_messages}")
+            for done, future in enumerate(as_completed(futures), 1):
+                project_path = futures[future]
+                with self._callbacks_lock:
+                    self._batch_progress = (done / total) * 100
+                self._notify_callbacks(f"🔨 Скомпільовано проєктів {done}/{total}: {Path(project_path).name}",
+                                     self._batch_progress)
+                
+                result = future.result()
+                if not result.success:
+                    self.logger.error(f"Помилка компіляції {project_path}: {result.error_messages}")
+            
+            # Результати в порядку вхідних шляхів
+            results = [future.result() for future in futures]
         
         return results
     
     def get_compilation_summary(self, results: List[CompilationResult]) -> Dict:
         """Отримання зведення компіляції"""
-        successful = [r for r in results if r.success]
-        failed = [r for r in results if not r.success]
-        
-        total_size = sum(r.dll_size for r in successful)
-        total_time = sum(r.compilation_time for r in results)
-        
-        return {
-            "total_projects": len(results),
-            "successful": len(successful),
-            "failed": len(failed),
-            "total_dll_size": total_size,
-            "total_compilation_time": total_time,
-            "success_rate": (len(successful) / len(results)) * 100 if results else 0
-        }
+        summary = CompilationSummary()
+        for result in results:
+            summary.add(result)
+        return summary.as_dict()
 
 
 # Функції для зворотної сумісності
@@ -6,6 +6,8 @@
 Підтримка C# компонентів, компіляції та .NET бібліотек
 """
 
+import functools
+import hashlib
 import os
 import sys
 import subprocess
@@ -31,6 +33,40 @@ except ImportError:
         return Logger()
 
 
+# Кеш результатів виявлення .NET між запусками (ключ - PATH, mtime dotnet і папок встановлених SDK/runtime)
+_ENV_CACHE_FILE = Path.home() / ".cache" / "rwmodbuilder" / "dotnet_env.json"
+_ENV_CACHE_VERSION = 2
+
+# Папки встановлення dotnet, що змінюються при встановленні або видаленні SDK і runtime
+_DOTNET_INSTALL_DIRS = ("sdk", os.path.join("shared", "Microsoft.NETCore.App"))
+
+# Максимальний час однієї перевірки (зависла утиліта не блокує запуск програми)
+_PROBE_TIMEOUT = 10
+
+
+def _path_digest() -> str:
+    """Стабільний між запусками хеш PATH (вбудований hash() рандомізується для рядків)"""
+    return hashlib.blake2b(os.environ.get("PATH", "").encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+
+
+def _file_mtime_ns(path: Optional[str]) -> Optional[int]:
+    """mtime файлу в наносекундах; None, якщо файлу немає"""
+    if not path:
+        return None
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _dotnet_install_signature(dotnet_path: Optional[str]) -> List[Optional[int]]:
+    """mtime папок sdk і shared/Microsoft.NETCore.App поруч із dotnet (PATH часто містить лише symlink)"""
+    if not dotnet_path:
+        return []
+    dotnet_root = os.path.dirname(os.path.realpath(dotnet_path))
+    return [_file_mtime_ns(os.path.join(dotnet_root, folder)) for folder in _DOTNET_INSTALL_DIRS]
+
+
 class DotNetEnvironment:
     """Клас для роботи з .NET середовищем"""
     
@@ -40,41 +76,109 @@ class DotNetEnvironment:
         self.msbuild_path = None
         self.framework_versions = []
         self.sdk_versions = []
+        # Перевірка завершилася помилкою або тайм-аутом: такий результат не кешується
+        self._probe_failed = False
         
         self._detect_environment()
     
     def _detect_environment(self):
-        """Виявлення .NET середовища"""
+        """Виявлення .NET середовища (з дискового кешу, якщо він ще дійсний)"""
+        if self._load_cache():
+            # MSBuild міг з'явитися після запису кешу (Visual Studio, Build Tools)
+            if not self.msbuild_path:
+                self.msbuild_path = self._find_msbuild()
+                if self.msbuild_path and not self._probe_failed:
+                    self._save_cache()
+            self.logger.info(f"✅ .NET середовище з кешу: dotnet={self.dotnet_path}, MSBuild={self.msbuild_path}")
+            return
+        
         try:
-            # Пошук dotnet CLI
+            from concurrent.futures import ThreadPoolExecutor
+            
+            # Пошук dotnet CLI (від нього залежать решта перевірок)
             self.dotnet_path = self._find_executable("dotnet")
             if self.dotnet_path:
                 self.logger.info(f"✅ Знайдено dotnet CLI: {self.dotnet_path}")
-                self._get_sdk_versions()
             
-            # Пошук MSBuild
-            self.msbuild_path = self._find_msbuild()
+            # SDK, MSBuild і Framework перевіряються окремими процесами - запускаємо їх одночасно.
+            # Кожна перевірка пише лише у власне поле, тож синхронізація не потрібна.
+            with ThreadPoolExecutor(max_workers=3, thread_name_prefix="rwmb-dotnet") as executor:
+                sdk_future = executor.submit(self._get_sdk_versions)
+                msbuild_future = executor.submit(self._find_msbuild)
+                framework_future = executor.submit(self._detect_framework_versions)
+                
+                sdk_future.result()
+                self.msbuild_path = msbuild_future.result()
+                framework_future.result()
+            
             if self.msbuild_path:
                 self.logger.info(f"✅ Знайдено MSBuild: {self.msbuild_path}")
             
-            # Виявлення Framework версій
-            self._detect_framework_versions()
-            
         except Exception as e:
             self.logger.error(f"Помилка виявлення .NET середовища: {e}")
+            return
+        
+        if self._probe_failed:
+            self.logger.warning("⚠️ Не всі перевірки .NET завершилися, результат не кешується")
+            return
+        self._save_cache()
     
-    def _find_executable(self, name: str) -> Optional[str]:
-        """Пошук виконуваного файлу"""
+    def _load_cache(self) -> bool:
+        """Відновлення результатів виявлення з кешу; False, якщо кешу немає або він застарів"""
         try:
-            result = subprocess.run(
-                ["where" if os.name == "nt" else "which", name],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            return result.stdout.strip().split('\n')[0]
-        except:
-            return None
+            with open(_ENV_CACHE_FILE, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        
+        if not isinstance(data, dict) or data.get("version") != _ENV_CACHE_VERSION:
+            return False
+        if data.get("path_digest") != _path_digest():
+            return False
+        
+        # Оновлений або видалений dotnet робить кеш недійсним
+        dotnet_path = data.get("dotnet_path")
+        if _file_mtime_ns(dotnet_path) != data.get("dotnet_mtime_ns"):
+            return False
+        # Встановлений або видалений SDK/runtime змінює mtime відповідної папки
+        if _dotnet_install_signature(dotnet_path) != data.get("install_signature"):
+            return False
+        
+        msbuild_path = data.get("msbuild_path")
+        if msbuild_path and not msbuild_path.endswith(" msbuild") and not os.path.exists(msbuild_path):
+            return False
+        
+        self.dotnet_path = dotnet_path
+        self.msbuild_path = msbuild_path
+        self.sdk_versions = list(data.get("sdk_versions", []))
+        self.framework_versions = list(data.get("framework_versions", []))
+        return True
+    
+    def _save_cache(self):
+        """Збереження результатів виявлення у кеш"""
+        data = {
+            "version": _ENV_CACHE_VERSION,
+            "path_digest": _path_digest(),
+            "dotnet_path": self.dotnet_path,
+            "dotnet_mtime_ns": _file_mtime_ns(self.dotnet_path),
+            "install_signature": _dotnet_install_signature(self.dotnet_path),
+            "msbuild_path": self.msbuild_path,
+            "sdk_versions": self.sdk_versions,
+            "framework_versions": self.framework_versions
+        }
+        try:
+            _ENV_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            # Запис у тимчасовий файл і атомарна заміна: інший процес не прочитає неповний JSON
+            temp_path = _ENV_CACHE_FILE.with_name(f"{_ENV_CACHE_FILE.name}.{os.getpid()}.tmp")
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_path, _ENV_CACHE_FILE)
+        except OSError as e:
+            self.logger.warning(f"Не вдалося зберегти кеш .NET середовища: {e}")
+    
+    def _find_executable(self, name: str) -> Optional[str]:
+        """Пошук виконуваного файлу в PATH (без запуску where/which)"""
+        return shutil.which(name)
     
     def _find_msbuild(self) -> Optional[str]:
         """Пошук MSBuild"""
@@ -99,11 +203,15 @@ class DotNetEnvironment:
                     [self.dotnet_path, "msbuild", "--version"],
                     capture_output=True,
                     text=True,
-                    check=True
+                    check=True,
+                    timeout=_PROBE_TIMEOUT
                 )
                 return f"{self.dotnet_path} msbuild"
-            except:
+            except subprocess.CalledProcessError:
+                # dotnet без MSBuild - це результат перевірки, а не збій
                 pass
+            except Exception:
+                self._probe_failed = True
         
         return None
     
@@ -117,7 +225,8 @@ class DotNetEnvironment:
                 [self.dotnet_path, "--list-sdks"],
                 capture_output=True,
                 text=True,
-                check=True
+                check=True,
+                timeout=_PROBE_TIMEOUT
             )
             
             for line in result.stdout.strip().split('\n'):
@@ -128,6 +237,7 @@ class DotNetEnvironment:
             self.logger.info(f"✅ Знайдено .NET SDK версії: {', '.join(self.sdk_versions)}")
             
         except Exception as e:
+            self._probe_failed = True
             self.logger.warning(f"Не вдалося отримати версії SDK: {e}")
     
     def _detect_framework_versions(self):
@@ -140,15 +250,10 @@ class DotNetEnvironment:
                 framework_key = r"SOFTWARE\Microsoft\NET Framework Setup\NDP"
                 try:
                     with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, framework_key) as key:
-                        i = 0
-                        while True:
-                            try:
-                                subkey_name = winreg.EnumKey(key, i)
-                                if subkey_name.startswith("v"):
-                                    self.framework_versions.append(subkey_name)
-                                i += 1
-                            except WindowsError:
-                                break
+                        # Кількість підключів відома наперед - без винятку як умови виходу з циклу
+                        subkey_count = winreg.QueryInfoKey(key)[0]
+                        subkey_names = [winreg.EnumKey(key, i) for i in range(subkey_count)]
+                    self.framework_versions.extend(name for name in subkey_names if name.startswith("v"))
                 except:
                     pass
             
@@ -159,7 +264,8 @@ class DotNetEnvironment:
                         [self.dotnet_path, "--list-runtimes"],
                         capture_output=True,
                         text=True,
-                        check=True
+                        check=True,
+                        timeout=_PROBE_TIMEOUT
                     )
                     
                     for line in result.stdout.strip().split('\n'):
@@ -170,13 +276,14 @@ class DotNetEnvironment:
                                 if version not in self.framework_versions:
                                     self.framework_versions.append(f"Core {version}")
                 
-                except:
-                    pass
+                except Exception:
+                    self._probe_failed = True
             
             if self.framework_versions:
                 self.logger.info(f"✅ Знайдено .NET Framework версії: {', '.join(self.framework_versions)}")
             
         except Exception as e:
+            self._probe_failed = True
             self.logger.warning(f"Не вдалося виявити версії Framework: {e}")
     
     def is_available(self) -> bool:
@@ -196,64 +303,8 @@ class DotNetEnvironment:
         }
 
 
-class CSharpCompiler:
-    """Компілятор C# коду для RimWorld модів"""
-    
-    def __init__(self, dotnet_env: DotNetEnvironment):
-        self.dotnet_env = dotnet_env
-        self.logger = get_logger_instance().get_logger()
-        
-        # Шляхи до RimWorld бібліотек
-        self.rimworld_libs = self._find_rimworld_libs()
-    
-    def _find_rimworld_libs(self) -> List[str]:
-        """Пошук бібліотек RimWorld"""
-        possible_paths = [
-            r"C:\Program Files (x86)\Steam\steamapps\common\RimWorld\RimWorldWin64_Data\Managed",
-            r"C:\Program Files\Steam\steamapps\common\RimWorld\RimWorldWin64_Data\Managed",
-            r"D:\Steam\steamapps\common\RimWorld\RimWorldWin64_Data\Managed",
-            r"E:\Steam\steamapps\common\RimWorld\RimWorldWin64_Data\Managed"
-        ]
-        
-        for path in possible_paths:
-            if os.path.exists(path):
-                libs = []
-                for file in os.listdir(path):
-                    if file.endswith('.dll'):
-                        libs.append(os.path.join(path, file))
-                
-                if libs:
-                    self.logger.info(f"✅ Знайдено RimWorld бібліотеки: {path}")
-                    return libs
-        
-        self.logger.warning("⚠️ RimWorld бібліотеки не знайдено")
-        return []
-    
-    def create_csharp_project(self, project_name: str, output_dir: str) -> str:
-        """Створення C# проєкту для RimWorld мода"""
-        project_dir = os.path.join(output_dir, project_name)
-        os.makedirs(project_dir, exist_ok=True)
-        
-        # Створення .csproj файлу
-        csproj_content = self._generate_csproj(project_name)
-        csproj_path = os.path.join(project_dir, f"{project_name}.csproj")
-        
-        with open(csproj_path, 'w', encoding='utf-8') as f:
-            f.write(csproj_content)
-        
-        # Створення базового C# файлу
-        cs_content = self._generate_base_cs(project_name)
-        cs_path = os.path.join(project_dir, f"{project_name}.cs")
-        
-        with open(cs_path, 'w', encoding='utf-8') as f:
-            f.write(cs_content)
-        
-        self.logger.info(f"✅ C# проєкт створено: {project_dir}")
-        return project_dir
-    
-    def _generate_csproj(self, project_name: str) -> str:
-        """Генерація .csproj файлу"""
-        return f'''<?xml version="1.0" encoding="utf-8"?>
+# Шаблони нового C# проєкту (синтаксис str.format, тож $(...) MSBuild не потребують екранування)
+_CSPROJ_TEMPLATE = '''<?xml version="1.0" encoding="utf-8"?>
 <Project ToolsVersion="15.0" xmlns="http://schemas.microsoft.com/developer/msbuild/2003">
   <Import Project="$(MSBuildExtensionsPath)\\$(MSBuildToolsVersion)\\Microsoft.Common.props" Condition="Exists('$(MSBuildExtensionsPath)\\$(MSBuildToolsVersion)\\Microsoft.Common.props')" />
   <PropertyGroup>
@@ -314,10 +365,8 @@ class CSharpCompiler:
   </ItemGroup>
   <Import Project="$(MSBuildToolsPath)\\Microsoft.CSharp.targets" />
 </Project>'''
-    
-    def _generate_base_cs(self, project_name: str) -> str:
-        """Генерація базового C# файлу"""
-        return f'''using System;
+
+_BASE_CS_TEMPLATE = '''using System;
 using System.Collections.Generic;
 using System.Linq;
 using System.Text;
@@ -336,7 +385,7 @@ namespace {project_name}
             Log.Message("[{project_name}] Mod loaded successfully!");
             
             // Ініціалізація Harmony
-            var harmony = new Harmony("{project_name.lower()}.mod");
+            var harmony = new Harmony("{project_lower}.mod");
             harmony.PatchAll();
         }}
     }}
@@ -351,6 +400,83 @@ namespace {project_name}
         }}
     }}
 }}'''
+
+
+@functools.lru_cache(maxsize=32)
+def _render_csproj(project_name: str) -> str:
+    """Вміст .csproj для проєкту (повторні виклики з тією ж назвою беруться з кешу)"""
+    return _CSPROJ_TEMPLATE.format_map({"project_name": project_name})
+
+
+@functools.lru_cache(maxsize=32)
+def _render_base_cs(project_name: str) -> str:
+    """Вміст базового C# файлу для проєкту"""
+    return _BASE_CS_TEMPLATE.format_map({"project_name": project_name, "project_lower": project_name.lower()})
+
+
+class CSharpCompiler:
+    """Компілятор C# коду для RimWorld модів"""
+    
+    def __init__(self, dotnet_env: DotNetEnvironment):
+        self.dotnet_env = dotnet_env
+        self.logger = get_logger_instance().get_logger()
+        
+        # Шляхи до RimWorld бібліотек
+        self.rimworld_libs = self._find_rimworld_libs()
+    
+    def _find_rimworld_libs(self) -> List[str]:
+        """Пошук бібліотек RimWorld"""
+        possible_paths = [
+            r"C:\Program Files (x86)\Steam\steamapps\common\RimWorld\RimWorldWin64_Data\Managed",
+            r"C:\Program Files\Steam\steamapps\common\RimWorld\RimWorldWin64_Data\Managed",
+            r"D:\Steam\steamapps\common\RimWorld\RimWorldWin64_Data\Managed",
+            r"E:\Steam\steamapps\common\RimWorld\RimWorldWin64_Data\Managed"
+        ]
+        
+        for path in possible_paths:
+            # scandir повертає готові шляхи і тип запису без окремого stat для кожного файлу
+            try:
+                with os.scandir(path) as entries:
+                    libs = [entry.path for entry in entries if entry.name.endswith('.dll') and entry.is_file()]
+            except OSError:
+                continue
+            
+            if libs:
+                self.logger.info(f"✅ Знайдено RimWorld бібліотеки: {path}")
+                return libs
+        
+        self.logger.warning("⚠️ RimWorld бібліотеки не знайдено")
+        return []
+    
+    def create_csharp_project(self, project_name: str, output_dir: str) -> str:
+        """Створення C# проєкту для RimWorld мода"""
+        project_dir = os.path.join(output_dir, project_name)
+        os.makedirs(project_dir, exist_ok=True)
+        
+        # Створення .csproj файлу
+        csproj_content = self._generate_csproj(project_name)
+        csproj_path = os.path.join(project_dir, f"{project_name}.csproj")
+        
+        with open(csproj_path, 'w', encoding='utf-8') as f:
+            f.write(csproj_content)
+        
+        # Створення базового C# файлу
+        cs_content = self._generate_base_cs(project_name)
+        cs_path = os.path.join(project_dir, f"{project_name}.cs")
+        
+        with open(cs_path, 'w', encoding='utf-8') as f:
+            f.write(cs_content)
+        
+        self.logger.info(f"✅ C# проєкт створено: {project_dir}")
+        return project_dir
+    
+    def _generate_csproj(self, project_name: str) -> str:
+        """Генерація .csproj файлу"""
+        return _render_csproj(project_name)
+    
+    def _generate_base_cs(self, project_name: str) -> str:
+        """Генерація базового C# файлу"""
+        return _render_base_cs(project_name)
     
     def compile_project(self, project_path: str, configuration: str = "Release") -> Tuple[bool, str]:
         """Компіляція C# проєкту"""
@@ -424,18 +550,23 @@ class RimWorldModTemplate:
                 "Assemblies"
             ])
         
-        for folder in folders:
-            os.makedirs(os.path.join(mod_dir, folder), exist_ok=True)
+        from concurrent.futures import ThreadPoolExecutor
         
-        # Створення About.xml
-        self._create_about_xml(mod_dir, mod_name)
-        
-        # Створення базових файлів
-        self._create_base_files(mod_dir, mod_name)
+        # Системні виклики файлової системи відпускають GIL, тож незалежні папки і файли створюються паралельно
+        with ThreadPoolExecutor(max_workers=min(8, len(folders)), thread_name_prefix="rwmb-mod") as executor:
+            list(executor.map(lambda folder: os.makedirs(os.path.join(mod_dir, folder), exist_ok=True), folders))
+            
+            # Створення About.xml і базових файлів (різні шляхи, папки вже існують)
+            file_futures = [
+                executor.submit(self._create_about_xml, mod_dir, mod_name),
+                executor.submit(self._create_base_files, mod_dir, mod_name)
+            ]
+            for future in file_futures:
+                future.result()
         
         if include_csharp:
             # Створення C# проєкту
-            dotnet_env = DotNetEnvironment()
+            dotnet_env = get_dotnet_environment()
             if dotnet_env.is_available():
                 compiler = CSharpCompiler(dotnet_env)
                 source_dir = os.path.join(mod_dir, "Source")
@@ -5,10 +5,14 @@
 """
 
 import os
+import re
 from pathlib import Path
 from jinja2 import Template
 import json
 
+# Рядок-коментар з описом шаблону разом з його переносом рядка
+_DESCRIPTION_LINE_RE = re.compile(r'^[^\S\n]*<!-- Description:.*\n?', re.M)
+
 class TemplateManager:
     """Клас для управління шаблонами дефініцій"""
     
@@ -29,6 +33,8 @@ class TemplateManager:
                 content = template_file.read_text(encoding='utf-8')
                 self.templates[template_name] = {
                     'content': content,
+                    # Вміст без рядків з описом, готовий до вставки в редактор
+                    'content_stripped': _DESCRIPTION_LINE_RE.sub('', content),
                     'path': template_file,
                     'description': self.extract_description(content)
                 }
@@ -262,6 +268,7 @@ class TemplateManager:
         
         self.templates[name] = {
             'content': content,
+            'content_stripped': _DESCRIPTION_LINE_RE.sub('', content),
             'path': template_file,
             'description': description or self.extract_description(content)
         }
@@ -14,7 +14,7 @@ from typing import Dict, List, Optional, Callable
 
 # Локальні імпорти
 try:
-    from core.dependency_manager import get_dependency_manager
+    from core.dependency_manager import manager as dependency_manager
     from utils.simple_logger import get_logger_instance
 except ImportError as e:
     print(f"Помилка імпорту: {e}")
@@ -22,13 +22,12 @@ except ImportError as e:
     class MockDependencyManager:
         def check_all_dependencies(self):
             return {"installed": [], "missing": [], "outdated": [], "optional_missing": [], "errors": []}
-        def get_installation_suggestions(self):
+        def get_installation_suggestions(self, status=None):
             return []
         def install_missing_dependencies(self, include_optional=False, progress_callback=None):
             return {"success": True, "installed": [], "failed": []}
     
-    def get_dependency_manager():
-        return MockDependencyManager()
+    dependency_manager = MockDependencyManager()
     
     def get_logger_instance():
         class Logger:
@@ -138,7 +137,7 @@ class DependencyStatusWidget(ctk.CTkFrame):
     
     def _needs_action(self) -> bool:
         """Чи потрібна кнопка дії"""
-        return "install_command" in self.dependency_info
+        return "pip_requirement" in self.dependency_info
     
     def _get_action_text(self) -> str:
         """Текст кнопки дії"""
@@ -159,7 +158,7 @@ class DependencyDialog(ctk.CTkToplevel):
     def __init__(self, parent=None):
         super().__init__(parent)
         
-        self.dependency_manager = get_dependency_manager()
+        self.dependency_manager = dependency_manager
         self.logger = get_logger_instance().get_logger()
         
         self.title("🔧 Управління залежностями - RimWorld Mod Builder")
@@ -381,7 +380,7 @@ class DependencyDialog(ctk.CTkToplevel):
     
     def _install_dependencies(self, include_optional: bool = False):
         """Встановлення залежностей"""
-        def progress_callback(progress: float, message: str):
+        def progress_callback(progress: Optional[float], message: str):
             self.after(0, lambda: self._update_progress(progress, message))
         
         def install_worker():
@@ -403,9 +402,10 @@ class DependencyDialog(ctk.CTkToplevel):
             thread = threading.Thread(target=install_worker, daemon=True)
             thread.start()
     
-    def _update_progress(self, progress: float, message: str):
-        """Оновлення прогресу"""
-        self.progress_bar.set(progress / 100.0)
+    def _update_progress(self, progress: Optional[float], message: str):
+        """Оновлення прогресу (None - лише текст поточного етапу)"""
+        if progress is not None:
+            self.progress_bar.set(progress / 100.0)
         self.progress_label.configure(text=message)
     
     def _installation_complete(self, results: Dict):
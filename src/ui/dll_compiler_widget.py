@@ -22,7 +22,7 @@ try:
 except ImportError as e:
     print(f"Помилка імпорту: {e}")
     # Fallback для тестування
-    from dataclasses import dataclass
+    from dataclasses import dataclass, field
     from typing import Optional, List
 
     @dataclass
@@ -34,14 +34,13 @@ except ImportError as e:
         copy_to_assemblies: bool = True
         include_debug_symbols: bool = False
         optimize_code: bool = True
+        skip_if_up_to_date: bool = False
+        use_build_cache: bool = False
 
     @dataclass
     class CompilationResult:
         success: bool
-        error_messages: List[str] = None
-        def __post_init__(self):
-            if self.error_messages is None:
-                self.error_messages = []
+        error_messages: List[str] = field(default_factory=list)
 
     class MockDLLCompiler:
         def compile_dll(self, path, settings):
@@ -141,10 +140,28 @@ class CompilationSettingsFrame(ctk.CTkFrame):
         self.clean_check = ctk.CTkCheckBox(
             options_frame,
             text="Очистити перед збіркою",
-            variable=self.clean_var
+            variable=self.clean_var,
+            command=self._update_incremental_options
         )
         self.clean_check.pack(anchor="w", padx=10, pady=2)
         
+        # Інкрементальна збірка: працює лише без очищення (очищення вимагає повної збірки)
+        self.skip_up_to_date_var = ctk.BooleanVar(value=True)
+        self.skip_up_to_date_check = ctk.CTkCheckBox(
+            options_frame,
+            text="Пропускати збірку, якщо нічого не змінилося",
+            variable=self.skip_up_to_date_var
+        )
+        self.skip_up_to_date_check.pack(anchor="w", padx=20, pady=2)
+        
+        self.build_cache_var = ctk.BooleanVar(value=True)
+        self.build_cache_check = ctk.CTkCheckBox(
+            options_frame,
+            text="Брати DLL з кешу збірок, якщо входи не змінилися",
+            variable=self.build_cache_var
+        )
+        self.build_cache_check.pack(anchor="w", padx=20, pady=2)
+        
         self.copy_assemblies_var = ctk.BooleanVar(value=True)
         self.copy_assemblies_check = ctk.CTkCheckBox(
             options_frame,
@@ -168,6 +185,14 @@ class CompilationSettingsFrame(ctk.CTkFrame):
             variable=self.optimize_var
         )
         self.optimize_check.pack(anchor="w", padx=10, pady=2)
+        
+        self._update_incremental_options()
+    
+    def _update_incremental_options(self):
+        """Опції інкрементальної збірки доступні лише без очищення перед збіркою"""
+        state = "disabled" if self.clean_var.get() else "normal"
+        self.skip_up_to_date_check.configure(state=state)
+        self.build_cache_check.configure(state=state)
     
     def get_settings(self) -> CompilationSettings:
         """Отримання налаштувань компіляції"""
@@ -178,7 +203,9 @@ class CompilationSettingsFrame(ctk.CTkFrame):
             clean_before_build=self.clean_var.get(),
             copy_to_assemblies=self.copy_assemblies_var.get(),
             include_debug_symbols=self.debug_symbols_var.get(),
-            optimize_code=self.optimize_var.get()
+            optimize_code=self.optimize_var.get(),
+            skip_if_up_to_date=self.skip_up_to_date_var.get(),
+            use_build_cache=self.build_cache_var.get()
         )
 
 
@@ -17,7 +17,7 @@ try:
     from ui.dependency_dialog import show_dependency_dialog
     from ui.enhanced_texture_manager import EnhancedTextureManager
     from ui.smart_xml_editor import SmartXMLEditor
-    from core.dependency_manager import get_dependency_manager
+    from core.dependency_manager import manager as dependency_manager
     from utils.simple_logger import get_logger_instance
 except ImportError as e:
     print(f"Помилка імпорту: {e}")
@@ -38,11 +38,11 @@ except ImportError as e:
             label = ctk.CTkLabel(self, text="Smart XML Editor (Заглушка)")
             label.pack(pady=20)
     
-    def get_dependency_manager():
-        class MockManager:
-            def check_all_dependencies(self):
-                return {"installed": [], "missing": [], "outdated": [], "optional_missing": [], "errors": []}
-        return MockManager()
+    class MockManager:
+        def check_all_dependencies(self):
+            return {"installed": [], "missing": [], "outdated": [], "optional_missing": [], "errors": []}
+    
+    dependency_manager = MockManager()
     
     def get_logger_instance():
         class Logger:
@@ -63,7 +63,7 @@ class V2IntegratedInterface(ctk.CTkFrame):
         
         self.project_path = project_path
         self.logger = get_logger_instance().get_logger()
-        self.dependency_manager = get_dependency_manager()
+        self.dependency_manager = dependency_manager
         
         # Компоненти
         self.texture_manager = None
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Тести check_dependencies: перевірка залежностей не імпортує самі модулі
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+
+# Важкі модулі, які check_dependencies лише шукає, але ніколи не виконує
+HEAVY_MODULES = ("PIL", "lxml", "cairosvg", "customtkinter", "tkinter")
+
+# Запуск main() в окремому інтерпретаторі: sys.modules поточного процесу вже може містити ці модулі
+_RUNNER = """
+import json, sys
+args, modules = map(json.loads, sys.argv[1:3])
+import check_dependencies
+sys.argv = ["check_dependencies.py"] + args
+check_dependencies.main()
+sys.stderr.write(json.dumps(sorted(name for name in modules if name in sys.modules)))
+"""
+
+
+def _run_main(args, home):
+    """main() з тимчасовим домашнім каталогом (кеш звітів не переходить між запусками); повертає імпортовані важкі модулі"""
+    env = dict(os.environ, HOME=str(home), USERPROFILE=str(home))
+    result = subprocess.run(
+        [sys.executable, "-c", _RUNNER, json.dumps(args), json.dumps(HEAVY_MODULES)],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        check=True
+    )
+    return json.loads(result.stderr)
+
+
+@pytest.mark.parametrize("args", [[], ["--json"]])
+def test_main_does_not_import_heavy_modules(tmp_path, args):
+    # Перший запуск виконує перевірку, другий бере звіт із кешу
+    assert _run_main(args, tmp_path) == []
+    assert _run_main(args, tmp_path) == []
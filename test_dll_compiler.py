@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Тести DLLCompiler: інкрементальна збірка з підробленим dotnet CLI
+"""
+
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+import core.dll_compiler as dll_compiler  # noqa: E402
+from core.dll_compiler import DLLCompiler, CompilationSettings  # noqa: E402
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="підроблений dotnet - shell-скрипт")
+
+# Замість dotnet build: записує DLL з унікальним вмістом і рахує запуски
+_FAKE_DOTNET = """#!/bin/sh
+echo "$@" >> "{calls}"
+mkdir -p bin/Release/net472
+date +%s%N > bin/Release/net472/Mod.dll
+"""
+
+_CSPROJ = """<Project Sdk="Microsoft.NET.Sdk">
+  <PropertyGroup>
+    <TargetFramework>net472</TargetFramework>
+  </PropertyGroup>
+</Project>
+"""
+
+
+class _FakeDotNetEnvironment:
+    """Середовище .NET з підробленим dotnet CLI"""
+
+    def __init__(self, dotnet_path):
+        self.dotnet_path = str(dotnet_path)
+        self.msbuild_path = None
+        self.sdk_versions = ["8.0.100"]
+
+    def is_available(self):
+        return True
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Проєкт Mod і компілятор, що збирає його підробленим dotnet; повертає (папка, компілятор, лічильник збірок)"""
+    calls = tmp_path / "calls.log"
+    dotnet = tmp_path / "dotnet"
+    dotnet.write_text(_FAKE_DOTNET.format(calls=calls), encoding="utf-8")
+    dotnet.chmod(0o755)
+
+    # Кеш збірок у тимчасовій папці, а не в ~/.cache
+    monkeypatch.setattr(dll_compiler, "_BUILD_CACHE_DIR", tmp_path / "build-cache")
+
+    project_dir = tmp_path / "Mod"
+    project_dir.mkdir()
+    (project_dir / "Mod.csproj").write_text(_CSPROJ, encoding="utf-8")
+    (project_dir / "ModMain.cs").write_text("class ModMain {}", encoding="utf-8")
+
+    def build_count():
+        return len(calls.read_text(encoding="utf-8").splitlines()) if calls.exists() else 0
+
+    return project_dir, DLLCompiler(_FakeDotNetEnvironment(dotnet)), build_count
+
+
+def test_skip_if_up_to_date_skips_unchanged_and_rebuilds_changed(project):
+    project_dir, compiler, build_count = project
+    settings = CompilationSettings(clean_before_build=False, copy_to_assemblies=False, skip_if_up_to_date=True)
+
+    assert compiler.compile_dll(str(project_dir), settings).success
+    assert compiler.compile_dll(str(project_dir), settings).success
+    assert build_count() == 1
+
+    # Видалений файл джерел не робить DLL старшим за решту, але змінює набір входів
+    (project_dir / "Extra.cs").write_text("class Extra {}", encoding="utf-8")
+    assert compiler.compile_dll(str(project_dir), settings).success
+    (project_dir / "Extra.cs").unlink()
+    assert compiler.compile_dll(str(project_dir), settings).success
+    assert build_count() == 3
+
+
+def test_build_cache_restores_dll_for_same_inputs(project):
+    project_dir, compiler, build_count = project
+    settings = CompilationSettings(clean_before_build=False, copy_to_assemblies=False, use_build_cache=True)
+
+    first = compiler.compile_dll(str(project_dir), settings)
+    assert first.success
+    built_dll = Path(first.dll_path).read_bytes()
+
+    # Без bin DLL може з'явитися лише з кешу
+    shutil.rmtree(project_dir / "bin")
+    second = compiler.compile_dll(str(project_dir), settings)
+    assert second.success
+    assert build_count() == 1
+    assert Path(second.dll_path).read_bytes() == built_dll
+
+    # Змінене джерело - новий ключ, тож потрібна справжня збірка
+    (project_dir / "ModMain.cs").write_text("class ModMain { int x; }", encoding="utf-8")
+    assert compiler.compile_dll(str(project_dir), settings).success
+    assert build_count() == 2
+
+
+def test_batch_reports_aggregate_progress_with_project_names(project):
+    project_dir, compiler, build_count = project
+    other_dir = project_dir.parent / "Other"
+    shutil.copytree(project_dir, other_dir)
+    events = []
+    compiler.add_compilation_callback(lambda message, progress: events.append((message, progress)))
+    settings = CompilationSettings(clean_before_build=False, copy_to_assemblies=False)
+
+    results = compiler.compile_multiple_projects([str(project_dir), str(other_dir)], settings)
+    assert all(result.success for result in results)
+    assert build_count() == 2
+
+    # Прогрес лише зростає до 100, а повідомлення окремих збірок позначені назвою проєкту
+    progress = [value for _, value in events]
+    assert progress == sorted(progress) and progress[-1] == 100
+    build_messages = [message for message, _ in events if "Скомпільовано проєктів" not in message]
+    assert build_messages and all(message.startswith(("[Mod] ", "[Other] ")) for message in build_messages)